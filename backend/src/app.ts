@@ -7,6 +7,7 @@ import morgan from 'morgan';
 import rateLimit from 'express-rate-limit';
 import { config } from '@/config/env';
 import { errorHandler, notFoundHandler } from '@/middlewares/error.middleware';
+import { jsonBody } from '@/middlewares/jsonBody.middleware';
 import { logger } from '@/utils/logger';
 
 const app: Application = express();
@@ -38,74 +39,10 @@ if (config.nodeEnv === 'production') {
   logger.info('Rate limiting desabilitado (desenvolvimento)');
 }
 
-// Body parsing customizado para não converter strings ISO para Date
-app.use((req, res, next) => {
-  if (req.is('application/json')) {
-    let data = '';
-    req.setEncoding('utf8');
-    req.on('data', chunk => {
-      data += chunk;
-    });
-    req.on('end', () => {
-      try {
-        // Parse JSON com reviver customizado
-        req.body = JSON.parse(data, (key, value) => {
-          // Detectar strings ISO de data e converter para YYYY-MM-DD
-          if (typeof value === 'string') {
-            const isoDateRegex = /^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d{3})?Z?$/;
-            if (isoDateRegex.test(value)) {
-              console.log(`🔄 [MIDDLEWARE] Convertendo data ISO para string: ${value} -> ${value.split('T')[0]}`);
-              return value.split('T')[0];
-            }
-          }
-          return value;
-        });
-        next();
-      } catch (error) {
-        res.status(400).json({ error: 'Invalid JSON' });
-      }
-    });
-  } else {
-    next();
-  }
-});
+// Body parsing com limite de tamanho; datas ISO chegam como YYYY-MM-DD
+app.use(jsonBody(config.maxJsonBodySize));
 app.use(express.urlencoded({ extended: true, limit: '10mb' }));
 
-// Middleware para converter Date objects de volta para strings
-app.use((req, _res, next) => {
-  const convertDatesToStrings = (obj: any): any => {
-    if (obj === null || obj === undefined) return obj;
-    
-    if (obj instanceof Date) {
-      // Converter Date para string YYYY-MM-DD
-      const year = obj.getFullYear();
-      const month = String(obj.getMonth() + 1).padStart(2, '0');
-      const day = String(obj.getDate()).padStart(2, '0');
-      return `${year}-${month}-${day}`;
-    }
-    
-    if (Array.isArray(obj)) {
-      return obj.map(convertDatesToStrings);
-    }
-    
-    if (typeof obj === 'object') {
-      const converted: any = {};
-      for (const key in obj) {
-        converted[key] = convertDatesToStrings(obj[key]);
-      }
-      return converted;
-    }
-    
-    return obj;
-  };
-  
-  if (req.body) {
-    req.body = convertDatesToStrings(req.body);
-  }
-  
-  next();
-});
-
 // Compression
 app.use(compression());
 
@@ -7,6 +7,14 @@ import { RefreshToken } from '@/models/RefreshToken';
 import { UserPreference } from '@/entities/UserPreference';
 import { VerificationCode } from '@/entities/VerificationCode';
 import { Notification } from '@/models/Notification';
+import { UserMonthlyTotal } from '@/models/UserMonthlyTotal';
+import { ImportRule } from '@/models/ImportRule';
+import { ScheduledJob } from '@/models/ScheduledJob';
+import { ScheduledJobRun } from '@/models/ScheduledJobRun';
+import { UserDataVersion } from '@/models/UserDataVersion';
+import { SyncTombstone } from '@/models/SyncTombstone';
+import { NotificationBroadcast } from '@/models/NotificationBroadcast';
+import { UserNotificationCounter } from '@/models/UserNotificationCounter';
 
 export const AppDataSource = new DataSource({
   type: 'postgres',
@@ -18,11 +26,12 @@ export const AppDataSource = new DataSource({
   database: process.env.DATABASE_URL ? undefined : config.db.database,
   synchronize: false, // DESABILITADO - Usar migrations
   logging: config.nodeEnv === 'development',
-  entities: [User, Category, Transaction, RefreshToken, UserPreference, VerificationCode, Notification],
+  entities: [User, Category, Transaction, RefreshToken, UserPreference, VerificationCode, Notification, UserMonthlyTotal, ImportRule, ScheduledJob, ScheduledJobRun, UserDataVersion, SyncTombstone, NotificationBroadcast, UserNotificationCounter],
   migrations: config.nodeEnv === 'production' 
     ? ['dist/database/migrations/**/*.js'] 
     : ['src/database/migrations/**/*.ts'],
   migrationsRun: false, // Migrations rodadas via script separado
+  migrationsTransactionMode: 'each', // Permite migrations sem transação (ex: CREATE INDEX CONCURRENTLY)
   subscribers: [],
   ssl: process.env.DATABASE_URL ? { rejectUnauthorized: false } : undefined,
   extra: {
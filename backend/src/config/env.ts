@@ -1,5 +1,6 @@
 import dotenv from 'dotenv';
 import path from 'path';
+import os from 'os';
 
 // Load environment variables
 dotenv.config({ path: path.join(__dirname, '../../.env') });
@@ -8,6 +9,7 @@ interface Config {
   nodeEnv: string;
   port: number;
   apiPrefix: string;
+  maxJsonBodySize: number;
   db: {
     host: string;
     port: number;
@@ -31,8 +33,39 @@ interface Config {
   upload: {
     dir: string;
     maxFileSize: number;
+    maxStatementSize: number;
     allowedTypes: string[];
   };
+  exports: {
+    workers: number;
+    ttlHours: number;
+  };
+  passwordHashing: {
+    workers: number;
+    rounds: number;
+  };
+  entitlementCache: {
+    maxEntries: number;
+    ttlSeconds: number;
+  };
+  dashboardCache: {
+    store: 'memory' | 'redis';
+    maxEntries: number;
+    ttlSeconds: number;
+    staleSeconds: number;
+  };
+  redis: {
+    url: string;
+  };
+  sync: {
+    tombstoneRetentionDays: number;
+  };
+  notifications: {
+    broadcastBatchSize: number;
+    pubsub: 'memory' | 'postgres';
+    retentionMonths: number;
+    archiveDir: string;
+  };
   logging: {
     level: string;
     dir: string;
@@ -43,6 +76,7 @@ export const config: Config = {
   nodeEnv: process.env.NODE_ENV || 'development',
   port: parseInt(process.env.PORT || '5000', 10),
   apiPrefix: process.env.API_PREFIX || '/api/v1',
+  maxJsonBodySize: parseInt(process.env.MAX_JSON_BODY_SIZE || '10485760', 10), // 10MB
   
   db: {
     host: process.env.DB_HOST || 'localhost',
@@ -71,9 +105,51 @@ export const config: Config = {
   upload: {
     dir: process.env.UPLOAD_DIR || 'uploads',
     maxFileSize: parseInt(process.env.MAX_FILE_SIZE || '5242880', 10), // 5MB
+    maxStatementSize: parseInt(process.env.MAX_STATEMENT_SIZE || '52428800', 10), // 50MB
     allowedTypes: (process.env.ALLOWED_FILE_TYPES || 'image/jpeg,image/png,image/webp').split(','),
   },
   
+  exports: {
+    workers: parseInt(process.env.EXPORT_WORKERS || '1', 10),
+    ttlHours: parseInt(process.env.EXPORT_TTL_HOURS || '24', 10),
+  },
+  
+  passwordHashing: {
+    // Padrão: núcleos - 1 (mínimo 1); 0 faz o bcrypt rodar na thread principal
+    workers: parseInt(process.env.PASSWORD_HASH_WORKERS || String(Math.max(1, os.cpus().length - 1)), 10),
+    rounds: parseInt(process.env.BCRYPT_ROUNDS || '10', 10),
+  },
+  
+  entitlementCache: {
+    maxEntries: parseInt(process.env.ENTITLEMENT_CACHE_SIZE || '10000', 10),
+    ttlSeconds: parseInt(process.env.ENTITLEMENT_CACHE_TTL_SECONDS || '300', 10),
+  },
+  
+  dashboardCache: {
+    store: process.env.DASHBOARD_CACHE_STORE === 'redis' ? 'redis' : 'memory',
+    maxEntries: parseInt(process.env.DASHBOARD_CACHE_SIZE || '5000', 10),
+    ttlSeconds: parseInt(process.env.DASHBOARD_CACHE_TTL_SECONDS || '60', 10),
+    staleSeconds: parseInt(process.env.DASHBOARD_CACHE_STALE_SECONDS || '600', 10),
+  },
+  
+  redis: {
+    url: process.env.REDIS_URL || 'redis://localhost:6379',
+  },
+  
+  sync: {
+    tombstoneRetentionDays: parseInt(process.env.SYNC_TOMBSTONE_RETENTION_DAYS || '30', 10),
+  },
+  
+  notifications: {
+    broadcastBatchSize: parseInt(process.env.NOTIFICATION_BROADCAST_BATCH_SIZE || '5000', 10),
+    // postgres: eventos do stream via LISTEN/NOTIFY (várias instâncias); memory: só nesta instância
+    pubsub: process.env.NOTIFICATION_PUBSUB === 'memory' ? 'memory' : 'postgres',
+    // Opcional: partições mensais mais antigas são exportadas e removidas; 0 = manter tudo
+    retentionMonths: parseInt(process.env.NOTIFICATION_RETENTION_MONTHS || '0', 10),
+    // Destino da exportação (armazenamento durável); sem ele nenhuma partição é removida
+    archiveDir: process.env.NOTIFICATION_ARCHIVE_DIR || '',
+  },
+  
   logging: {
     level: process.env.LOG_LEVEL || 'info',
     dir: process.env.LOG_DIR || 'logs',
@@ -1,5 +1,11 @@
 import { Request, Response, NextFunction } from 'express';
 import notificationService from '@/services/notification.service';
+import notificationBroadcastService from '@/services/notificationBroadcast.service';
+import jobScheduler from '@/services/jobScheduler.service';
+import passwordHasher from '@/services/passwordHasher.service';
+import { entitlementService } from '@/services/entitlement.service';
+import dashboardCache from '@/services/dashboardCache.service';
+import notificationStream from '@/services/notificationStream.service';
 import { AppDataSource } from '@/config/database';
 import { User } from '@/models/User';
 import { Notification } from '@/models/Notification';
@@ -38,6 +44,26 @@ export class AdminController {
     }
   }
 
+  /**
+   * Métricas em memória desta instância (filas, pools e caches)
+   * GET /api/v1/admin/metrics
+   */
+  async getMetrics(_req: Request, res: Response, next: NextFunction) {
+    try {
+      res.json({
+        success: true,
+        data: {
+          passwordHashing: passwordHasher.getStats(),
+          entitlementCache: entitlementService.getStats(),
+          dashboardCache: dashboardCache.getStats(),
+          notificationStream: notificationStream.getStats(),
+        },
+      });
+    } catch (error) {
+      next(error);
+    }
+  }
+
   /**
    * Listar todos os usuários
    * GET /api/v1/admin/users
@@ -64,58 +90,66 @@ export class AdminController {
   }
 
   /**
-   * Enviar notificação em massa
+   * Enviar notificação em massa (em segundo plano)
    * POST /api/v1/admin/broadcast-notification
    * Body: { title, message, type, category, onlyPremium }
    */
   async broadcastNotification(req: Request, res: Response, next: NextFunction) {
     try {
-      const { title, message, type = 'info', category = 'system', onlyPremium = false } = req.body;
+      const { title, message, type, category, onlyPremium } = req.body;
 
-      if (!title || !message) {
-        return res.status(400).json({
-          success: false,
-          message: 'Título e mensagem são obrigatórios',
-        });
-      }
-
-      // Buscar usuários
-      const userRepository = AppDataSource.getRepository(User);
-      const query = userRepository.createQueryBuilder('user');
+      const broadcast = await notificationBroadcastService.enqueue({
+        title,
+        message,
+        type,
+        category,
+        onlyPremium,
+        createdBy: req.user!.userId,
+      });
 
-      if (onlyPremium) {
-        query.where('user.isPremium = :isPremium', { isPremium: true });
-      }
+      res.status(202).json({
+        success: true,
+        message: `Envio para ${broadcast.totalRecipients} usuário(s) iniciado`,
+        data: {
+          broadcastId: broadcast.id,
+          status: broadcast.status,
+          count: broadcast.totalRecipients,
+          onlyPremium: broadcast.onlyPremium,
+        },
+      });
+    } catch (error) {
+      next(error);
+    }
+  }
 
-      const users = await query.getMany();
+  /**
+   * Listar os envios em massa mais recentes
+   * GET /api/v1/admin/broadcasts
+   */
+  async getBroadcasts(_req: Request, res: Response, next: NextFunction) {
+    try {
+      const broadcasts = await notificationBroadcastService.findRecent();
 
-      if (users.length === 0) {
-        return res.status(404).json({
-          success: false,
-          message: 'Nenhum usuário encontrado',
-        });
-      }
+      res.json({
+        success: true,
+        data: broadcasts,
+      });
+    } catch (error) {
+      next(error);
+    }
+  }
 
-      // Criar notificações para todos os usuários
-      const notifications: any[] = [];
-      for (const user of users) {
-        const notification = await notificationService.create(
-          user.id,
-          title,
-          message,
-          type,
-          category
-        );
-        notifications.push(notification);
-      }
+  /**
+   * Progresso de um envio em massa
+   * GET /api/v1/admin/broadcasts/:id
+   */
+  async getBroadcast(req: Request, res: Response, next: NextFunction) {
+    try {
+      const broadcast = await notificationBroadcastService.findById(req.params.id);
 
       res.json({
         success: true,
-        message: `Notificação enviada para ${users.length} usuário(s)`,
-        data: {
-          count: users.length,
-          onlyPremium,
-        },
+        data: broadcast,
       });
     } catch (error) {
       next(error);
@@ -156,6 +190,59 @@ export class AdminController {
       next(error);
     }
   }
+
+  /**
+   * Listar jobs agendados com lease e status da última execução
+   * GET /api/v1/admin/jobs
+   */
+  async getJobs(_req: Request, res: Response, next: NextFunction) {
+    try {
+      const jobs = await jobScheduler.findAll();
+
+      res.json({
+        success: true,
+        data: jobs,
+      });
+    } catch (error) {
+      next(error);
+    }
+  }
+
+  /**
+   * Histórico de execuções de um job
+   * GET /api/v1/admin/jobs/:name/runs
+   */
+  async getJobRuns(req: Request, res: Response, next: NextFunction) {
+    try {
+      const limit = Math.min(Number(req.query.limit) || 20, 100);
+      const runs = await jobScheduler.findRuns(req.params.name, limit);
+
+      res.json({
+        success: true,
+        data: runs,
+      });
+    } catch (error) {
+      next(error);
+    }
+  }
+
+  /**
+   * Disparar um job manualmente
+   * POST /api/v1/admin/jobs/:name/run
+   */
+  async triggerJob(req: Request, res: Response, next: NextFunction) {
+    try {
+      const job = await jobScheduler.trigger(req.params.name);
+
+      res.status(202).json({
+        success: true,
+        message: 'Execução do job solicitada',
+        data: job,
+      });
+    } catch (error) {
+      next(error);
+    }
+  }
 }
 
 export default new AdminController();
@@ -1,6 +1,9 @@
 import { Request, Response, NextFunction } from 'express';
 import { CategoryService } from '@/services/category.service';
 import { sendSuccess, sendCreated } from '@/utils/response';
+import { serializers } from '@/utils/serializers';
+import dataVersionService from '@/services/dataVersion.service';
+import { weakETag, sendNotModified } from '@/utils/etag';
 
 const categoryService = new CategoryService();
 
@@ -9,7 +12,7 @@ export const create = async (req: Request, res: Response, next: NextFunction) =>
     const userId = req.user!.userId;
     const { name, type, color, icon } = req.body;
     const category = await categoryService.create(userId, { name, type, color, icon });
-    sendCreated(res, category, 'Categoria criada com sucesso');
+    sendCreated(res, category, 'Categoria criada com sucesso', serializers.category);
   } catch (error) {
     next(error);
   }
@@ -19,8 +22,15 @@ export const findAll = async (req: Request, res: Response, next: NextFunction) =
   try {
     const userId = req.user!.userId;
     const { type } = req.query;
+
+    const { categories: version } = await dataVersionService.get(userId);
+    const etag = weakETag('categories', type as string, version);
+    if (sendNotModified(req, res, etag)) {
+      return;
+    }
+
     const categories = await categoryService.findAll(userId, type as any);
-    sendSuccess(res, categories, 'Categorias obtidas com sucesso');
+    sendSuccess(res, categories, 'Categorias obtidas com sucesso', 200, undefined, serializers.categoryList);
   } catch (error) {
     next(error);
   }
@@ -31,7 +41,7 @@ export const findById = async (req: Request, res: Response, next: NextFunction)
     const userId = req.user!.userId;
     const { id } = req.params;
     const category = await categoryService.findById(id, userId);
-    sendSuccess(res, category, 'Categoria obtida com sucesso');
+    sendSuccess(res, category, 'Categoria obtida com sucesso', 200, undefined, serializers.category);
   } catch (error) {
     next(error);
   }
@@ -43,7 +53,7 @@ export const update = async (req: Request, res: Response, next: NextFunction) =>
     const { id } = req.params;
     const data = req.body;
     const category = await categoryService.update(id, userId, data);
-    sendSuccess(res, category, 'Categoria atualizada com sucesso');
+    sendSuccess(res, category, 'Categoria atualizada com sucesso', 200, undefined, serializers.category);
   } catch (error) {
     next(error);
   }
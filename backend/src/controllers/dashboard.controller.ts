@@ -1,6 +1,8 @@
 import { Request, Response, NextFunction } from 'express';
 import { TransactionService } from '@/services/transaction.service';
 import { sendSuccess } from '@/utils/response';
+import { serializers } from '@/utils/serializers';
+import { weakETag, sendNotModified } from '@/utils/etag';
 
 const transactionService = new TransactionService();
 
@@ -9,13 +11,18 @@ export const getDashboard = async (req: Request, res: Response, next: NextFuncti
     const userId = req.user!.userId;
     const { month, year } = req.query;
     
-    const data = await transactionService.getDashboardData(
+    const dashboard = await transactionService.getDashboard(
       userId,
       month ? Number(month) : undefined,
       year ? Number(year) : undefined
     );
+
+    const etag = weakETag('dashboard', dashboard.year, dashboard.month, dashboard.version);
+    if (sendNotModified(req, res, etag)) {
+      return;
+    }
     
-    sendSuccess(res, data, 'Dashboard obtido com sucesso');
+    sendSuccess(res, dashboard.data, 'Dashboard obtido com sucesso', 200, undefined, serializers.dashboard);
   } catch (error) {
     next(error);
   }
@@ -0,0 +1,64 @@
+import { Request, Response, NextFunction } from 'express';
+import exportService, { ExportFilters } from '@/services/export.service';
+import exportJobService from '@/services/exportJob.service';
+import { sendSuccess } from '@/utils/response';
+import { logger } from '@/utils/logger';
+
+export const exportTransactions = async (req: Request, res: Response, next: NextFunction) => {
+  const userId = req.user!.userId;
+  const filters = req.query as unknown as ExportFilters;
+
+  res.setHeader('Content-Type', exportService.getContentType(filters.format));
+  res.setHeader('Content-Disposition', `attachment; filename="${exportService.getFileName(filters.format)}"`);
+  res.setHeader('Cache-Control', 'no-store');
+
+  try {
+    await exportService.export(userId, filters, res);
+  } catch (error) {
+    if (!res.headersSent) {
+      res.removeHeader('Content-Disposition');
+      next(error);
+      return;
+    }
+
+    // Resposta já em andamento: só resta interromper a conexão
+    logger.error('❌ Export interrupted:', error);
+    res.destroy(error as Error);
+  }
+};
+
+export const createExportJob = async (req: Request, res: Response, next: NextFunction) => {
+  try {
+    const userId = req.user!.userId;
+    const job = exportJobService.enqueue(userId, req.body);
+    sendSuccess(res, job, 'Exportação iniciada', 202);
+  } catch (error) {
+    next(error);
+  }
+};
+
+export const getExportJob = async (req: Request, res: Response, next: NextFunction) => {
+  try {
+    const userId = req.user!.userId;
+    const job = exportJobService.getJob(req.params.id, userId);
+    sendSuccess(res, job, 'Status da exportação obtido com sucesso');
+  } catch (error) {
+    next(error);
+  }
+};
+
+export const downloadExportJob = async (req: Request, res: Response, next: NextFunction) => {
+  try {
+    const userId = req.user!.userId;
+    const { job, filePath } = exportJobService.getArtifact(req.params.id, userId);
+
+    // res.download atende Range/If-Range (downloads retomáveis)
+    res.download(filePath, job.fileName, { acceptRanges: true, cacheControl: false }, (error) => {
+      if (error && !res.headersSent) {
+        next(error);
+      }
+    });
+  } catch (error) {
+    next(error);
+  }
+};
@@ -0,0 +1,59 @@
+import { Request, Response, NextFunction } from 'express';
+import transactionImportService from '@/services/transactionImport.service';
+import { sendSuccess, sendCreated } from '@/utils/response';
+import { BadRequestError } from '@/utils/errors';
+
+export const importStatement = async (req: Request, res: Response, next: NextFunction) => {
+  try {
+    const userId = req.user!.userId;
+
+    if (!req.file) {
+      throw new BadRequestError('Nenhum arquivo enviado');
+    }
+
+    const job = transactionImportService.enqueue(userId, req.file, req.body);
+    sendSuccess(res, job, 'Importação iniciada', 202);
+  } catch (error) {
+    next(error);
+  }
+};
+
+export const getImportJob = async (req: Request, res: Response, next: NextFunction) => {
+  try {
+    const userId = req.user!.userId;
+    const job = transactionImportService.getJob(req.params.jobId, userId);
+    sendSuccess(res, job, 'Status da importação obtido com sucesso');
+  } catch (error) {
+    next(error);
+  }
+};
+
+export const findRules = async (req: Request, res: Response, next: NextFunction) => {
+  try {
+    const userId = req.user!.userId;
+    const rules = await transactionImportService.findRules(userId);
+    sendSuccess(res, rules, 'Regras de importação obtidas com sucesso');
+  } catch (error) {
+    next(error);
+  }
+};
+
+export const createRule = async (req: Request, res: Response, next: NextFunction) => {
+  try {
+    const userId = req.user!.userId;
+    const rule = await transactionImportService.createRule(userId, req.body);
+    sendCreated(res, rule, 'Regra de importação criada com sucesso');
+  } catch (error) {
+    next(error);
+  }
+};
+
+export const removeRule = async (req: Request, res: Response, next: NextFunction) => {
+  try {
+    const userId = req.user!.userId;
+    await transactionImportService.deleteRule(req.params.id, userId);
+    sendSuccess(res, null, 'Regra de importação removida com sucesso');
+  } catch (error) {
+    next(error);
+  }
+};
@@ -1,5 +1,12 @@
 import { Request, Response, NextFunction } from 'express';
 import notificationService from '@/services/notification.service';
+import notificationStream from '@/services/notificationStream.service';
+import { sendSuccess } from '@/utils/response';
+import { serializers } from '@/utils/serializers';
+import { logger } from '@/utils/logger';
+
+// Comentário periódico para manter a conexão aberta em proxies
+const STREAM_HEARTBEAT_MS = 25 * 1000;
 
 export class NotificationController {
   /**
@@ -18,13 +25,7 @@ export class NotificationController {
 
       const unreadCount = await notificationService.countUnread(userId);
 
-      res.json({
-        success: true,
-        data: {
-          notifications,
-          unreadCount,
-        },
-      });
+      sendSuccess(res, { notifications, unreadCount }, undefined, 200, undefined, serializers.notificationList);
     } catch (error) {
       next(error);
     }
@@ -47,6 +48,57 @@ export class NotificationController {
     }
   }
 
+  /**
+   * Stream SSE: contador inicial (event: unread) seguido dos eventos
+   * (event: notification) com o delta do contador de não lidas
+   */
+  async stream(req: Request, res: Response, next: NextFunction) {
+    const userId = req.user!.userId;
+    let ready = false;
+
+    const send = (event: string, data: unknown) => {
+      res.write(`event: ${event}\ndata: ${JSON.stringify(data)}\n\n`);
+    };
+    const sendSnapshot = async () => {
+      send('unread', { count: await notificationService.countUnread(userId) });
+    };
+
+    try {
+      // no-transform: a compressão não bufferiza o stream
+      res.writeHead(200, {
+        'Content-Type': 'text/event-stream',
+        'Cache-Control': 'no-cache, no-transform',
+        Connection: 'keep-alive',
+        'X-Accel-Buffering': 'no',
+      });
+      res.write('retry: 5000\n\n');
+
+      const unsubscribe = notificationStream.subscribe(userId, {
+        // Eventos anteriores ao contador inicial já estão incluídos nele
+        onEvent: (event) => ready && send('notification', event),
+        onResync: () => {
+          sendSnapshot().catch((error) => logger.warn('⚠️  Failed to resync notification stream:', error));
+        },
+        close: () => res.end(),
+      });
+
+      const heartbeat = setInterval(() => res.write(': ping\n\n'), STREAM_HEARTBEAT_MS);
+      req.on('close', () => {
+        clearInterval(heartbeat);
+        unsubscribe();
+      });
+
+      await sendSnapshot();
+      ready = true;
+    } catch (error) {
+      if (!res.headersSent) {
+        return next(error);
+      }
+      logger.error('❌ Notification stream failed:', error);
+      res.end();
+    }
+  }
+
   /**
    * Marcar notificação como lida
    */
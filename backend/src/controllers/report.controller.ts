@@ -0,0 +1,13 @@
+import { Request, Response, NextFunction } from 'express';
+import reportService, { ChartOptions } from '@/services/report.service';
+import { sendSuccess } from '@/utils/response';
+
+export const getChart = async (req: Request, res: Response, next: NextFunction) => {
+  try {
+    const userId = req.user!.userId;
+    const data = await reportService.getChartData(userId, req.query as unknown as ChartOptions);
+    sendSuccess(res, data, 'Dados do relatório obtidos com sucesso');
+  } catch (error) {
+    next(error);
+  }
+};
@@ -1,6 +1,9 @@
 import { Request, Response, NextFunction } from 'express';
 import savingsGoalService from '../services/savingsGoal.service';
+import dataVersionService from '../services/dataVersion.service';
 import { sendSuccess } from '../utils/response';
+import { serializers } from '../utils/serializers';
+import { weakETag, sendNotModified } from '../utils/etag';
 
 export class SavingsGoalController {
   /**
@@ -24,7 +27,7 @@ export class SavingsGoalController {
       // Buscar meta atualizada
       const updatedGoal = await savingsGoalService.getGoalByMonthYear(userId, month, year);
 
-      return sendSuccess(res, updatedGoal, 'Meta criada/atualizada com sucesso');
+      return sendSuccess(res, updatedGoal, 'Meta criada/atualizada com sucesso', 200, undefined, serializers.savingsGoal);
     } catch (error) {
       next(error);
     }
@@ -43,7 +46,10 @@ export class SavingsGoalController {
         // Atualizar valor atual antes de retornar
         await savingsGoalService.updateCurrentAmount(userId, goal.month, goal.year);
         const updatedGoal = await savingsGoalService.getGoalByMonthYear(userId, goal.month, goal.year);
-        return sendSuccess(res, updatedGoal);
+        if (updatedGoal && sendNotModified(req, res, weakETag('goal', updatedGoal.id, updatedGoal.updatedAt))) {
+          return;
+        }
+        return sendSuccess(res, updatedGoal, undefined, 200, undefined, serializers.savingsGoal);
       } else {
         return res.status(404).json({ message: 'Nenhuma meta definida para o mês atual' });
       }
@@ -66,7 +72,10 @@ export class SavingsGoalController {
         // Atualizar valor atual antes de retornar
         await savingsGoalService.updateCurrentAmount(userId, parseInt(month), parseInt(year));
         const updatedGoal = await savingsGoalService.getGoalByMonthYear(userId, parseInt(month), parseInt(year));
-        return sendSuccess(res, updatedGoal);
+        if (updatedGoal && sendNotModified(req, res, weakETag('goal', updatedGoal.id, updatedGoal.updatedAt))) {
+          return;
+        }
+        return sendSuccess(res, updatedGoal, undefined, 200, undefined, serializers.savingsGoal);
       } else {
         return res.status(404).json({ message: 'Meta não encontrada' });
       }
@@ -82,9 +91,15 @@ export class SavingsGoalController {
     try {
       const userId = req.user!.userId;
 
+      const { goals: version } = await dataVersionService.get(userId);
+      const etag = weakETag('goals', version);
+      if (sendNotModified(req, res, etag)) {
+        return;
+      }
+
       const goals = await savingsGoalService.getAllGoals(userId);
 
-      return sendSuccess(res, goals);
+      return sendSuccess(res, goals, undefined, 200, undefined, serializers.savingsGoalList);
     } catch (error) {
       next(error);
     }
@@ -1,5 +1,6 @@
 import { Request, Response } from 'express';
 import { subscriptionService } from '../services/subscription.service';
+import { weakETag, sendNotModified } from '../utils/etag';
 
 export class SubscriptionController {
   /**
@@ -20,6 +21,12 @@ export class SubscriptionController {
 
       const status = await subscriptionService.getSubscriptionStatus(userId);
 
+      // Status vem do cache de planos; o ETag deriva dos campos do plano
+      const etag = weakETag('subscription', status.planType, status.isActive ? 1 : 0, status.planStartDate, status.planEndDate, status.daysRemaining);
+      if (sendNotModified(req, res, etag)) {
+        return;
+      }
+
       res.json({
         success: true,
         data: status,
@@ -168,6 +175,12 @@ export class SubscriptionController {
 
       const status = await subscriptionService.getSubscriptionStatus(userId);
 
+      // Status vem do cache de planos; o ETag deriva dos campos do plano
+      const etag = weakETag('features', status.planType, status.isActive ? 1 : 0, status.planStartDate, status.planEndDate, status.daysRemaining);
+      if (sendNotModified(req, res, etag)) {
+        return;
+      }
+
       res.json({
         success: true,
         data: {
@@ -0,0 +1,35 @@
+import { Request, Response, NextFunction } from 'express';
+import dataVersionService from '@/services/dataVersion.service';
+import syncService from '@/services/sync.service';
+import { sendSuccess } from '@/utils/response';
+import { weakETag, sendNotModified } from '@/utils/etag';
+import { serializers } from '@/utils/serializers';
+
+export const getVersion = async (req: Request, res: Response, next: NextFunction) => {
+  try {
+    const userId = req.user!.userId;
+    const versions = await dataVersionService.get(userId);
+
+    const etag = weakETag('sync', versions.transactions, versions.categories, versions.goals, versions.preferences);
+    if (sendNotModified(req, res, etag)) {
+      return;
+    }
+
+    sendSuccess(res, versions, 'Versões obtidas com sucesso');
+  } catch (error) {
+    next(error);
+  }
+};
+
+export const getChanges = async (req: Request, res: Response, next: NextFunction) => {
+  try {
+    const userId = req.user!.userId;
+    const { since } = req.query;
+
+    const changes = await syncService.getChanges(userId, since as string | undefined);
+
+    sendSuccess(res, changes, 'Alterações obtidas com sucesso', 200, undefined, serializers.syncChanges);
+  } catch (error) {
+    next(error);
+  }
+};
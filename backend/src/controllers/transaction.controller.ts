@@ -1,7 +1,9 @@
 import { Request, Response, NextFunction } from 'express';
 import { TransactionService } from '@/services/transaction.service';
 import recurrenceService from '@/services/recurrence.service';
-import { sendSuccess, sendCreated, sendPaginated } from '@/utils/response';
+import { sendSuccess, sendCreated, sendPaginated, sendCursorPaginated } from '@/utils/response';
+import { ValidationError } from '@/utils/errors';
+import { serializers } from '@/utils/serializers';
 
 const transactionService = new TransactionService();
 
@@ -24,7 +26,22 @@ export const create = async (req: Request, res: Response, next: NextFunction) =>
       transaction = await transactionService.create(userId, transactionData);
     }
 
-    sendCreated(res, transaction, 'Transação criada com sucesso');
+    sendCreated(res, transaction, 'Transação criada com sucesso', serializers.transaction);
+  } catch (error) {
+    next(error);
+  }
+};
+
+export const createBulk = async (req: Request, res: Response, next: NextFunction) => {
+  try {
+    const userId = req.user!.userId;
+    const result = await transactionService.createBulk(userId, req.body.transactions);
+
+    if (result.created === 0) {
+      throw new ValidationError('Nenhuma transação válida no lote', result.results);
+    }
+
+    sendCreated(res, result, `${result.created} transação(ões) criada(s) com sucesso`);
   } catch (error) {
     next(error);
   }
@@ -34,15 +51,34 @@ export const findAll = async (req: Request, res: Response, next: NextFunction) =
   try {
     const userId = req.user!.userId;
     const filters = req.query;
+
+    // Modo cursor (keyset) quando o parâmetro cursor é enviado
+    if (filters.cursor !== undefined) {
+      const result = await transactionService.findAllByCursor(userId, filters);
+
+      sendCursorPaginated(
+        res,
+        result.transactions,
+        result.limit,
+        result.nextCursor,
+        result.hasMore,
+        result.total,
+        'Transações obtidas com sucesso',
+        serializers.transactionList
+      );
+      return;
+    }
+
     const result = await transactionService.findAll(userId, filters);
     
     sendPaginated(
       res,
       result.transactions,
-      result.total,
       result.page,
       result.limit,
-      'Transações obtidas com sucesso'
+      result.total,
+      'Transações obtidas com sucesso',
+      serializers.transactionList
     );
   } catch (error) {
     next(error);
@@ -54,7 +90,7 @@ export const findById = async (req: Request, res: Response, next: NextFunction)
     const userId = req.user!.userId;
     const { id } = req.params;
     const transaction = await transactionService.findById(id, userId);
-    sendSuccess(res, transaction, 'Transação obtida com sucesso');
+    sendSuccess(res, transaction, 'Transação obtida com sucesso', 200, undefined, serializers.transaction);
   } catch (error) {
     next(error);
   }
@@ -66,7 +102,7 @@ export const update = async (req: Request, res: Response, next: NextFunction) =>
     const { id } = req.params;
     const data = req.body;
     const transaction = await transactionService.update(id, userId, data);
-    sendSuccess(res, transaction, 'Transação atualizada com sucesso');
+    sendSuccess(res, transaction, 'Transação atualizada com sucesso', 200, undefined, serializers.transaction);
   } catch (error) {
     next(error);
   }
@@ -88,7 +124,7 @@ export const cancelRecurrence = async (req: Request, res: Response, next: NextFu
   try {
     const { id } = req.params;
     const transaction = await recurrenceService.cancelRecurrence(id);
-    sendSuccess(res, transaction, 'Recorrência cancelada com sucesso');
+    sendSuccess(res, transaction, 'Recorrência cancelada com sucesso', 200, undefined, serializers.transaction);
   } catch (error) {
     next(error);
   }
@@ -99,7 +135,7 @@ export const getGeneratedTransactions = async (req: Request, res: Response, next
   try {
     const { id } = req.params;
     const transactions = await recurrenceService.getGeneratedTransactions(id);
-    sendSuccess(res, transactions, 'Transações geradas obtidas com sucesso');
+    sendSuccess(res, transactions, 'Transações geradas obtidas com sucesso', 200, undefined, serializers.transactionList);
   } catch (error) {
     next(error);
   }
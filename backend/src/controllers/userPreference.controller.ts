@@ -1,6 +1,8 @@
 import { Request, Response, NextFunction } from 'express';
 import { UserPreferenceService } from '../services/userPreference.service';
 import { sendSuccess } from '../utils/response';
+import dataVersionService from '../services/dataVersion.service';
+import { weakETag, sendNotModified } from '../utils/etag';
 
 const service = new UserPreferenceService();
 
@@ -14,6 +16,13 @@ export const getPreferences = async (
 ) => {
   try {
     const userId = req.user!.userId;
+
+    const { preferences: version } = await dataVersionService.get(userId);
+    const etag = weakETag('preferences', version);
+    if (sendNotModified(req, res, etag)) {
+      return;
+    }
+
     const preferences = await service.getAll(userId);
     sendSuccess(res, preferences, 'Preferências obtidas com sucesso');
   } catch (error) {
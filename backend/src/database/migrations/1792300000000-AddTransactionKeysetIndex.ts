@@ -0,0 +1,22 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+export class AddTransactionKeysetIndex1792300000000 implements MigrationInterface {
+    name = 'AddTransactionKeysetIndex1792300000000'
+
+    // CREATE INDEX CONCURRENTLY não pode rodar dentro de uma transação
+    transaction = false;
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        // Índice que atende a paginação por cursor (userId, date, createdAt, id)
+        await queryRunner.query(`
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_transactions_user_keyset"
+            ON "transactions" ("userId", "date" DESC, "createdAt" DESC, "id" DESC)
+        `);
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`
+            DROP INDEX CONCURRENTLY IF EXISTS "idx_transactions_user_keyset"
+        `);
+    }
+}
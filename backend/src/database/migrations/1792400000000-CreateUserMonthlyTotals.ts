@@ -0,0 +1,43 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+export class CreateUserMonthlyTotals1792400000000 implements MigrationInterface {
+    name = 'CreateUserMonthlyTotals1792400000000'
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        // 1. Criar a tabela de totais mensais
+        await queryRunner.query(`
+            CREATE TABLE IF NOT EXISTS "user_monthly_totals" (
+                "userId" uuid NOT NULL,
+                "year" smallint NOT NULL,
+                "month" smallint NOT NULL,
+                "categoryId" uuid NOT NULL,
+                "type" character varying(10) NOT NULL,
+                "total" numeric(14,2) NOT NULL DEFAULT 0,
+                "count" integer NOT NULL DEFAULT 0,
+                "updatedAt" TIMESTAMP NOT NULL DEFAULT now(),
+                CONSTRAINT "PK_user_monthly_totals" PRIMARY KEY ("userId", "year", "month", "categoryId", "type"),
+                CONSTRAINT "FK_user_monthly_totals_user" FOREIGN KEY ("userId") REFERENCES "users"("id") ON DELETE CASCADE,
+                CONSTRAINT "FK_user_monthly_totals_category" FOREIGN KEY ("categoryId") REFERENCES "categories"("id") ON DELETE CASCADE
+            )
+        `);
+
+        // 2. Popular a partir das transações existentes
+        await queryRunner.query(`
+            INSERT INTO "user_monthly_totals" ("userId", "year", "month", "categoryId", "type", "total", "count")
+            SELECT "userId",
+                   EXTRACT(YEAR FROM "date"::date)::smallint,
+                   EXTRACT(MONTH FROM "date"::date)::smallint,
+                   "categoryId",
+                   "type"::text,
+                   SUM("amount"),
+                   COUNT(*)
+            FROM "transactions"
+            GROUP BY 1, 2, 3, 4, 5
+            ON CONFLICT DO NOTHING
+        `);
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`DROP TABLE IF EXISTS "user_monthly_totals"`);
+    }
+}
@@ -0,0 +1,150 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+/**
+ * Converte transactions.date de varchar(10) para DATE sem reescrever a tabela
+ * sob lock exclusivo: coluna nova + trigger de sincronização + backfill em lotes
+ * + índices CONCURRENTLY, e só então a troca rápida de colunas.
+ */
+export class ConvertTransactionDateToDate1792500000000 implements MigrationInterface {
+    name = 'ConvertTransactionDateToDate1792500000000'
+
+    // Backfill em lotes e CREATE INDEX CONCURRENTLY precisam rodar fora de transação
+    transaction = false;
+
+    private readonly batchSize = 5000;
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        // 1. Coluna nova (nullable, sem default: operação apenas de catálogo)
+        await queryRunner.query(`
+            ALTER TABLE "transactions"
+            ADD COLUMN IF NOT EXISTS "date_new" date
+        `);
+
+        // 2. Trigger mantém a coluna nova sincronizada durante o backfill
+        await queryRunner.query(`
+            CREATE OR REPLACE FUNCTION transactions_sync_date_new()
+            RETURNS TRIGGER AS $$
+            BEGIN
+                NEW."date_new" := NEW."date"::date;
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql;
+        `);
+
+        await queryRunner.query(`
+            DROP TRIGGER IF EXISTS trigger_transactions_sync_date_new ON "transactions"
+        `);
+
+        await queryRunner.query(`
+            CREATE TRIGGER trigger_transactions_sync_date_new
+            BEFORE INSERT OR UPDATE OF "date" ON "transactions"
+            FOR EACH ROW
+            EXECUTE FUNCTION transactions_sync_date_new();
+        `);
+
+        // 3. Backfill em lotes curtos (cada lote é uma transação própria),
+        // percorrendo a chave primária para não revarrer as linhas já preenchidas
+        let lastId = '00000000-0000-0000-0000-000000000000';
+        for (;;) {
+            const [batch] = await queryRunner.query(`
+                WITH batch AS (
+                    SELECT "id" FROM "transactions"
+                    WHERE "id" > $1
+                    ORDER BY "id"
+                    LIMIT ${this.batchSize}
+                ), updated AS (
+                    UPDATE "transactions" t
+                    SET "date_new" = t."date"::date
+                    FROM batch
+                    WHERE t."id" = batch."id" AND t."date_new" IS NULL
+                )
+                SELECT (SELECT "id" FROM batch ORDER BY "id" DESC LIMIT 1) AS "lastId"
+            `, [lastId]);
+
+            if (!batch.lastId) {
+                break;
+            }
+            lastId = batch.lastId;
+        }
+
+        // 4. NOT NULL via CHECK validado (não bloqueia escritas durante a verificação);
+        // removido antes para a migration poder ser reexecutada após falha parcial
+        await queryRunner.query(`
+            ALTER TABLE "transactions"
+            DROP CONSTRAINT IF EXISTS "chk_transactions_date_new_not_null"
+        `);
+
+        await queryRunner.query(`
+            ALTER TABLE "transactions"
+            ADD CONSTRAINT "chk_transactions_date_new_not_null"
+            CHECK ("date_new" IS NOT NULL) NOT VALID
+        `);
+
+        await queryRunner.query(`
+            ALTER TABLE "transactions"
+            VALIDATE CONSTRAINT "chk_transactions_date_new_not_null"
+        `);
+
+        // 5. Índices por intervalo de data, criados sem bloquear escritas
+        await queryRunner.query(`
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_transactions_user_date_new"
+            ON "transactions" ("userId", "date_new" DESC)
+        `);
+
+        await queryRunner.query(`
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_transactions_user_type_date_new"
+            ON "transactions" ("userId", "type", "date_new")
+        `);
+
+        await queryRunner.query(`
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_transactions_user_keyset_new"
+            ON "transactions" ("userId", "date_new" DESC, "createdAt" DESC, "id" DESC)
+        `);
+
+        // 6. Troca das colunas em uma transação curta
+        await queryRunner.startTransaction();
+        try {
+            await queryRunner.query(`LOCK TABLE "transactions" IN ACCESS EXCLUSIVE MODE`);
+            await queryRunner.query(`DROP TRIGGER IF EXISTS trigger_transactions_sync_date_new ON "transactions"`);
+            await queryRunner.query(`DROP FUNCTION IF EXISTS transactions_sync_date_new()`);
+
+            // Remove também o índice keyset antigo, que dependia da coluna varchar
+            await queryRunner.query(`ALTER TABLE "transactions" DROP COLUMN "date"`);
+            await queryRunner.query(`ALTER TABLE "transactions" RENAME COLUMN "date_new" TO "date"`);
+
+            // Usa o CHECK já validado, sem varrer a tabela novamente
+            await queryRunner.query(`ALTER TABLE "transactions" ALTER COLUMN "date" SET NOT NULL`);
+            await queryRunner.query(`ALTER TABLE "transactions" DROP CONSTRAINT "chk_transactions_date_new_not_null"`);
+
+            await queryRunner.query(`ALTER INDEX "idx_transactions_user_date_new" RENAME TO "idx_transactions_user_date"`);
+            await queryRunner.query(`ALTER INDEX "idx_transactions_user_type_date_new" RENAME TO "idx_transactions_user_type_date"`);
+            await queryRunner.query(`ALTER INDEX "idx_transactions_user_keyset_new" RENAME TO "idx_transactions_user_keyset"`);
+
+            await queryRunner.query(`COMMENT ON COLUMN "transactions"."date" IS 'Data da transação'`);
+            await queryRunner.commitTransaction();
+        } catch (error) {
+            await queryRunner.rollbackTransaction();
+            throw error;
+        }
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`DROP INDEX CONCURRENTLY IF EXISTS "idx_transactions_user_type_date"`);
+        await queryRunner.query(`DROP INDEX CONCURRENTLY IF EXISTS "idx_transactions_user_date"`);
+        await queryRunner.query(`DROP INDEX CONCURRENTLY IF EXISTS "idx_transactions_user_keyset"`);
+
+        // Reverter: converter DATE de volta para VARCHAR (reescreve a tabela)
+        await queryRunner.query(`
+            ALTER TABLE "transactions"
+            ALTER COLUMN "date" TYPE character varying(10) USING TO_CHAR("date", 'YYYY-MM-DD')
+        `);
+
+        await queryRunner.query(`COMMENT ON COLUMN "transactions"."date" IS 'Data no formato YYYY-MM-DD'`);
+
+        // Índice keyset sobre a coluna varchar, como em AddTransactionKeysetIndex1792300000000
+        await queryRunner.query(`
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_transactions_user_keyset"
+            ON "transactions" ("userId", "date" DESC, "createdAt" DESC, "id" DESC)
+        `);
+    }
+}
@@ -0,0 +1,44 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+/**
+ * Índices compostos para as consultas quentes de transactions, notifications
+ * e categories. Todos criados com CONCURRENTLY para não bloquear escritas.
+ * Os índices (userId, date), (userId, type, date) e keyset vêm de migrations anteriores.
+ */
+export class AddHotQueryIndexes1792600000000 implements MigrationInterface {
+    name = 'AddHotQueryIndexes1792600000000'
+
+    transaction = false;
+
+    private readonly indexes: Record<string, string> = {
+        // Filtro por categoria com intervalo de datas
+        idx_transactions_user_category_date:
+            `ON "transactions" ("userId", "categoryId", "date")`,
+        // Busca de recorrências vencidas pelo job
+        idx_transactions_recurring_due:
+            `ON "transactions" ("nextOccurrence") WHERE "isRecurring" = true`,
+        // Transações geradas a partir de uma recorrente
+        idx_transactions_parent:
+            `ON "transactions" ("parentTransactionId") WHERE "parentTransactionId" IS NOT NULL`,
+        // Listagem de notificações (todas e apenas não lidas) e contagem de não lidas
+        idx_notifications_user_created:
+            `ON "notifications" ("userId", "createdAt" DESC)`,
+        idx_notifications_user_read_created:
+            `ON "notifications" ("userId", "isRead", "createdAt" DESC)`,
+        // Listagem de categorias ordenada por nome
+        idx_categories_user_name:
+            `ON "categories" ("userId", "name")`,
+    };
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        for (const [name, definition] of Object.entries(this.indexes)) {
+            await queryRunner.query(`CREATE INDEX CONCURRENTLY IF NOT EXISTS "${name}" ${definition}`);
+        }
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        for (const name of Object.keys(this.indexes).reverse()) {
+            await queryRunner.query(`DROP INDEX CONCURRENTLY IF EXISTS "${name}"`);
+        }
+    }
+}
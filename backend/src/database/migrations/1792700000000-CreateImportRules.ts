@@ -0,0 +1,34 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+export class CreateImportRules1792700000000 implements MigrationInterface {
+    name = 'CreateImportRules1792700000000'
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`
+            CREATE TABLE IF NOT EXISTS "import_rules" (
+                "id" uuid NOT NULL DEFAULT uuid_generate_v4(),
+                "pattern" character varying(255) NOT NULL,
+                "type" character varying(10),
+                "priority" integer NOT NULL DEFAULT 0,
+                "categoryId" uuid NOT NULL,
+                "userId" uuid NOT NULL,
+                "createdAt" TIMESTAMP NOT NULL DEFAULT now(),
+                CONSTRAINT "PK_import_rules" PRIMARY KEY ("id"),
+                CONSTRAINT "FK_import_rules_user" FOREIGN KEY ("userId") REFERENCES "users"("id") ON DELETE CASCADE,
+                CONSTRAINT "FK_import_rules_category" FOREIGN KEY ("categoryId") REFERENCES "categories"("id") ON DELETE CASCADE
+            )
+        `);
+
+        await queryRunner.query(`
+            CREATE INDEX IF NOT EXISTS "idx_import_rules_user_priority"
+            ON "import_rules" ("userId", "priority")
+        `);
+
+        await queryRunner.query(`COMMENT ON COLUMN "import_rules"."pattern" IS 'Trecho da descrição (sem diferenciar maiúsculas)'`);
+        await queryRunner.query(`COMMENT ON COLUMN "import_rules"."type" IS 'Restringe a regra a receitas ou despesas'`);
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`DROP TABLE IF EXISTS "import_rules"`);
+    }
+}
@@ -0,0 +1,64 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+/**
+ * Agendador persistente: uma linha por job (com lease/heartbeat) e o
+ * histórico de execuções. As linhas dos jobs são criadas no boot pelo
+ * próprio agendador.
+ */
+export class CreateScheduledJobs1792800000000 implements MigrationInterface {
+    name = 'CreateScheduledJobs1792800000000'
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`
+            CREATE TABLE IF NOT EXISTS "scheduled_jobs" (
+                "name" character varying(100) NOT NULL,
+                "enabled" boolean NOT NULL DEFAULT true,
+                "nextRunAt" TIMESTAMP NOT NULL DEFAULT now(),
+                "lockedBy" character varying(100),
+                "lockedUntil" TIMESTAMP,
+                "heartbeatAt" TIMESTAMP,
+                "attempts" integer NOT NULL DEFAULT 0,
+                "pendingTrigger" character varying(20),
+                "lastRunAt" TIMESTAMP,
+                "lastStatus" character varying(20),
+                "lastError" text,
+                "updatedAt" TIMESTAMP NOT NULL DEFAULT now(),
+                CONSTRAINT "PK_scheduled_jobs" PRIMARY KEY ("name")
+            )
+        `);
+
+        await queryRunner.query(`
+            CREATE INDEX IF NOT EXISTS "idx_scheduled_jobs_due"
+            ON "scheduled_jobs" ("nextRunAt")
+            WHERE "enabled" = true
+        `);
+
+        await queryRunner.query(`
+            CREATE TABLE IF NOT EXISTS "scheduled_job_runs" (
+                "id" uuid NOT NULL DEFAULT uuid_generate_v4(),
+                "jobName" character varying(100) NOT NULL,
+                "status" character varying(20) NOT NULL,
+                "trigger" character varying(20) NOT NULL DEFAULT 'schedule',
+                "attempt" integer NOT NULL DEFAULT 1,
+                "workerId" character varying(100) NOT NULL,
+                "result" jsonb,
+                "error" text,
+                "startedAt" TIMESTAMP NOT NULL DEFAULT now(),
+                "finishedAt" TIMESTAMP,
+                "durationMs" integer,
+                CONSTRAINT "PK_scheduled_job_runs" PRIMARY KEY ("id"),
+                CONSTRAINT "FK_scheduled_job_runs_job" FOREIGN KEY ("jobName") REFERENCES "scheduled_jobs"("name") ON DELETE CASCADE
+            )
+        `);
+
+        await queryRunner.query(`
+            CREATE INDEX IF NOT EXISTS "idx_scheduled_job_runs_job_started"
+            ON "scheduled_job_runs" ("jobName", "startedAt" DESC)
+        `);
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`DROP TABLE IF EXISTS "scheduled_job_runs"`);
+        await queryRunner.query(`DROP TABLE IF EXISTS "scheduled_jobs"`);
+    }
+}
@@ -0,0 +1,25 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+export class CreateUserDataVersions1792900000000 implements MigrationInterface {
+    name = 'CreateUserDataVersions1792900000000'
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        // Um contador por domínio; linhas são criadas no primeiro incremento
+        await queryRunner.query(`
+            CREATE TABLE IF NOT EXISTS "user_data_versions" (
+                "userId" uuid NOT NULL,
+                "transactions" bigint NOT NULL DEFAULT 0,
+                "categories" bigint NOT NULL DEFAULT 0,
+                "goals" bigint NOT NULL DEFAULT 0,
+                "preferences" bigint NOT NULL DEFAULT 0,
+                "updatedAt" TIMESTAMP NOT NULL DEFAULT now(),
+                CONSTRAINT "PK_user_data_versions" PRIMARY KEY ("userId"),
+                CONSTRAINT "FK_user_data_versions_user" FOREIGN KEY ("userId") REFERENCES "users"("id") ON DELETE CASCADE
+            )
+        `);
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`DROP TABLE IF EXISTS "user_data_versions"`);
+    }
+}
@@ -0,0 +1,44 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+/**
+ * Sincronização incremental: cada transação/categoria guarda a versão do
+ * contador do usuário (user_data_versions) em que foi gravada pela última vez,
+ * e exclusões deixam uma lápide em sync_tombstones com a mesma versão.
+ * Linhas existentes ficam com versão 0 e só aparecem na sincronização completa.
+ */
+export class AddSyncVersionsAndTombstones1793000000000 implements MigrationInterface {
+    name = 'AddSyncVersionsAndTombstones1793000000000'
+
+    transaction = false;
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        // DEFAULT constante: apenas metadado, sem reescrever as tabelas
+        await queryRunner.query(`ALTER TABLE "transactions" ADD COLUMN IF NOT EXISTS "syncVersion" bigint NOT NULL DEFAULT 0`);
+        await queryRunner.query(`ALTER TABLE "categories" ADD COLUMN IF NOT EXISTS "syncVersion" bigint NOT NULL DEFAULT 0`);
+
+        await queryRunner.query(`
+            CREATE TABLE IF NOT EXISTS "sync_tombstones" (
+                "entity" character varying(20) NOT NULL,
+                "entityId" uuid NOT NULL,
+                "userId" uuid NOT NULL,
+                "syncVersion" bigint NOT NULL,
+                "deletedAt" TIMESTAMP NOT NULL DEFAULT now(),
+                CONSTRAINT "PK_sync_tombstones" PRIMARY KEY ("entity", "entityId"),
+                CONSTRAINT "FK_sync_tombstones_user" FOREIGN KEY ("userId") REFERENCES "users"("id") ON DELETE CASCADE
+            )
+        `);
+        await queryRunner.query(`CREATE INDEX IF NOT EXISTS "idx_sync_tombstones_user_version" ON "sync_tombstones" ("userId", "entity", "syncVersion")`);
+        await queryRunner.query(`CREATE INDEX IF NOT EXISTS "idx_sync_tombstones_deleted_at" ON "sync_tombstones" ("deletedAt")`);
+
+        await queryRunner.query(`CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_transactions_user_sync_version" ON "transactions" ("userId", "syncVersion")`);
+        await queryRunner.query(`CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_categories_user_sync_version" ON "categories" ("userId", "syncVersion")`);
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`DROP INDEX CONCURRENTLY IF EXISTS "idx_categories_user_sync_version"`);
+        await queryRunner.query(`DROP INDEX CONCURRENTLY IF EXISTS "idx_transactions_user_sync_version"`);
+        await queryRunner.query(`DROP TABLE IF EXISTS "sync_tombstones"`);
+        await queryRunner.query(`ALTER TABLE "categories" DROP COLUMN IF EXISTS "syncVersion"`);
+        await queryRunner.query(`ALTER TABLE "transactions" DROP COLUMN IF EXISTS "syncVersion"`);
+    }
+}
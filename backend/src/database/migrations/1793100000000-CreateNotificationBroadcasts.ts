@@ -0,0 +1,45 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+/**
+ * Notificações em massa: cada envio é processado em lotes por um job em
+ * segundo plano, com o progresso (cursor por users.id) salvo nesta tabela
+ */
+export class CreateNotificationBroadcasts1793100000000 implements MigrationInterface {
+    name = 'CreateNotificationBroadcasts1793100000000'
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`
+            CREATE TABLE IF NOT EXISTS "notification_broadcasts" (
+                "id" uuid NOT NULL DEFAULT uuid_generate_v4(),
+                "title" character varying(255) NOT NULL,
+                "message" text NOT NULL,
+                "type" character varying(50) NOT NULL DEFAULT 'info',
+                "category" character varying(50),
+                "onlyPremium" boolean NOT NULL DEFAULT false,
+                "status" character varying(20) NOT NULL DEFAULT 'queued',
+                "totalRecipients" integer NOT NULL DEFAULT 0,
+                "sentCount" integer NOT NULL DEFAULT 0,
+                "lastUserId" uuid,
+                "error" text,
+                "createdBy" uuid,
+                "createdAt" TIMESTAMP NOT NULL DEFAULT now(),
+                "startedAt" TIMESTAMP,
+                "finishedAt" TIMESTAMP,
+                "updatedAt" TIMESTAMP NOT NULL DEFAULT now(),
+                CONSTRAINT "PK_notification_broadcasts" PRIMARY KEY ("id"),
+                CONSTRAINT "FK_notification_broadcasts_creator" FOREIGN KEY ("createdBy") REFERENCES "users"("id") ON DELETE SET NULL
+            )
+        `);
+
+        await queryRunner.query(`
+            CREATE INDEX IF NOT EXISTS "idx_notification_broadcasts_pending"
+            ON "notification_broadcasts" ("createdAt")
+            WHERE "status" IN ('queued', 'running')
+        `);
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`DROP INDEX IF EXISTS "idx_notification_broadcasts_pending"`);
+        await queryRunner.query(`DROP TABLE IF EXISTS "notification_broadcasts"`);
+    }
+}
@@ -0,0 +1,34 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+/**
+ * Contador de notificações não lidas por usuário, mantido pelas escritas
+ * em notifications; a contagem inicial vem das notificações existentes
+ */
+export class CreateUserNotificationCounters1793200000000 implements MigrationInterface {
+    name = 'CreateUserNotificationCounters1793200000000'
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`
+            CREATE TABLE IF NOT EXISTS "user_notification_counters" (
+                "userId" uuid NOT NULL,
+                "unread" integer NOT NULL DEFAULT 0,
+                "updatedAt" TIMESTAMP NOT NULL DEFAULT now(),
+                CONSTRAINT "PK_user_notification_counters" PRIMARY KEY ("userId"),
+                CONSTRAINT "FK_user_notification_counters_user" FOREIGN KEY ("userId") REFERENCES "users"("id") ON DELETE CASCADE
+            )
+        `);
+
+        await queryRunner.query(`
+            INSERT INTO "user_notification_counters" ("userId", "unread")
+            SELECT "userId", COUNT(*)
+            FROM "notifications"
+            WHERE "isRead" = false
+            GROUP BY "userId"
+            ON CONFLICT ("userId") DO UPDATE SET "unread" = EXCLUDED."unread", "updatedAt" = now()
+        `);
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`DROP TABLE IF EXISTS "user_notification_counters"`);
+    }
+}
@@ -0,0 +1,101 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+import { createMonthPartitionSql, monthPartition, monthStart } from "../../utils/monthPartitions";
+
+// Meses futuros criados já na migration (o job de manutenção mantém a folga)
+const PARTITIONS_AHEAD = 3;
+
+const COLUMNS = `"id", "userId", "title", "message", "type", "category", "isRead", "relatedId", "relatedType", "createdAt", "updatedAt"`;
+
+/**
+ * Recria notifications particionada por mês em "createdAt". A retenção passa
+ * a remover partições inteiras (sem DELETE nem inchaço de índices) e cada
+ * índice fica restrito ao volume de um mês. A chave primária inclui a chave
+ * de partição, como exigido pelo Postgres.
+ */
+export class PartitionNotifications1793300000000 implements MigrationInterface {
+    name = 'PartitionNotifications1793300000000'
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`ALTER TABLE "notifications" RENAME TO "notifications_unpartitioned"`);
+        await queryRunner.query(`ALTER INDEX IF EXISTS "idx_notifications_user_created" RENAME TO "idx_notifications_unpartitioned_user_created"`);
+        await queryRunner.query(`ALTER INDEX IF EXISTS "idx_notifications_user_read_created" RENAME TO "idx_notifications_unpartitioned_user_read_created"`);
+
+        await queryRunner.query(`
+            CREATE TABLE "notifications" (
+                "id" uuid NOT NULL DEFAULT uuid_generate_v4(),
+                "userId" uuid NOT NULL,
+                "title" character varying(255) NOT NULL,
+                "message" text NOT NULL,
+                "type" character varying(50) NOT NULL DEFAULT 'info',
+                "category" character varying(50),
+                "isRead" boolean NOT NULL DEFAULT false,
+                "relatedId" uuid,
+                "relatedType" character varying(50),
+                "createdAt" TIMESTAMP NOT NULL DEFAULT now(),
+                "updatedAt" TIMESTAMP NOT NULL DEFAULT now(),
+                CONSTRAINT "PK_notifications_id_created" PRIMARY KEY ("id", "createdAt"),
+                CONSTRAINT "FK_notifications_user" FOREIGN KEY ("userId") REFERENCES "users"("id") ON DELETE CASCADE
+            ) PARTITION BY RANGE ("createdAt")
+        `);
+
+        // Índices no pai são criados em cada partição
+        await queryRunner.query(`CREATE INDEX "idx_notifications_user_created" ON "notifications" ("userId", "createdAt" DESC)`);
+        await queryRunner.query(`CREATE INDEX "idx_notifications_user_read_created" ON "notifications" ("userId", "isRead", "createdAt" DESC)`);
+
+        // Do mês mais antigo existente (ou do anterior ao atual) até a folga futura
+        const [{ oldest }] = await queryRunner.query(
+            `SELECT to_char(MIN("createdAt"), 'YYYY-MM-01') AS oldest FROM "notifications_unpartitioned"`
+        );
+        const now = new Date();
+        let month = monthStart(now, -1);
+        if (oldest && new Date(`${oldest}T00:00:00Z`) < month) {
+            month = new Date(`${oldest}T00:00:00Z`);
+        }
+        const last = monthStart(now, PARTITIONS_AHEAD);
+
+        for (; month <= last; month = monthStart(month, 1)) {
+            await queryRunner.query(createMonthPartitionSql('notifications', monthPartition('notifications', month)));
+        }
+
+        await queryRunner.query(`
+            INSERT INTO "notifications" (${COLUMNS})
+            SELECT "id", "userId", "title", "message", "type"::varchar, "category"::varchar, "isRead",
+                   "relatedId", "relatedType", "createdAt", "updatedAt"
+            FROM "notifications_unpartitioned"
+        `);
+
+        await queryRunner.query(`DROP TABLE "notifications_unpartitioned"`);
+        await queryRunner.query(`ANALYZE "notifications"`);
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`ALTER TABLE "notifications" RENAME TO "notifications_partitioned"`);
+        await queryRunner.query(`ALTER INDEX IF EXISTS "idx_notifications_user_created" RENAME TO "idx_notifications_partitioned_user_created"`);
+        await queryRunner.query(`ALTER INDEX IF EXISTS "idx_notifications_user_read_created" RENAME TO "idx_notifications_partitioned_user_read_created"`);
+
+        await queryRunner.query(`
+            CREATE TABLE "notifications" (
+                "id" uuid NOT NULL DEFAULT uuid_generate_v4(),
+                "userId" uuid NOT NULL,
+                "title" character varying(255) NOT NULL,
+                "message" text NOT NULL,
+                "type" character varying(50) NOT NULL DEFAULT 'info',
+                "category" character varying(50),
+                "isRead" boolean NOT NULL DEFAULT false,
+                "relatedId" uuid,
+                "relatedType" character varying(50),
+                "createdAt" TIMESTAMP NOT NULL DEFAULT now(),
+                "updatedAt" TIMESTAMP NOT NULL DEFAULT now(),
+                CONSTRAINT "PK_notifications" PRIMARY KEY ("id"),
+                CONSTRAINT "FK_notifications_user" FOREIGN KEY ("userId") REFERENCES "users"("id") ON DELETE CASCADE
+            )
+        `);
+
+        await queryRunner.query(`INSERT INTO "notifications" (${COLUMNS}) SELECT ${COLUMNS} FROM "notifications_partitioned"`);
+        // Remove também todas as partições
+        await queryRunner.query(`DROP TABLE "notifications_partitioned"`);
+
+        await queryRunner.query(`CREATE INDEX "idx_notifications_user_created" ON "notifications" ("userId", "createdAt" DESC)`);
+        await queryRunner.query(`CREATE INDEX "idx_notifications_user_read_created" ON "notifications" ("userId", "isRead", "createdAt" DESC)`);
+    }
+}
@@ -1,10 +1,11 @@
 import { subscriptionService } from '../services/subscription.service';
+import jobScheduler from '../services/jobScheduler.service';
 
 /**
  * Job para expirar planos premium vencidos
- * Deve ser executado diariamente via cron
+ * Executado diariamente pelo agendador persistente
  */
-export async function expirePlansJob(): Promise<void> {
+export async function expirePlansJob(): Promise<{ expired: number }> {
   try {
     console.log('[CRON] Iniciando verificação de planos expirados...');
     
@@ -15,23 +16,26 @@ export async function expirePlansJob(): Promise<void> {
     } else {
       console.log('[CRON] Nenhum plano expirado encontrado');
     }
+
+    return { expired: expiredCount };
   } catch (error) {
     console.error('[CRON] Erro ao expirar planos:', error);
+    // Propagar para o agendador registrar a falha e tentar novamente
+    throw error;
   }
 }
 
 /**
- * Configurar execução automática do job
- * Executa todos os dias à meia-noite
+ * Registrar o job no agendador
+ * Roda assim que o job é criado e depois a cada 24 horas, em uma única instância
  */
 export function scheduleExpirePlansJob(): void {
-  // Executar imediatamente ao iniciar
-  expirePlansJob();
-
-  // Executar a cada 24 horas (86400000 ms)
-  setInterval(() => {
-    expirePlansJob();
-  }, 24 * 60 * 60 * 1000);
+  jobScheduler.register({
+    name: 'expire-plans',
+    schedule: { everyMs: 24 * 60 * 60 * 1000 },
+    runOnStart: true,
+    handler: expirePlansJob,
+  });
 
   console.log('[CRON] Job de expiração de planos agendado (execução diária)');
 }
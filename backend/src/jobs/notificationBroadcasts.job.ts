@@ -0,0 +1,19 @@
+import notificationBroadcastService, { BROADCAST_JOB_NAME } from '@/services/notificationBroadcast.service';
+import jobScheduler from '@/services/jobScheduler.service';
+import { logger } from '@/utils/logger';
+
+/**
+ * Job que envia as notificações em massa pendentes, em lotes
+ * Acionado a cada novo envio; a rodada periódica retoma envios interrompidos
+ */
+export const scheduleNotificationBroadcastsJob = () => {
+  jobScheduler.register({
+    name: BROADCAST_JOB_NAME,
+    schedule: { everyMs: 5 * 60 * 1000 },
+    handler: () => notificationBroadcastService.processPending(),
+    runOnStart: true,
+    maxAttempts: 5,
+  });
+
+  logger.info('⏰ Notification broadcasts job scheduled (on demand, every 5 minutes)');
+};
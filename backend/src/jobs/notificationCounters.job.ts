@@ -0,0 +1,23 @@
+import notificationService from '@/services/notification.service';
+import jobScheduler from '@/services/jobScheduler.service';
+import { logger } from '@/utils/logger';
+
+/**
+ * Job que corrige divergências no contador de notificações não lidas
+ * Executa a cada hora, em uma única instância
+ */
+export const scheduleNotificationCountersJob = () => {
+  jobScheduler.register({
+    name: 'reconcile-notification-counters',
+    schedule: { everyMs: 60 * 60 * 1000 },
+    handler: async () => {
+      const result = await notificationService.reconcileUnreadCounters();
+      if (result.corrected > 0) {
+        logger.warn(`⚠️  Unread notification counters corrected: ${result.corrected}`);
+      }
+      return result;
+    },
+  });
+
+  logger.info('⏰ Notification counters job scheduled (every hour)');
+};
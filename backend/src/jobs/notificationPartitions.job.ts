@@ -0,0 +1,19 @@
+import notificationPartitionService from '@/services/notificationPartition.service';
+import jobScheduler from '@/services/jobScheduler.service';
+import { logger } from '@/utils/logger';
+
+/**
+ * Job de manutenção das partições mensais de notificações
+ * Executa diariamente às 02:30, em uma única instância: cria os meses
+ * futuros e, com retenção e arquivo configurados, exporta/remove os antigos
+ */
+export const scheduleNotificationPartitionsJob = () => {
+  jobScheduler.register({
+    name: 'maintain-notification-partitions',
+    schedule: { dailyAt: '02:30' },
+    // Sem runOnStart: a migration já cria os meses futuros
+    handler: () => notificationPartitionService.maintain(),
+  });
+
+  logger.info('⏰ Notification partitions job scheduled (daily at 02:30)');
+};
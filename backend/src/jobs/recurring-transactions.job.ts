@@ -1,21 +1,21 @@
-import cron from 'node-cron';
 import recurrenceService from '@/services/recurrence.service';
+import jobScheduler from '@/services/jobScheduler.service';
 import { logger } from '@/utils/logger';
 
 /**
  * Job para processar transações recorrentes
- * Executa todos os dias às 00:05 (5 minutos após meia-noite)
+ * Executa todos os dias às 00:05 (5 minutos após meia-noite), em uma única instância
  */
 export const scheduleRecurringTransactionsJob = () => {
-  // Executar todos os dias às 00:05
-  cron.schedule('5 0 * * *', async () => {
-    try {
+  jobScheduler.register({
+    name: 'recurring-transactions',
+    schedule: { dailyAt: '00:05' },
+    handler: async () => {
       logger.info('🔄 Starting recurring transactions job...');
       const processed = await recurrenceService.processRecurringTransactions();
       logger.info(`✅ Recurring transactions job completed. Processed: ${processed}`);
-    } catch (error) {
-      logger.error('❌ Error in recurring transactions job:', error);
-    }
+      return recurrenceService.getLastRunStats();
+    },
   });
 
   logger.info('⏰ Recurring transactions job scheduled (daily at 00:05)');
@@ -0,0 +1,21 @@
+import syncService from '@/services/sync.service';
+import jobScheduler from '@/services/jobScheduler.service';
+import { logger } from '@/utils/logger';
+
+/**
+ * Job para remover lápides de sincronização fora da janela de retenção
+ * Executa diariamente às 03:30, em uma única instância
+ */
+export const scheduleSyncTombstonesJob = () => {
+  jobScheduler.register({
+    name: 'prune-sync-tombstones',
+    schedule: { dailyAt: '03:30' },
+    handler: async () => {
+      const result = await syncService.pruneTombstones();
+      logger.info(`🧹 Sync tombstones pruned: ${result.deleted}`);
+      return result;
+    },
+  });
+
+  logger.info('⏰ Sync tombstones job scheduled (daily at 03:30)');
+};
@@ -1,6 +1,6 @@
 import { Request, Response, NextFunction } from 'express';
-import { AppDataSource } from '../config/database';
 import { User } from '../models/User';
+import { entitlementService } from '../services/entitlement.service';
 
 export interface AuthRequest extends Request {
   userId?: string;
@@ -16,7 +16,7 @@ export const checkPremiumAccess = async (
   next: NextFunction
 ): Promise<void> => {
   try {
-    const userId = req.userId;
+    const userId = req.user?.userId ?? req.userId;
 
     if (!userId) {
       res.status(401).json({
@@ -26,8 +26,8 @@ export const checkPremiumAccess = async (
       return;
     }
 
-    const userRepository = AppDataSource.getRepository(User);
-    const user = await userRepository.findOne({ where: { id: userId } });
+    // Dados de plano em cache: sem consulta ao banco no caminho comum
+    const user = await entitlementService.getUser(userId);
 
     if (!user) {
       res.status(404).json({
@@ -49,7 +49,7 @@ export const checkPremiumAccess = async (
       return;
     }
 
-    // Adicionar usuário ao request para uso posterior
+    // Adicionar usuário (apenas campos de plano) ao request para uso posterior
     req.premiumUser = user;
     next();
   } catch (error) {
@@ -71,7 +71,7 @@ export const checkFeatureAccess = (feature: string) => {
     next: NextFunction
   ): Promise<void> => {
     try {
-      const userId = req.userId;
+      const userId = req.user?.userId ?? req.userId;
 
       if (!userId) {
         res.status(401).json({
@@ -81,8 +81,7 @@ export const checkFeatureAccess = (feature: string) => {
         return;
       }
 
-      const userRepository = AppDataSource.getRepository(User);
-      const user = await userRepository.findOne({ where: { id: userId } });
+      const user = await entitlementService.getUser(userId);
 
       if (!user) {
         res.status(404).json({
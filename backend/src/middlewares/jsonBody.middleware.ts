@@ -0,0 +1,112 @@
+import { Request, Response, NextFunction } from 'express';
+import { BadRequestError, PayloadTooLargeError } from '../utils/errors';
+
+// Datas ISO com horário (ex: 2024-03-05T03:00:00.000Z) viram YYYY-MM-DD
+const ISO_DATETIME_REGEX = /^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d{3})?Z?$/;
+
+const isIsoDateTime = (value: string): boolean =>
+  // Checagem barata antes da regex: tamanho mínimo e 'T' na posição 10
+  value.length >= 19 && value.charCodeAt(10) === 84 && ISO_DATETIME_REGEX.test(value);
+
+/**
+ * Converter, no próprio objeto, strings de data ISO para YYYY-MM-DD.
+ * Uma única passada sobre o JSON já parseado (sem reviver nem cópia).
+ */
+export const normalizeDateStrings = (value: any): any => {
+  if (typeof value === 'string') {
+    return isIsoDateTime(value) ? value.slice(0, 10) : value;
+  }
+
+  if (value === null || typeof value !== 'object') {
+    return value;
+  }
+
+  if (Array.isArray(value)) {
+    for (let index = 0; index < value.length; index++) {
+      const item = value[index];
+      if (typeof item === 'string') {
+        if (isIsoDateTime(item)) {
+          value[index] = item.slice(0, 10);
+        }
+      } else if (item !== null && typeof item === 'object') {
+        normalizeDateStrings(item);
+      }
+    }
+    return value;
+  }
+
+  for (const key in value) {
+    const item = value[key];
+    if (typeof item === 'string') {
+      if (isIsoDateTime(item)) {
+        value[key] = item.slice(0, 10);
+      }
+    } else if (item !== null && typeof item === 'object') {
+      normalizeDateStrings(item);
+    }
+  }
+  return value;
+};
+
+/**
+ * Parser de corpo JSON com limite de tamanho: recusa pelo Content-Length antes
+ * de ler e interrompe a leitura assim que o corpo recebido passa do limite
+ */
+export const jsonBody = (limit: number) => {
+  return (req: Request, _res: Response, next: NextFunction): void => {
+    if (!req.is('application/json')) {
+      next();
+      return;
+    }
+
+    const declaredLength = Number(req.headers['content-length']);
+    if (declaredLength > limit) {
+      req.resume();
+      next(new PayloadTooLargeError());
+      return;
+    }
+
+    const chunks: Buffer[] = [];
+    let received = 0;
+    let done = false;
+
+    const finish = (error?: Error) => {
+      if (done) {
+        return;
+      }
+      done = true;
+      req.removeListener('data', onData);
+      req.removeListener('end', onEnd);
+      req.removeListener('error', finish);
+      next(error);
+    };
+
+    const onData = (chunk: Buffer) => {
+      received += chunk.length;
+      if (received > limit) {
+        // Descarta o restante sem acumular
+        req.resume();
+        finish(new PayloadTooLargeError());
+        return;
+      }
+      chunks.push(chunk);
+    };
+
+    const onEnd = () => {
+      const raw = Buffer.concat(chunks, received).toString('utf8');
+
+      try {
+        req.body = raw.length > 0 ? normalizeDateStrings(JSON.parse(raw)) : {};
+      } catch (error) {
+        finish(new BadRequestError('JSON inválido'));
+        return;
+      }
+
+      finish();
+    };
+
+    req.on('data', onData);
+    req.on('end', onEnd);
+    req.on('error', finish);
+  };
+};
@@ -38,3 +38,27 @@ export const uploadAvatar = upload.single('avatar');
 
 // Middleware para múltiplos arquivos
 export const uploadMultiple = upload.array('files', 10);
+
+// Extratos bancários (CSV/OFX) vão para disco e são lidos em streaming
+const STATEMENT_EXTENSIONS = ['.csv', '.ofx', '.txt'];
+
+export const uploadStatement = multer({
+  storage: multer.diskStorage({
+    destination: (req, file, cb) => {
+      cb(null, path.join(config.upload.dir, 'imports'));
+    },
+    filename: (req, file, cb) => {
+      cb(null, `${uuidv4()}${path.extname(file.originalname).toLowerCase()}`);
+    },
+  }),
+  fileFilter: (req: any, file: any, cb: multer.FileFilterCallback) => {
+    if (STATEMENT_EXTENSIONS.includes(path.extname(file.originalname).toLowerCase())) {
+      cb(null, true);
+    } else {
+      cb(new BadRequestError('Tipo de arquivo não permitido. Use CSV ou OFX.'));
+    }
+  },
+  limits: {
+    fileSize: config.upload.maxStatementSize,
+  },
+}).single('file');
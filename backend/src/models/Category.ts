@@ -7,6 +7,7 @@ import {
   ManyToOne,
   OneToMany,
   JoinColumn,
+  Index,
 } from 'typeorm';
 import { User } from './User';
 import { Transaction } from './Transaction';
@@ -17,6 +18,8 @@ export enum CategoryType {
 }
 
 @Entity('categories')
+@Index('idx_categories_user_name', ['userId', 'name'], { synchronize: false })
+@Index('idx_categories_user_sync_version', ['userId', 'syncVersion'], { synchronize: false })
 export class Category {
   @PrimaryGeneratedColumn('uuid')
   id: string;
@@ -40,6 +43,10 @@ export class Category {
   @Column({ type: 'uuid' })
   userId: string;
 
+  // Versão do contador de categorias do usuário na última escrita (sincronização incremental)
+  @Column({ type: 'bigint', default: 0 })
+  syncVersion: string;
+
   @CreateDateColumn({ type: 'timestamp' })
   createdAt: Date;
 
@@ -0,0 +1,55 @@
+import {
+  Entity,
+  PrimaryGeneratedColumn,
+  Column,
+  CreateDateColumn,
+  ManyToOne,
+  JoinColumn,
+  Index,
+} from 'typeorm';
+import { User } from './User';
+import { Category } from './Category';
+import { TransactionType } from './Transaction';
+
+/**
+ * Regra de categorização usada na importação de extratos:
+ * lançamentos cuja descrição contém o padrão vão para a categoria indicada
+ */
+@Entity('import_rules')
+@Index('idx_import_rules_user_priority', ['userId', 'priority'])
+export class ImportRule {
+  @PrimaryGeneratedColumn('uuid')
+  id: string;
+
+  @Column({ type: 'varchar', length: 255, comment: 'Trecho da descrição (sem diferenciar maiúsculas)' })
+  pattern: string;
+
+  @Column({
+    type: 'varchar',
+    length: 10,
+    nullable: true,
+    comment: 'Restringe a regra a receitas ou despesas',
+  })
+  type: TransactionType | null;
+
+  @Column({ type: 'integer', default: 0 })
+  priority: number;
+
+  @Column({ type: 'uuid' })
+  categoryId: string;
+
+  @Column({ type: 'uuid' })
+  userId: string;
+
+  @CreateDateColumn({ type: 'timestamp' })
+  createdAt: Date;
+
+  // Relationships
+  @ManyToOne(() => User, { onDelete: 'CASCADE' })
+  @JoinColumn({ name: 'userId' })
+  user: User;
+
+  @ManyToOne(() => Category, { onDelete: 'CASCADE' })
+  @JoinColumn({ name: 'categoryId' })
+  category: Category;
+}
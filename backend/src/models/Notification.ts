@@ -6,13 +6,20 @@ import {
   UpdateDateColumn,
   ManyToOne,
   JoinColumn,
+  Index,
 } from 'typeorm';
 import { User } from './User';
 
 export type NotificationType = 'info' | 'warning' | 'success' | 'error';
 export type NotificationCategory = 'transaction' | 'goal' | 'budget' | 'premium' | 'system';
 
+/**
+ * Tabela particionada por mês em createdAt (chave primária no banco:
+ * id + createdAt); partições antigas são removidas pela retenção
+ */
 @Entity('notifications')
+@Index('idx_notifications_user_created', ['userId', 'createdAt'], { synchronize: false })
+@Index('idx_notifications_user_read_created', ['userId', 'isRead', 'createdAt'], { synchronize: false })
 export class Notification {
   @PrimaryGeneratedColumn('uuid')
   id: string;
@@ -0,0 +1,74 @@
+import {
+  Entity,
+  PrimaryGeneratedColumn,
+  Column,
+  CreateDateColumn,
+  UpdateDateColumn,
+  ManyToOne,
+  JoinColumn,
+  Index,
+} from 'typeorm';
+import { User } from './User';
+import { NotificationType, NotificationCategory } from './Notification';
+
+export type NotificationBroadcastStatus = 'queued' | 'running' | 'completed' | 'failed';
+
+/**
+ * Notificação em massa. As notificações são criadas em lotes por um job
+ * em segundo plano; lastUserId guarda até onde o envio já chegou.
+ */
+@Entity('notification_broadcasts')
+@Index('idx_notification_broadcasts_pending', ['createdAt'], { synchronize: false })
+export class NotificationBroadcast {
+  @PrimaryGeneratedColumn('uuid')
+  id: string;
+
+  @Column({ type: 'varchar', length: 255 })
+  title: string;
+
+  @Column({ type: 'text' })
+  message: string;
+
+  @Column({ type: 'varchar', length: 50, default: 'info' })
+  type: NotificationType;
+
+  @Column({ type: 'varchar', length: 50, nullable: true })
+  category: NotificationCategory;
+
+  @Column({ type: 'boolean', default: false })
+  onlyPremium: boolean;
+
+  @Column({ type: 'varchar', length: 20, default: 'queued' })
+  status: NotificationBroadcastStatus;
+
+  @Column({ type: 'integer', default: 0 })
+  totalRecipients: number;
+
+  @Column({ type: 'integer', default: 0 })
+  sentCount: number;
+
+  @Column({ type: 'uuid', nullable: true })
+  lastUserId: string | null;
+
+  @Column({ type: 'text', nullable: true })
+  error: string | null;
+
+  @Column({ type: 'uuid', nullable: true })
+  createdBy: string | null;
+
+  @ManyToOne(() => User, { onDelete: 'SET NULL' })
+  @JoinColumn({ name: 'createdBy' })
+  creator: User;
+
+  @CreateDateColumn()
+  createdAt: Date;
+
+  @Column({ type: 'timestamp', nullable: true })
+  startedAt: Date | null;
+
+  @Column({ type: 'timestamp', nullable: true })
+  finishedAt: Date | null;
+
+  @UpdateDateColumn()
+  updatedAt: Date;
+}
@@ -0,0 +1,58 @@
+import {
+  Entity,
+  PrimaryColumn,
+  Column,
+  UpdateDateColumn,
+  OneToMany,
+  Index,
+} from 'typeorm';
+import { ScheduledJobRun } from './ScheduledJobRun';
+
+/**
+ * Job agendado compartilhado entre instâncias.
+ * Uma instância só executa o job enquanto detém o lease (lockedBy/lockedUntil).
+ */
+@Entity('scheduled_jobs')
+@Index('idx_scheduled_jobs_due', ['nextRunAt'], { synchronize: false })
+export class ScheduledJob {
+  @PrimaryColumn({ type: 'varchar', length: 100 })
+  name: string;
+
+  @Column({ type: 'boolean', default: true })
+  enabled: boolean;
+
+  @Column({ type: 'timestamp' })
+  nextRunAt: Date;
+
+  @Column({ type: 'varchar', length: 100, nullable: true })
+  lockedBy: string | null;
+
+  @Column({ type: 'timestamp', nullable: true })
+  lockedUntil: Date | null;
+
+  @Column({ type: 'timestamp', nullable: true })
+  heartbeatAt: Date | null;
+
+  // Falhas consecutivas (controla o backoff)
+  @Column({ type: 'integer', default: 0 })
+  attempts: number;
+
+  @Column({ type: 'varchar', length: 20, nullable: true })
+  pendingTrigger: string | null;
+
+  @Column({ type: 'timestamp', nullable: true })
+  lastRunAt: Date | null;
+
+  @Column({ type: 'varchar', length: 20, nullable: true })
+  lastStatus: string | null;
+
+  @Column({ type: 'text', nullable: true })
+  lastError: string | null;
+
+  @UpdateDateColumn({ type: 'timestamp' })
+  updatedAt: Date;
+
+  // Relationships
+  @OneToMany(() => ScheduledJobRun, (run) => run.job)
+  runs: ScheduledJobRun[];
+}
@@ -0,0 +1,56 @@
+import {
+  Entity,
+  PrimaryGeneratedColumn,
+  Column,
+  ManyToOne,
+  JoinColumn,
+  Index,
+} from 'typeorm';
+import { ScheduledJob } from './ScheduledJob';
+
+export type ScheduledJobRunStatus = 'running' | 'succeeded' | 'failed';
+
+/**
+ * Histórico de execuções de um job agendado
+ */
+@Entity('scheduled_job_runs')
+@Index('idx_scheduled_job_runs_job_started', ['jobName', 'startedAt'])
+export class ScheduledJobRun {
+  @PrimaryGeneratedColumn('uuid')
+  id: string;
+
+  @Column({ type: 'varchar', length: 100 })
+  jobName: string;
+
+  @Column({ type: 'varchar', length: 20 })
+  status: ScheduledJobRunStatus;
+
+  @Column({ type: 'varchar', length: 20, default: 'schedule' })
+  trigger: string;
+
+  @Column({ type: 'integer', default: 1 })
+  attempt: number;
+
+  @Column({ type: 'varchar', length: 100 })
+  workerId: string;
+
+  @Column({ type: 'jsonb', nullable: true })
+  result: any;
+
+  @Column({ type: 'text', nullable: true })
+  error: string | null;
+
+  @Column({ type: 'timestamp' })
+  startedAt: Date;
+
+  @Column({ type: 'timestamp', nullable: true })
+  finishedAt: Date | null;
+
+  @Column({ type: 'integer', nullable: true })
+  durationMs: number | null;
+
+  // Relationships
+  @ManyToOne(() => ScheduledJob, (job) => job.runs, { onDelete: 'CASCADE' })
+  @JoinColumn({ name: 'jobName' })
+  job: ScheduledJob;
+}
@@ -0,0 +1,33 @@
+import { Entity, PrimaryColumn, Column, CreateDateColumn, ManyToOne, JoinColumn, Index } from 'typeorm';
+import { User } from './User';
+
+export type SyncEntity = 'transaction' | 'category';
+
+/**
+ * Registro de exclusão para a sincronização incremental: permite enviar
+ * exclusões como deltas mesmo com a linha original removida
+ */
+@Entity('sync_tombstones')
+@Index('idx_sync_tombstones_user_version', ['userId', 'entity', 'syncVersion'])
+@Index('idx_sync_tombstones_deleted_at', ['deletedAt'])
+export class SyncTombstone {
+  @PrimaryColumn({ type: 'varchar', length: 20 })
+  entity: SyncEntity;
+
+  @PrimaryColumn({ type: 'uuid' })
+  entityId: string;
+
+  @Column({ type: 'uuid' })
+  userId: string;
+
+  @Column({ type: 'bigint' })
+  syncVersion: string;
+
+  @CreateDateColumn({ type: 'timestamp' })
+  deletedAt: Date;
+
+  // Relationships
+  @ManyToOne(() => User, { onDelete: 'CASCADE' })
+  @JoinColumn({ name: 'userId' })
+  user: User;
+}
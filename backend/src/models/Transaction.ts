@@ -6,6 +6,7 @@ import {
   UpdateDateColumn,
   ManyToOne,
   JoinColumn,
+  Index,
 } from 'typeorm';
 import { User } from './User';
 import { Category } from './Category';
@@ -23,6 +24,14 @@ export enum RecurrenceType {
 }
 
 @Entity('transactions')
+// Índices criados por migrations (CONCURRENTLY); synchronize: false evita que o TypeORM os recrie
+@Index('idx_transactions_user_date', ['userId', 'date'], { synchronize: false })
+@Index('idx_transactions_user_type_date', ['userId', 'type', 'date'], { synchronize: false })
+@Index('idx_transactions_user_category_date', ['userId', 'categoryId', 'date'], { synchronize: false })
+@Index('idx_transactions_user_keyset', ['userId', 'date', 'createdAt', 'id'], { synchronize: false })
+@Index('idx_transactions_recurring_due', ['nextOccurrence'], { synchronize: false })
+@Index('idx_transactions_parent', ['parentTransactionId'], { synchronize: false })
+@Index('idx_transactions_user_sync_version', ['userId', 'syncVersion'], { synchronize: false })
 export class Transaction {
   @PrimaryGeneratedColumn('uuid')
   id: string;
@@ -39,10 +48,10 @@ export class Transaction {
   @Column({ type: 'varchar', length: 500 })
   description: string;
 
+  // Coluna DATE nativa; o driver devolve a data como string YYYY-MM-DD
   @Column({ 
-    type: 'varchar',
-    length: 10,
-    comment: 'Data no formato YYYY-MM-DD'
+    type: 'date',
+    comment: 'Data da transação'
   })
   date: string;
 
@@ -72,6 +81,10 @@ export class Transaction {
   @Column({ type: 'uuid', nullable: true })
   parentTransactionId: string | null;
 
+  // Versão do contador de transações do usuário na última escrita (sincronização incremental)
+  @Column({ type: 'bigint', default: 0 })
+  syncVersion: string;
+
   @CreateDateColumn({ type: 'timestamp' })
   createdAt: Date;
 
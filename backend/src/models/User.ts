@@ -8,10 +8,10 @@ import {
   BeforeInsert,
   BeforeUpdate,
 } from 'typeorm';
-import bcrypt from 'bcryptjs';
 import { Category } from './Category';
 import { Transaction } from './Transaction';
 import { RefreshToken } from './RefreshToken';
+import passwordHasher from '../services/passwordHasher.service';
 
 @Entity('users')
 export class User {
@@ -78,13 +78,13 @@ export class User {
   @BeforeInsert()
   @BeforeUpdate()
   async hashPassword(): Promise<void> {
-    if (this.password && !this.password.startsWith('$2a$')) {
-      this.password = await bcrypt.hash(this.password, 10);
+    if (this.password && !passwordHasher.isHashed(this.password)) {
+      this.password = await passwordHasher.hash(this.password);
     }
   }
 
   async comparePassword(candidatePassword: string): Promise<boolean> {
-    return bcrypt.compare(candidatePassword, this.password);
+    return passwordHasher.compare(candidatePassword, this.password);
   }
 
   // Premium Plan Methods
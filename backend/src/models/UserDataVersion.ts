@@ -0,0 +1,33 @@
+import { Entity, PrimaryColumn, Column, UpdateDateColumn, OneToOne, JoinColumn } from 'typeorm';
+import { User } from './User';
+
+/**
+ * Contadores de escrita por usuário e domínio. Incrementados na mesma
+ * transação de cada escrita, permitem validar caches e sincronizações
+ * com uma única leitura pela chave primária.
+ */
+@Entity('user_data_versions')
+export class UserDataVersion {
+  @PrimaryColumn({ type: 'uuid' })
+  userId: string;
+
+  @Column({ type: 'bigint', default: 0 })
+  transactions: string;
+
+  @Column({ type: 'bigint', default: 0 })
+  categories: string;
+
+  @Column({ type: 'bigint', default: 0 })
+  goals: string;
+
+  @Column({ type: 'bigint', default: 0 })
+  preferences: string;
+
+  @UpdateDateColumn({ type: 'timestamp' })
+  updatedAt: Date;
+
+  // Relationships
+  @OneToOne(() => User, { onDelete: 'CASCADE' })
+  @JoinColumn({ name: 'userId' })
+  user: User;
+}
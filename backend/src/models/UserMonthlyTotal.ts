@@ -0,0 +1,51 @@
+import {
+  Entity,
+  PrimaryColumn,
+  Column,
+  UpdateDateColumn,
+  ManyToOne,
+  JoinColumn,
+} from 'typeorm';
+import { User } from './User';
+import { Category } from './Category';
+import { TransactionType } from './Transaction';
+
+/**
+ * Totais mensais por usuário/categoria/tipo, mantidos incrementalmente
+ * pelas operações de escrita de transações
+ */
+@Entity('user_monthly_totals')
+export class UserMonthlyTotal {
+  @PrimaryColumn({ type: 'uuid' })
+  userId: string;
+
+  @PrimaryColumn({ type: 'smallint' })
+  year: number;
+
+  @PrimaryColumn({ type: 'smallint' })
+  month: number;
+
+  @PrimaryColumn({ type: 'uuid' })
+  categoryId: string;
+
+  @PrimaryColumn({ type: 'varchar', length: 10 })
+  type: TransactionType;
+
+  @Column({ type: 'decimal', precision: 14, scale: 2, default: 0 })
+  total: number;
+
+  @Column({ type: 'integer', default: 0 })
+  count: number;
+
+  @UpdateDateColumn({ type: 'timestamp' })
+  updatedAt: Date;
+
+  // Relationships
+  @ManyToOne(() => User, { onDelete: 'CASCADE' })
+  @JoinColumn({ name: 'userId' })
+  user: User;
+
+  @ManyToOne(() => Category, { onDelete: 'CASCADE' })
+  @JoinColumn({ name: 'categoryId' })
+  category: Category;
+}
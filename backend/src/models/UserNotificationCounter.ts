@@ -0,0 +1,23 @@
+import { Entity, PrimaryColumn, Column, UpdateDateColumn, OneToOne, JoinColumn } from 'typeorm';
+import { User } from './User';
+
+/**
+ * Notificações não lidas por usuário. Atualizado no mesmo comando de cada
+ * escrita em notifications e reconciliado periodicamente por um job.
+ */
+@Entity('user_notification_counters')
+export class UserNotificationCounter {
+  @PrimaryColumn({ type: 'uuid' })
+  userId: string;
+
+  @Column({ type: 'integer', default: 0 })
+  unread: number;
+
+  @UpdateDateColumn({ type: 'timestamp' })
+  updatedAt: Date;
+
+  // Relationships
+  @OneToOne(() => User, { onDelete: 'CASCADE' })
+  @JoinColumn({ name: 'userId' })
+  user: User;
+}
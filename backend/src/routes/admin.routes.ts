@@ -2,6 +2,8 @@ import { Router } from 'express';
 import adminController from '@/controllers/admin.controller';
 import { authenticate } from '@/middlewares/auth.middleware';
 import { requireAdmin } from '@/middlewares/admin.middleware';
+import { validate } from '@/middlewares/validation.middleware';
+import { broadcastNotificationSchema } from '@/validators/admin.validator';
 
 const router = Router();
 
@@ -16,6 +18,13 @@ router.use(requireAdmin);
  */
 router.get('/stats', adminController.getStats);
 
+/**
+ * @route   GET /api/v1/admin/metrics
+ * @desc    Métricas em memória da instância (ex: fila do pool de senhas, conexões SSE)
+ * @access  Private (Admin)
+ */
+router.get('/metrics', adminController.getMetrics);
+
 /**
  * @route   GET /api/v1/admin/users
  * @desc    Listar todos os usuários
@@ -25,11 +34,25 @@ router.get('/users', adminController.getUsers);
 
 /**
  * @route   POST /api/v1/admin/broadcast-notification
- * @desc    Enviar notificação em massa
+ * @desc    Enviar notificação em massa (202 com o id do envio; processado em lotes)
  * @access  Private (Admin)
  * @body    { title, message, type?, category?, onlyPremium? }
  */
-router.post('/broadcast-notification', adminController.broadcastNotification);
+router.post('/broadcast-notification', validate(broadcastNotificationSchema), adminController.broadcastNotification);
+
+/**
+ * @route   GET /api/v1/admin/broadcasts
+ * @desc    Listar os envios em massa mais recentes
+ * @access  Private (Admin)
+ */
+router.get('/broadcasts', adminController.getBroadcasts);
+
+/**
+ * @route   GET /api/v1/admin/broadcasts/:id
+ * @desc    Progresso de um envio em massa (status, sentCount/totalRecipients)
+ * @access  Private (Admin)
+ */
+router.get('/broadcasts/:id', adminController.getBroadcast);
 
 /**
  * @route   POST /api/v1/admin/send-notification/:userId
@@ -39,4 +62,26 @@ router.post('/broadcast-notification', adminController.broadcastNotification);
  */
 router.post('/send-notification/:userId', adminController.sendNotificationToUser);
 
+/**
+ * @route   GET /api/v1/admin/jobs
+ * @desc    Listar jobs agendados (lease, próxima execução e último status)
+ * @access  Private (Admin)
+ */
+router.get('/jobs', adminController.getJobs);
+
+/**
+ * @route   GET /api/v1/admin/jobs/:name/runs
+ * @desc    Histórico de execuções de um job
+ * @access  Private (Admin)
+ * @query   { limit? }
+ */
+router.get('/jobs/:name/runs', adminController.getJobRuns);
+
+/**
+ * @route   POST /api/v1/admin/jobs/:name/run
+ * @desc    Disparar um job manualmente (executado por uma única instância)
+ * @access  Private (Admin)
+ */
+router.post('/jobs/:name/run', adminController.triggerJob);
+
 export default router;
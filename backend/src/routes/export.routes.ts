@@ -0,0 +1,51 @@
+import { Router } from 'express';
+import * as exportController from '@/controllers/export.controller';
+import { authenticate } from '@/middlewares/auth.middleware';
+import { validateQuery } from '@/middlewares/validation.middleware';
+import { exportTransactionsSchema } from '@/validators/export.validator';
+
+const router = Router();
+
+// Todas as rotas de exportação requerem autenticação
+router.use(authenticate);
+
+/**
+ * @swagger
+ * /export:
+ *   get:
+ *     summary: Exportar transações em CSV, XLSX ou PDF (streaming)
+ *     tags: [Export]
+ *     security:
+ *       - bearerAuth: []
+ *     parameters:
+ *       - in: query
+ *         name: format
+ *         schema:
+ *           type: string
+ *           enum: [csv, xlsx, pdf]
+ *       - in: query
+ *         name: startDate
+ *         schema:
+ *           type: string
+ *           format: date
+ *       - in: query
+ *         name: endDate
+ *         schema:
+ *           type: string
+ *           format: date
+ *       - in: query
+ *         name: type
+ *         schema:
+ *           type: string
+ *           enum: [income, expense]
+ *       - in: query
+ *         name: categoryId
+ *         schema:
+ *           type: string
+ *     responses:
+ *       200:
+ *         description: Arquivo gerado à medida que as transações são lidas
+ */
+router.get('/', validateQuery(exportTransactionsSchema), exportController.exportTransactions);
+
+export default router;
@@ -0,0 +1,89 @@
+import { Router } from 'express';
+import * as exportController from '@/controllers/export.controller';
+import { authenticate } from '@/middlewares/auth.middleware';
+import { validate } from '@/middlewares/validation.middleware';
+import { exportTransactionsSchema } from '@/validators/export.validator';
+
+const router = Router();
+
+// Todas as rotas de exportação requerem autenticação
+router.use(authenticate);
+
+/**
+ * @swagger
+ * /exports:
+ *   post:
+ *     summary: Enfileirar exportação (gerada em segundo plano)
+ *     tags: [Export]
+ *     security:
+ *       - bearerAuth: []
+ *     requestBody:
+ *       required: true
+ *       content:
+ *         application/json:
+ *           schema:
+ *             type: object
+ *             properties:
+ *               format:
+ *                 type: string
+ *                 enum: [csv, xlsx, pdf]
+ *               startDate:
+ *                 type: string
+ *                 format: date
+ *               endDate:
+ *                 type: string
+ *                 format: date
+ *               type:
+ *                 type: string
+ *                 enum: [income, expense]
+ *               categoryId:
+ *                 type: string
+ *     responses:
+ *       202:
+ *         description: Exportação enfileirada
+ */
+router.post('/', validate(exportTransactionsSchema), exportController.createExportJob);
+
+/**
+ * @swagger
+ * /exports/{id}:
+ *   get:
+ *     summary: Status de uma exportação
+ *     tags: [Export]
+ *     security:
+ *       - bearerAuth: []
+ *     parameters:
+ *       - in: path
+ *         name: id
+ *         required: true
+ *         schema:
+ *           type: string
+ *     responses:
+ *       200:
+ *         description: Status da exportação
+ */
+router.get('/:id', exportController.getExportJob);
+
+/**
+ * @swagger
+ * /exports/{id}/download:
+ *   get:
+ *     summary: Baixar o arquivo gerado (suporta Range)
+ *     tags: [Export]
+ *     security:
+ *       - bearerAuth: []
+ *     parameters:
+ *       - in: path
+ *         name: id
+ *         required: true
+ *         schema:
+ *           type: string
+ *     responses:
+ *       200:
+ *         description: Arquivo completo
+ *       206:
+ *         description: Intervalo solicitado do arquivo
+ */
+router.get('/:id/download', exportController.downloadExportJob);
+
+export default router;
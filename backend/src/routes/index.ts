@@ -9,6 +9,10 @@ import userPreferenceRoutes from './userPreference.routes';
 import savingsGoalRoutes from './savingsGoal.routes';
 import notificationRoutes from './notification.routes';
 import adminRoutes from './admin.routes';
+import exportRoutes from './export.routes';
+import exportJobRoutes from './exportJob.routes';
+import reportRoutes from './report.routes';
+import syncRoutes from './sync.routes';
 
 const router = Router();
 
@@ -23,5 +27,9 @@ router.use('/user-preferences', userPreferenceRoutes);
 router.use('/savings-goals', savingsGoalRoutes);
 router.use('/notifications', notificationRoutes);
 router.use('/admin', adminRoutes);
+router.use('/export', exportRoutes);
+router.use('/exports', exportJobRoutes);
+router.use('/reports', reportRoutes);
+router.use('/sync', syncRoutes);
 
 export default router;
@@ -21,6 +21,13 @@ router.get('/', notificationController.getAll);
  */
 router.get('/unread-count', notificationController.getUnreadCount);
 
+/**
+ * @route   GET /api/v1/notifications/stream
+ * @desc    Stream SSE: contador de não lidas e novas notificações em tempo real
+ * @access  Private
+ */
+router.get('/stream', notificationController.stream);
+
 /**
  * @route   PUT /api/v1/notifications/:id/read
  * @desc    Marcar notificação como lida
@@ -0,0 +1,42 @@
+import { Router } from 'express';
+import * as reportController from '@/controllers/report.controller';
+import { authenticate } from '@/middlewares/auth.middleware';
+import { validateQuery } from '@/middlewares/validation.middleware';
+import { chartReportSchema } from '@/validators/report.validator';
+
+const router = Router();
+
+// Todas as rotas de relatórios requerem autenticação
+router.use(authenticate);
+
+/**
+ * @swagger
+ * /reports/chart:
+ *   get:
+ *     summary: Tendências de receitas/despesas, saldo acumulado e categorias
+ *     tags: [Reports]
+ *     security:
+ *       - bearerAuth: []
+ *     parameters:
+ *       - in: query
+ *         name: period
+ *         description: Quantidade de meses (1 a 24, incluindo o atual)
+ *         schema:
+ *           type: integer
+ *       - in: query
+ *         name: granularity
+ *         schema:
+ *           type: string
+ *           enum: [day, week, month]
+ *       - in: query
+ *         name: breakdown
+ *         schema:
+ *           type: string
+ *           enum: [period, current_month]
+ *     responses:
+ *       200:
+ *         description: income_trends, expense_trends, balance_trends e category_breakdown
+ */
+router.get('/chart', validateQuery(chartReportSchema), reportController.getChart);
+
+export default router;
@@ -0,0 +1,51 @@
+import { Router } from 'express';
+import * as syncController from '@/controllers/sync.controller';
+import { authenticate } from '@/middlewares/auth.middleware';
+import { validateQuery } from '@/middlewares/validation.middleware';
+import { syncChangesSchema } from '@/validators/sync.validator';
+
+const router = Router();
+
+// Todas as rotas de sincronização requerem autenticação
+router.use(authenticate);
+
+/**
+ * @swagger
+ * /sync/version:
+ *   get:
+ *     summary: Contadores de escrita por domínio (transações, categorias, metas, preferências)
+ *     tags: [Sync]
+ *     security:
+ *       - bearerAuth: []
+ *     responses:
+ *       200:
+ *         description: Versões obtidas com sucesso
+ *       304:
+ *         description: Nenhuma alteração desde o ETag informado
+ */
+router.get('/version', syncController.getVersion);
+
+/**
+ * @swagger
+ * /sync/changes:
+ *   get:
+ *     summary: Transações e categorias criadas, alteradas ou excluídas desde o cursor
+ *     description: Sem cursor (ou com cursor expirado) devolve a lista completa com full=true
+ *     tags: [Sync]
+ *     security:
+ *       - bearerAuth: []
+ *     parameters:
+ *       - in: query
+ *         name: since
+ *         schema:
+ *           type: string
+ *         description: Cursor devolvido pela sincronização anterior
+ *     responses:
+ *       200:
+ *         description: Alterações obtidas com sucesso
+ *       400:
+ *         description: Cursor de sincronização inválido
+ */
+router.get('/changes', validateQuery(syncChangesSchema), syncController.getChanges);
+
+export default router;
@@ -1,8 +1,11 @@
 import { Router } from 'express';
 import * as transactionController from '@/controllers/transaction.controller';
+import * as importController from '@/controllers/import.controller';
 import { authenticate } from '@/middlewares/auth.middleware';
 import { validate, validateQuery } from '@/middlewares/validation.middleware';
-import { createTransactionSchema, updateTransactionSchema, filterTransactionsSchema } from '@/validators/transaction.validator';
+import { uploadStatement } from '@/middlewares/upload.middleware';
+import { createTransactionSchema, updateTransactionSchema, filterTransactionsSchema, bulkCreateTransactionSchema } from '@/validators/transaction.validator';
+import { importStatementSchema, createImportRuleSchema } from '@/validators/import.validator';
 
 const router = Router();
 
@@ -52,6 +55,16 @@ router.use(authenticate);
  *         schema:
  *           type: string
  *           enum: [asc, desc]
+ *       - in: query
+ *         name: cursor
+ *         description: Ativa a paginação por cursor (vazio na primeira página, depois o meta.nextCursor)
+ *         schema:
+ *           type: string
+ *       - in: query
+ *         name: includeTotal
+ *         description: Calcula o total de registros no modo cursor
+ *         schema:
+ *           type: boolean
  *     responses:
  *       200:
  *         description: Transações obtidas com sucesso
@@ -91,6 +104,102 @@ router.get('/', validateQuery(filterTransactionsSchema), transactionController.f
  */
 router.post('/', validate(createTransactionSchema), transactionController.create);
 
+/**
+ * @swagger
+ * /transactions/bulk:
+ *   post:
+ *     summary: Criar transações em lote (até 10000 por requisição)
+ *     tags: [Transactions]
+ *     security:
+ *       - bearerAuth: []
+ *     requestBody:
+ *       required: true
+ *       content:
+ *         application/json:
+ *           schema:
+ *             type: object
+ *             properties:
+ *               transactions:
+ *                 type: array
+ *                 items:
+ *                   type: object
+ *     responses:
+ *       201:
+ *         description: Transações criadas com o resultado de cada linha
+ *       422:
+ *         description: Nenhuma transação válida no lote
+ */
+router.post('/bulk', validate(bulkCreateTransactionSchema), transactionController.createBulk);
+
+/**
+ * @swagger
+ * /transactions/import:
+ *   post:
+ *     summary: Importar extrato CSV/OFX (processado em segundo plano)
+ *     tags: [Transactions]
+ *     security:
+ *       - bearerAuth: []
+ *     requestBody:
+ *       required: true
+ *       content:
+ *         multipart/form-data:
+ *           schema:
+ *             type: object
+ *             properties:
+ *               file:
+ *                 type: string
+ *                 format: binary
+ *               format:
+ *                 type: string
+ *                 enum: [csv, ofx]
+ *               defaultIncomeCategoryId:
+ *                 type: string
+ *               defaultExpenseCategoryId:
+ *                 type: string
+ *     responses:
+ *       202:
+ *         description: Importação iniciada (acompanhe pelo ID do job)
+ */
+router.post('/import', uploadStatement, validate(importStatementSchema), importController.importStatement);
+
+/**
+ * @swagger
+ * /transactions/import/{jobId}:
+ *   get:
+ *     summary: Progresso de uma importação de extrato
+ *     tags: [Transactions]
+ *     security:
+ *       - bearerAuth: []
+ *     parameters:
+ *       - in: path
+ *         name: jobId
+ *         required: true
+ *         schema:
+ *           type: string
+ *     responses:
+ *       200:
+ *         description: Status e contadores da importação
+ */
+router.get('/import/:jobId', importController.getImportJob);
+
+/**
+ * @swagger
+ * /transactions/import-rules:
+ *   get:
+ *     summary: Listar regras de categorização da importação
+ *     tags: [Transactions]
+ *     security:
+ *       - bearerAuth: []
+ *   post:
+ *     summary: Criar regra (trecho da descrição -> categoria)
+ *     tags: [Transactions]
+ *     security:
+ *       - bearerAuth: []
+ */
+router.get('/import-rules', importController.findRules);
+router.post('/import-rules', validate(createImportRuleSchema), importController.createRule);
+router.delete('/import-rules/:id', importController.removeRule);
+
 /**
  * @swagger
  * /transactions/{id}:
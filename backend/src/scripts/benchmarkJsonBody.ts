@@ -0,0 +1,96 @@
+import { normalizeDateStrings } from '../middlewares/jsonBody.middleware';
+import { logger } from '../utils/logger';
+
+/**
+ * Micro-benchmark do parsing de corpos JSON grandes (criação em lote).
+ * "antes" reproduz o middleware antigo: JSON.parse com reviver + regex em toda
+ * string e uma cópia profunda em convertDatesToStrings (sem o console.log por
+ * data, que só tornaria o antes mais lento). "depois" é JSON.parse simples
+ * seguido de uma passada in-place de normalizeDateStrings.
+ * Uso: npm run bench:json [-- <linhas> <iterações>]
+ */
+const [rowCount = 5000, iterations = 50] = process.argv.slice(2).map(Number);
+
+const isoDateRegex = /^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d{3})?Z?$/;
+
+const convertDatesToStrings = (obj: any): any => {
+  if (obj === null || obj === undefined) return obj;
+  if (obj instanceof Date) return obj.toISOString().split('T')[0];
+  if (Array.isArray(obj)) return obj.map(convertDatesToStrings);
+  if (typeof obj === 'object') {
+    const converted: any = {};
+    for (const key in obj) {
+      converted[key] = convertDatesToStrings(obj[key]);
+    }
+    return converted;
+  }
+  return obj;
+};
+
+const parsers: { label: string; parse: (raw: string) => any }[] = [
+  {
+    label: 'antes (reviver + cópia)',
+    parse: (raw) =>
+      convertDatesToStrings(
+        JSON.parse(raw, (_key, value) =>
+          typeof value === 'string' && isoDateRegex.test(value) ? value.split('T')[0] : value
+        )
+      ),
+  },
+  {
+    label: 'depois (parse + passada única)',
+    parse: (raw) => normalizeDateStrings(JSON.parse(raw)),
+  },
+];
+
+const buildPayload = () => {
+  const transactions = Array.from({ length: rowCount }, (_, index) => ({
+    type: index % 3 === 0 ? 'income' : 'expense',
+    amount: Math.round(Math.random() * 100000) / 100,
+    description: `Lançamento ${index}`,
+    date: new Date(2024, index % 12, (index % 28) + 1).toISOString(),
+    categoryId: '6f1c2b1e-1234-4abc-9def-0123456789ab',
+    isRecurring: false,
+  }));
+  return JSON.stringify({ transactions });
+};
+
+function benchmarkJsonBody() {
+  const raw = buildPayload();
+  const sizeMb = Buffer.byteLength(raw) / 1024 / 1024;
+
+  logger.info(`📊 ${rowCount} linhas (${sizeMb.toFixed(2)} MB), ${iterations} iterações`);
+
+  for (const { label, parse } of parsers) {
+    // Aquecimento do JIT
+    for (let index = 0; index < 5; index++) {
+      parse(raw);
+    }
+
+    const heapBefore = process.memoryUsage().heapUsed;
+    const startedAt = process.hrtime.bigint();
+    let result: any;
+    for (let index = 0; index < iterations; index++) {
+      result = parse(raw);
+    }
+    const elapsedMs = Number(process.hrtime.bigint() - startedAt) / 1e6;
+
+    if (result.transactions[0].date.length !== 10) {
+      throw new Error(`${label}: data não normalizada`);
+    }
+
+    logger.info(`⚡ ${label}`, {
+      msPerBody: Math.round((elapsedMs / iterations) * 100) / 100,
+      mbPerSecond: Math.round((sizeMb * iterations) / (elapsedMs / 1000)),
+      heapDeltaMb: Math.round((process.memoryUsage().heapUsed - heapBefore) / 1024 / 1024),
+    });
+  }
+}
+
+try {
+  benchmarkJsonBody();
+  process.exit(0);
+} catch (error) {
+  logger.error('❌ Erro no benchmark de JSON:', error);
+  process.exit(1);
+}
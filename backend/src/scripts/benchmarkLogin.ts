@@ -0,0 +1,79 @@
+import bcrypt from 'bcryptjs';
+import { monitorEventLoopDelay } from 'perf_hooks';
+import { config } from '../config/env';
+import passwordHasher from '../services/passwordHasher.service';
+import { logger } from '../utils/logger';
+
+/**
+ * Benchmark antes/depois da verificação de senha do login.
+ * "antes" compara com bcryptjs na thread principal (como User.comparePassword fazia);
+ * "depois" usa o pool de worker threads. Mostra logins/s e o atraso do event loop,
+ * que é o que as demais requisições sentem enquanto os logins são processados.
+ * Uso: npm run bench:login [-- <total> <concorrência>]
+ */
+const [total = 200, concurrency = 32] = process.argv.slice(2).map(Number);
+
+const percentile = (values: number[], p: number) => {
+  const sorted = [...values].sort((a, b) => a - b);
+  return sorted[Math.min(sorted.length - 1, Math.floor((p / 100) * sorted.length))];
+};
+
+async function measure(label: string, compare: (password: string, hash: string) => Promise<boolean>, hash: string) {
+  const latencies: number[] = [];
+  const loopDelay = monitorEventLoopDelay({ resolution: 10 });
+  let remaining = total;
+
+  loopDelay.enable();
+  const startedAt = process.hrtime.bigint();
+
+  await Promise.all(
+    Array.from({ length: Math.min(concurrency, total) }, async () => {
+      while (remaining > 0) {
+        remaining--;
+        const requestStart = process.hrtime.bigint();
+        if (!(await compare('demo123', hash))) {
+          throw new Error('Senha não confere');
+        }
+        latencies.push(Number(process.hrtime.bigint() - requestStart) / 1e6);
+      }
+    })
+  );
+
+  const elapsedMs = Number(process.hrtime.bigint() - startedAt) / 1e6;
+  loopDelay.disable();
+
+  logger.info(`🔐 ${label}`, {
+    logins: total,
+    loginsPerSecond: Math.round((total / elapsedMs) * 1000),
+    p50Ms: Math.round(percentile(latencies, 50)),
+    p99Ms: Math.round(percentile(latencies, 99)),
+    eventLoopDelayP99Ms: Math.round(loopDelay.percentile(99) / 1e6),
+    eventLoopDelayMaxMs: Math.round(loopDelay.max / 1e6),
+  });
+}
+
+async function benchmarkLogin() {
+  const hash = await bcrypt.hash('demo123', config.passwordHashing.rounds);
+
+  logger.info(`📊 ${total} logins, concorrência ${concurrency}, custo ${config.passwordHashing.rounds}`);
+
+  await measure('antes (thread principal)', (password, stored) => bcrypt.compare(password, stored), hash);
+
+  // Aquecer o pool para não contar a criação dos workers
+  await passwordHasher.compare('demo123', hash);
+  await measure(
+    `depois (pool com ${passwordHasher.getStats().poolSize} workers)`,
+    (password, stored) => passwordHasher.compare(password, stored),
+    hash
+  );
+
+  logger.info('📈 Pool', passwordHasher.getStats());
+  await passwordHasher.stop();
+}
+
+benchmarkLogin()
+  .then(() => process.exit(0))
+  .catch((error) => {
+    logger.error('❌ Erro no benchmark de login:', error);
+    process.exit(1);
+  });
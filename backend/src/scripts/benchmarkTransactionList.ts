@@ -0,0 +1,148 @@
+import 'reflect-metadata';
+import http from 'http';
+import { AddressInfo } from 'net';
+import app from '../app';
+import { AppDataSource } from '../config/database';
+import { config } from '../config/env';
+import { TransactionService } from '../services/transaction.service';
+import { generateAccessToken } from '../utils/jwt';
+import { logger } from '../utils/logger';
+import { serializers } from '../utils/serializers';
+
+/**
+ * Benchmark da listagem de transações para o usuário com mais transações.
+ * 1) Serialização de uma página de 500, lida direto do serviço: caminho antigo
+ *    (cópia de cada entidade para reescrever a data + res.json) contra o serializer compilado.
+ * 2) Requisições/s de GET /transactions?limit=100 (máximo da API) contra a API real,
+ *    servida em uma porta local temporária.
+ * Uso: npm run bench:transactions [-- <segundos> <concorrência>]
+ */
+const [seconds = 10, concurrency = 16] = process.argv.slice(2).map(Number);
+const PAGE_SIZE = 500;
+// Limite máximo aceito por filterTransactionsSchema
+const API_PAGE_SIZE = 100;
+
+const toDateString = (value: any) =>
+  value instanceof Date ? value.toISOString().split('T')[0] : String(value).split('T')[0];
+
+const request = (port: number, path: string, token: string): Promise<number> =>
+  new Promise((resolve, reject) => {
+    http
+      .get({ port, path, headers: { Authorization: `Bearer ${token}` } }, (res) => {
+        res.resume();
+        res.on('end', () => resolve(res.statusCode || 0));
+      })
+      .on('error', reject);
+  });
+
+function measureSerialization(transactions: any[]) {
+  const meta = { page: 1, limit: PAGE_SIZE, total: transactions.length, totalPages: 1 };
+  const candidates: { label: string; run: () => string }[] = [
+    {
+      label: 'antes (cópia + JSON.stringify)',
+      run: () =>
+        JSON.stringify({
+          success: true,
+          message: 'Transações obtidas com sucesso',
+          data: transactions.map((t) => ({ ...t, date: toDateString(t.date) })),
+          meta,
+        }),
+    },
+    {
+      label: 'depois (serializer compilado)',
+      run: () =>
+        `{"success":true,"message":"Transações obtidas com sucesso","data":${serializers.transactionList(transactions)},"meta":${JSON.stringify(meta)}}`,
+    },
+  ];
+
+  for (const { label, run } of candidates) {
+    for (let index = 0; index < 20; index++) {
+      run();
+    }
+
+    const iterations = 200;
+    const startedAt = process.hrtime.bigint();
+    for (let index = 0; index < iterations; index++) {
+      run();
+    }
+    const elapsedMs = Number(process.hrtime.bigint() - startedAt) / 1e6;
+
+    logger.info(`🧮 ${label}`, {
+      msPerPage: Math.round((elapsedMs / iterations) * 100) / 100,
+      pagesPerSecond: Math.round(iterations / (elapsedMs / 1000)),
+    });
+  }
+}
+
+async function measureHttp(token: string) {
+  const server = app.listen(0);
+  const { port } = server.address() as AddressInfo;
+  const path = `${config.apiPrefix}/transactions?limit=${API_PAGE_SIZE}`;
+  const latencies: number[] = [];
+  const deadline = Date.now() + seconds * 1000;
+  let failures = 0;
+
+  try {
+    await Promise.all(
+      Array.from({ length: concurrency }, async () => {
+        while (Date.now() < deadline) {
+          const startedAt = process.hrtime.bigint();
+          const status = await request(port, path, token);
+          if (status !== 200) {
+            failures++;
+          }
+          latencies.push(Number(process.hrtime.bigint() - startedAt) / 1e6);
+        }
+      })
+    );
+  } finally {
+    server.close();
+  }
+
+  latencies.sort((a, b) => a - b);
+  logger.info(`🌐 GET ${path}`, {
+    requests: latencies.length,
+    failures,
+    requestsPerSecond: Math.round(latencies.length / seconds),
+    p50Ms: Math.round(latencies[Math.floor(latencies.length * 0.5)] || 0),
+    p99Ms: Math.round(latencies[Math.floor(latencies.length * 0.99)] || 0),
+  });
+}
+
+async function benchmarkTransactionList() {
+  try {
+    await AppDataSource.initialize();
+
+    const [heaviest] = await AppDataSource.query(
+      `SELECT t."userId", u.email, u.role, COUNT(*) AS total
+       FROM transactions t
+       INNER JOIN users u ON u.id = t."userId"
+       GROUP BY t."userId", u.email, u.role
+       ORDER BY total DESC
+       LIMIT 1`
+    );
+    if (!heaviest) {
+      logger.warn('⚠️  Nenhuma transação encontrada para o benchmark');
+      return;
+    }
+
+    logger.info(`📊 Usuário ${heaviest.userId} (${heaviest.total} transações), página de ${PAGE_SIZE}`);
+
+    const { transactions } = await new TransactionService().findAll(heaviest.userId, { limit: PAGE_SIZE });
+    measureSerialization(transactions);
+
+    const token = generateAccessToken({ userId: heaviest.userId, email: heaviest.email, role: heaviest.role });
+    await measureHttp(token);
+  } finally {
+    if (AppDataSource.isInitialized) {
+      await AppDataSource.destroy();
+    }
+  }
+}
+
+benchmarkTransactionList()
+  .then(() => process.exit(0))
+  .catch((error) => {
+    logger.error('❌ Erro no benchmark de transações:', error);
+    process.exit(1);
+  });
@@ -0,0 +1,161 @@
+import 'reflect-metadata';
+import { AppDataSource } from '../config/database';
+import { Transaction } from '../models/Transaction';
+import dashboardCache from '../services/dashboardCache.service';
+import dataVersionService from '../services/dataVersion.service';
+import monthlyTotalsService from '../services/monthlyTotals.service';
+import syncService from '../services/sync.service';
+import { TransactionService } from '../services/transaction.service';
+import { logger } from '../utils/logger';
+
+/**
+ * Benchmark antes/depois de create/update/delete de transações (latência p50/p99).
+ * "antes" reproduz o caminho antigo: SELECT de diagnóstico, BEGIN/INSERT/totais/COMMIT
+ * e findOne com a categoria; update e delete com findOne travado antes da escrita
+ * (os console.log de depuração foram deixados de fora).
+ * "depois" usa o TransactionService atual, com um único comando por escrita.
+ * Cada ciclo cria, altera e exclui a própria transação, sem deixar dados.
+ * Uso: npm run bench:writes [-- <ciclos>]
+ */
+const [cycles = 300] = process.argv.slice(2).map(Number);
+
+const percentile = (values: number[], p: number) => {
+  const sorted = [...values].sort((a, b) => a - b);
+  return sorted[Math.min(sorted.length - 1, Math.floor((p / 100) * sorted.length))];
+};
+
+interface WritePath {
+  create: (userId: string, data: any) => Promise<Transaction>;
+  update: (id: string, userId: string, data: any) => Promise<unknown>;
+  delete: (id: string, userId: string) => Promise<unknown>;
+}
+
+const legacyPath = (): WritePath => {
+  const repository = AppDataSource.getRepository(Transaction);
+
+  return {
+    create: async (userId, data) => {
+      await repository.query(
+        `SELECT $1::date as test_date, CURRENT_TIMESTAMP as current_time, current_setting('TIMEZONE') as timezone`,
+        [data.date]
+      );
+      const result = await AppDataSource.transaction(async (manager) => {
+        const { transactions: syncVersion } = await dataVersionService.bump(manager, userId, 'transactions');
+        const inserted = await manager.query(
+          `INSERT INTO transactions (type, amount, description, date, "categoryId", "userId", "isRecurring", "syncVersion", "createdAt", "updatedAt")
+           VALUES ($1, $2, $3, $4, $5, $6, false, $7, NOW(), NOW())
+           RETURNING id`,
+          [data.type, data.amount, data.description, data.date, data.categoryId, userId, syncVersion]
+        );
+        await monthlyTotalsService.apply(manager, { ...data, userId });
+        return inserted;
+      });
+      await dashboardCache.invalidateDates(userId, [data.date]);
+
+      return (await repository.findOne({ where: { id: result[0].id }, relations: ['category'] }))!;
+    },
+    update: async (id, userId, data) => {
+      const dates = await AppDataSource.transaction(async (manager) => {
+        const transaction = await manager.getRepository(Transaction).findOne({
+          where: { id, userId },
+          lock: { mode: 'pessimistic_write' },
+        });
+        const previousDate = transaction!.date;
+        await monthlyTotalsService.apply(manager, transaction!, -1);
+        const { transactions: syncVersion } = await dataVersionService.bump(manager, userId, 'transactions');
+        Object.assign(transaction!, data, { syncVersion: String(syncVersion) });
+        await manager.getRepository(Transaction).save(transaction!);
+        await monthlyTotalsService.apply(manager, transaction!, 1);
+        return [previousDate, transaction!.date];
+      });
+      await dashboardCache.invalidateDates(userId, dates);
+
+      return repository.findOne({ where: { id }, relations: ['category'] });
+    },
+    delete: async (id, userId) => {
+      const date = await AppDataSource.transaction(async (manager) => {
+        const transaction = await manager.getRepository(Transaction).findOne({
+          where: { id, userId },
+          lock: { mode: 'pessimistic_write' },
+        });
+        await manager.getRepository(Transaction).remove(transaction!);
+        await monthlyTotalsService.apply(manager, transaction!, -1);
+        const { transactions: syncVersion } = await dataVersionService.bump(manager, userId, 'transactions');
+        await syncService.recordDeletions(manager, userId, 'transaction', [id], syncVersion);
+        return transaction!.date;
+      });
+      await dashboardCache.invalidateDates(userId, [date]);
+    },
+  };
+};
+
+async function measure(label: string, path: WritePath, userId: string, categoryId: string) {
+  const latencies: Record<'create' | 'update' | 'delete', number[]> = { create: [], update: [], delete: [] };
+  const time = async <T>(op: keyof typeof latencies, run: () => Promise<T>): Promise<T> => {
+    const startedAt = process.hrtime.bigint();
+    const result = await run();
+    latencies[op].push(Number(process.hrtime.bigint() - startedAt) / 1e6);
+    return result;
+  };
+
+  for (let cycle = 0; cycle < cycles; cycle++) {
+    const created = await time('create', () =>
+      path.create(userId, {
+        type: 'expense',
+        amount: 12.34,
+        description: `Benchmark ${cycle}`,
+        date: '2024-01-15',
+        categoryId,
+      })
+    );
+    await time('update', () => path.update(created.id, userId, { amount: 56.78, description: `Benchmark ${cycle} (editada)` }));
+    await time('delete', () => path.delete(created.id, userId));
+  }
+
+  for (const [op, values] of Object.entries(latencies)) {
+    logger.info(`✍️  ${label} ${op}`, {
+      operations: values.length,
+      p50Ms: Math.round(percentile(values, 50) * 100) / 100,
+      p99Ms: Math.round(percentile(values, 99) * 100) / 100,
+    });
+  }
+}
+
+async function benchmarkTransactionWrites() {
+  try {
+    await AppDataSource.initialize();
+
+    const [category] = await AppDataSource.query(
+      `SELECT id, "userId" FROM categories WHERE type = 'expense' ORDER BY "createdAt" LIMIT 1`
+    );
+    if (!category) {
+      logger.warn('⚠️  Nenhuma categoria de despesa encontrada para o benchmark');
+      return;
+    }
+
+    logger.info(`📊 ${cycles} ciclos create/update/delete para o usuário ${category.userId}`);
+
+    const service = new TransactionService();
+    const currentPath: WritePath = {
+      create: (userId, data) => service.create(userId, data),
+      update: (id, userId, data) => service.update(id, userId, data),
+      delete: (id, userId) => service.delete(id, userId),
+    };
+
+    // Aquecimento de conexões e planos antes de medir
+    await measure('aquecimento', currentPath, category.userId, category.id);
+    await measure('antes', legacyPath(), category.userId, category.id);
+    await measure('depois', currentPath, category.userId, category.id);
+  } finally {
+    if (AppDataSource.isInitialized) {
+      await AppDataSource.destroy();
+    }
+  }
+}
+
+benchmarkTransactionWrites()
+  .then(() => process.exit(0))
+  .catch((error) => {
+    logger.error('❌ Erro no benchmark de escritas:', error);
+    process.exit(1);
+  });
@@ -0,0 +1,302 @@
+import 'reflect-metadata';
+import { QueryRunner } from 'typeorm';
+import { AppDataSource } from '../config/database';
+import { logger } from '../utils/logger';
+
+/**
+ * Guarda de planos de execução das consultas quentes.
+ * Popula uma massa grande de dados dentro de uma transação, roda
+ * EXPLAIN (ANALYZE, BUFFERS) para cada consulta emitida pelos services e
+ * desfaz tudo no final. Falha (exit 1) se alguma consulta usar Seq Scan
+ * em uma das tabelas monitoradas.
+ * Uso: npm run db:check-plans [-- <usuarios> <transacoesPorUsuario> <notificacoesPorUsuario>]
+ */
+const GUARDED_TABLES = ['transactions', 'notifications', 'user_monthly_totals'];
+
+interface PlanContext {
+  userId: string;
+  categoryId: string;
+  startDate: string;
+  endDate: string;
+  year: number;
+  month: number;
+  cursorDate: string;
+  cursorCreatedAt: string;
+  cursorId: string;
+}
+
+interface HotQuery {
+  name: string;
+  sql: string;
+  params: (ctx: PlanContext) => any[];
+}
+
+// Espelho das consultas dos services (mantenha em sincronia ao criar novas)
+const HOT_QUERIES: HotQuery[] = [
+  {
+    name: 'TransactionService.findAll (offset)',
+    sql: `SELECT t.*, c.* FROM transactions t
+          LEFT JOIN categories c ON c.id = t."categoryId"
+          WHERE t."userId" = $1 AND t.date BETWEEN $2 AND $3
+          ORDER BY t.date DESC LIMIT 10 OFFSET 0`,
+    params: (ctx) => [ctx.userId, ctx.startDate, ctx.endDate],
+  },
+  {
+    name: 'TransactionService.findAll (count)',
+    sql: `SELECT COUNT(*) FROM transactions t
+          WHERE t."userId" = $1 AND t.date BETWEEN $2 AND $3`,
+    params: (ctx) => [ctx.userId, ctx.startDate, ctx.endDate],
+  },
+  {
+    name: 'TransactionService.findAll (type)',
+    sql: `SELECT t.* FROM transactions t
+          WHERE t."userId" = $1 AND t.type = 'expense' AND t.date BETWEEN $2 AND $3
+          ORDER BY t.date DESC LIMIT 10`,
+    params: (ctx) => [ctx.userId, ctx.startDate, ctx.endDate],
+  },
+  {
+    name: 'TransactionService.findAll (categoryId)',
+    sql: `SELECT t.* FROM transactions t
+          WHERE t."userId" = $1 AND t."categoryId" = $2 AND t.date BETWEEN $3 AND $4
+          ORDER BY t.date DESC LIMIT 10`,
+    params: (ctx) => [ctx.userId, ctx.categoryId, ctx.startDate, ctx.endDate],
+  },
+  {
+    name: 'TransactionService.findAllByCursor',
+    sql: `SELECT t.*, c.* FROM transactions t
+          LEFT JOIN categories c ON c.id = t."categoryId"
+          WHERE t."userId" = $1
+            AND (t.date, t."createdAt", t.id) < ($2, CAST($3 AS timestamp), $4)
+          ORDER BY t.date DESC, t."createdAt" DESC, t.id DESC LIMIT 11`,
+    params: (ctx) => [ctx.userId, ctx.cursorDate, ctx.cursorCreatedAt, ctx.cursorId],
+  },
+  {
+    name: 'TransactionService.getDashboardData (recentes)',
+    sql: `SELECT t.*, c.* FROM transactions t
+          LEFT JOIN categories c ON c.id = t."categoryId"
+          WHERE t."userId" = $1 AND t.date BETWEEN $2 AND $3
+          ORDER BY t.date DESC, t."createdAt" DESC LIMIT 10`,
+    params: (ctx) => [ctx.userId, ctx.startDate, ctx.endDate],
+  },
+  {
+    name: 'TransactionService.findById',
+    sql: `SELECT t.* FROM transactions t WHERE t.id = $1 AND t."userId" = $2`,
+    params: (ctx) => [ctx.cursorId, ctx.userId],
+  },
+  {
+    name: 'ExportService.streamTransactions',
+    sql: `SELECT t.date, t.description, c.name, t.type, t.amount FROM transactions t
+          LEFT JOIN categories c ON c.id = t."categoryId"
+          WHERE t."userId" = $1 AND t.date >= $2 AND t.date <= $3
+          ORDER BY t.date DESC, t."createdAt" DESC, t.id DESC`,
+    params: (ctx) => [ctx.userId, ctx.startDate, ctx.endDate],
+  },
+  {
+    name: 'MonthlyTotalsService.getCategoryTotals',
+    sql: `SELECT c.name, umt.type, MIN(c.color), MIN(c.icon), SUM(umt.total)
+          FROM user_monthly_totals umt
+          INNER JOIN categories c ON c.id = umt."categoryId"
+          WHERE umt."userId" = $1 AND umt.year = $2 AND umt.month = $3 AND umt.count > 0
+          GROUP BY c.name, umt.type`,
+    params: (ctx) => [ctx.userId, ctx.year, ctx.month],
+  },
+  {
+    name: 'MonthlyTotalsService.getMonthSummary',
+    sql: `SELECT SUM(CASE WHEN type = 'income' THEN total ELSE 0 END),
+                 SUM(CASE WHEN type = 'expense' THEN total ELSE 0 END)
+          FROM user_monthly_totals
+          WHERE "userId" = $1 AND year = $2 AND month = $3`,
+    params: (ctx) => [ctx.userId, ctx.year, ctx.month],
+  },
+  {
+    name: 'RecurrenceService.processRecurringTransactions',
+    sql: `SELECT t.id FROM transactions t
+          WHERE t."isRecurring" = true AND t."nextOccurrence" <= NOW()
+            AND t.id <> ALL($1::uuid[])
+            AND ($2::uuid[] IS NULL OR t.id = ANY($2::uuid[]))
+          ORDER BY t."nextOccurrence", t.id LIMIT 500`,
+    params: () => [[], null],
+  },
+  {
+    name: 'RecurrenceService.getGeneratedTransactions',
+    sql: `SELECT t.* FROM transactions t
+          WHERE t."parentTransactionId" = $1 ORDER BY t.date DESC`,
+    params: (ctx) => [ctx.cursorId],
+  },
+  {
+    name: 'NotificationService.findAll',
+    sql: `SELECT n.* FROM notifications n
+          WHERE n."userId" = $1 ORDER BY n."createdAt" DESC LIMIT 50`,
+    params: (ctx) => [ctx.userId],
+  },
+  {
+    name: 'NotificationService.findAll (onlyUnread)',
+    sql: `SELECT n.* FROM notifications n
+          WHERE n."userId" = $1 AND n."isRead" = false ORDER BY n."createdAt" DESC LIMIT 50`,
+    params: (ctx) => [ctx.userId],
+  },
+  {
+    name: 'NotificationService.countUnread',
+    sql: `SELECT unread FROM user_notification_counters WHERE "userId" = $1`,
+    params: (ctx) => [ctx.userId],
+  },
+];
+
+/**
+ * Popula usuários, categorias, transações, totais e notificações sintéticos
+ */
+async function seedDataset(
+  queryRunner: QueryRunner,
+  users: number,
+  transactionsPerUser: number,
+  notificationsPerUser: number
+): Promise<string[]> {
+  const seededUsers = await queryRunner.query(
+    `INSERT INTO users (name, email, password)
+     SELECT 'Plan Check ' || g, 'plan-check-' || g || '-' || md5(random()::text) || '@fincontrol.local', 'x'
+     FROM generate_series(1, $1) g
+     RETURNING id`,
+    [users]
+  );
+  const userIds: string[] = seededUsers.map((row: any) => row.id);
+
+  // Literais são convertidos para o enum da coluna, por isso um INSERT por tipo
+  for (const type of ['income', 'expense']) {
+    await queryRunner.query(
+      `INSERT INTO categories (name, type, color, icon, "userId")
+       SELECT '${type} ' || g, '${type}', '#6b7280', 'Tag', u.id
+       FROM unnest($1::uuid[]) AS u(id), generate_series(1, 3) g`,
+      [userIds]
+    );
+
+    await queryRunner.query(
+      `INSERT INTO transactions (type, amount, description, date, "categoryId", "userId", "isRecurring", "nextOccurrence", "createdAt", "updatedAt")
+       SELECT '${type}',
+              (random() * 1000)::numeric(12,2),
+              'Plan check ' || g,
+              CURRENT_DATE - (g % 1460),
+              c.id,
+              c."userId",
+              g % 500 = 0,
+              CASE WHEN g % 500 = 0 THEN NOW() + ((g % 30) || ' days')::interval END,
+              NOW() - (g || ' minutes')::interval,
+              NOW()
+       FROM categories c
+       CROSS JOIN generate_series(1, $2) g
+       WHERE c."userId" = ANY($1::uuid[]) AND c.type = '${type}'`,
+      [userIds, Math.ceil(transactionsPerUser / 6)]
+    );
+  }
+
+  await queryRunner.query(
+    `INSERT INTO user_monthly_totals ("userId", year, month, "categoryId", type, total, count)
+     SELECT "userId", EXTRACT(YEAR FROM date)::smallint, EXTRACT(MONTH FROM date)::smallint,
+            "categoryId", type::text, SUM(amount), COUNT(*)
+     FROM transactions
+     WHERE "userId" = ANY($1::uuid[])
+     GROUP BY 1, 2, 3, 4, 5`,
+    [userIds]
+  );
+
+  await queryRunner.query(
+    `INSERT INTO notifications ("userId", title, message, type, category, "isRead", "createdAt", "updatedAt")
+     SELECT u.id, 'Plan check', 'Plan check ' || g, 'info', 'system', g % 3 <> 0,
+            NOW() - (g || ' hours')::interval, NOW()
+     FROM unnest($1::uuid[]) AS u(id), generate_series(1, $2) g`,
+    [userIds, notificationsPerUser]
+  );
+
+  // Estatísticas atualizadas para o planner enxergar o volume real
+  await queryRunner.query(`ANALYZE transactions, notifications, categories, user_monthly_totals`);
+
+  return userIds;
+}
+
+/**
+ * Lista os nós de Seq Scan em tabelas monitoradas
+ */
+const findSequentialScans = (plan: any, found: string[] = []): string[] => {
+  // Partições mensais (ex: notifications_y2026m10) contam como a tabela particionada
+  const table = String(plan['Relation Name'] || '').replace(/_y\d{4}m\d{2}$/, '');
+  if (plan['Node Type'] === 'Seq Scan' && GUARDED_TABLES.includes(table)) {
+    found.push(plan['Relation Name']);
+  }
+  (plan.Plans || []).forEach((child: any) => findSequentialScans(child, found));
+  return found;
+};
+
+async function checkQueryPlans(): Promise<boolean> {
+  const [users = '200', transactionsPerUser = '1000', notificationsPerUser = '200'] = process.argv.slice(2);
+
+  await AppDataSource.initialize();
+  const queryRunner = AppDataSource.createQueryRunner();
+  await queryRunner.connect();
+  await queryRunner.startTransaction();
+
+  try {
+    logger.info(`🌱 Populando ${users} usuário(s) x ${transactionsPerUser} transações / ${notificationsPerUser} notificações...`);
+    const userIds = await seedDataset(queryRunner, Number(users), Number(transactionsPerUser), Number(notificationsPerUser));
+
+    const [sample] = await queryRunner.query(
+      `SELECT id, "categoryId", date::text as date, "createdAt"::text as "createdAt"
+       FROM transactions WHERE "userId" = $1
+       ORDER BY date DESC, "createdAt" DESC, id DESC OFFSET 500 LIMIT 1`,
+      [userIds[0]]
+    );
+
+    const now = new Date();
+    const ctx: PlanContext = {
+      userId: userIds[0],
+      categoryId: sample.categoryId,
+      startDate: `${now.getFullYear()}-${String(now.getMonth() + 1).padStart(2, '0')}-01`,
+      endDate: now.toISOString().split('T')[0],
+      year: now.getFullYear(),
+      month: now.getMonth() + 1,
+      cursorDate: sample.date,
+      cursorCreatedAt: sample.createdAt,
+      cursorId: sample.id,
+    };
+
+    let failures = 0;
+    for (const query of HOT_QUERIES) {
+      const [{ 'QUERY PLAN': [explain] }] = await queryRunner.query(
+        `EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) ${query.sql}`,
+        query.params(ctx)
+      );
+
+      const seqScans = findSequentialScans(explain.Plan);
+      const summary = {
+        executionMs: explain['Execution Time'],
+        sharedHit: explain.Plan['Shared Hit Blocks'],
+        sharedRead: explain.Plan['Shared Read Blocks'],
+      };
+
+      if (seqScans.length > 0) {
+        failures++;
+        logger.error(`❌ ${query.name}: Seq Scan em ${seqScans.join(', ')}`, summary);
+      } else {
+        logger.info(`✅ ${query.name}`, summary);
+      }
+    }
+
+    if (failures > 0) {
+      logger.error(`❌ ${failures} consulta(s) caíram em Seq Scan`);
+      return false;
+    }
+
+    logger.info(`🎉 Todas as ${HOT_QUERIES.length} consultas usam índices`);
+    return true;
+  } finally {
+    // Nada do que foi populado permanece no banco
+    await queryRunner.rollbackTransaction();
+    await queryRunner.release();
+    await AppDataSource.destroy();
+  }
+}
+
+checkQueryPlans()
+  .then((ok) => process.exit(ok ? 0 : 1))
+  .catch((error) => {
+    logger.error('❌ Erro ao verificar planos de execução:', error);
+    process.exit(1);
+  });
@@ -0,0 +1,100 @@
+import 'reflect-metadata';
+import { AppDataSource } from '../config/database';
+import { logger } from '../utils/logger';
+
+/**
+ * Benchmark antes/depois dos filtros de mês/ano em transactions.
+ * Compara o predicado antigo (EXTRACT sobre cast da coluna) com o predicado
+ * por intervalo de datas, mostrando plano, tempo e buffers de cada um.
+ * Uso: npm run bench:dates [-- <userId> <month> <year>]
+ */
+interface DateFilter {
+  userId: string;
+  month: number;
+  year: number;
+  startDate: string;
+  endDate: string;
+}
+
+const queries: { label: string; sql: string; params: (filter: DateFilter) => any[] }[] = [
+  {
+    label: 'antes (EXTRACT)',
+    sql: `
+      SELECT id, amount, type FROM transactions
+      WHERE "userId" = $1
+        AND EXTRACT(MONTH FROM date::date) = $2
+        AND EXTRACT(YEAR FROM date::date) = $3`,
+    params: (filter) => [filter.userId, filter.month, filter.year],
+  },
+  {
+    label: 'depois (intervalo)',
+    sql: `
+      SELECT id, amount, type FROM transactions
+      WHERE "userId" = $1
+        AND date BETWEEN $2::date AND $3::date`,
+    params: (filter) => [filter.userId, filter.startDate, filter.endDate],
+  },
+];
+
+const collectNodeTypes = (plan: any, types: string[] = []): string[] => {
+  types.push(plan['Index Name'] ? `${plan['Node Type']} (${plan['Index Name']})` : plan['Node Type']);
+  (plan.Plans || []).forEach((child: any) => collectNodeTypes(child, types));
+  return types;
+};
+
+async function explainDateFilters() {
+  try {
+    await AppDataSource.initialize();
+
+    let [userId, month, year] = process.argv.slice(2);
+
+    if (!userId) {
+      // Usuário com mais transações, que é onde a diferença aparece
+      const [heaviest] = await AppDataSource.query(
+        `SELECT "userId", COUNT(*) as total FROM transactions GROUP BY "userId" ORDER BY total DESC LIMIT 1`
+      );
+      if (!heaviest) {
+        logger.warn('⚠️  Nenhuma transação encontrada para o benchmark');
+        return;
+      }
+      userId = heaviest.userId;
+    }
+
+    const now = new Date();
+    const targetMonth = Number(month) || now.getMonth() + 1;
+    const targetYear = Number(year) || now.getFullYear();
+    const lastDay = new Date(targetYear, targetMonth, 0).getDate();
+    const startDate = `${targetYear}-${String(targetMonth).padStart(2, '0')}-01`;
+    const endDate = `${targetYear}-${String(targetMonth).padStart(2, '0')}-${String(lastDay).padStart(2, '0')}`;
+    const filter: DateFilter = { userId, month: targetMonth, year: targetYear, startDate, endDate };
+
+    logger.info(`📊 Filtro de ${startDate} a ${endDate} para o usuário ${userId}`);
+
+    for (const { label, sql, params } of queries) {
+      const [{ 'QUERY PLAN': [explain] }] = await AppDataSource.query(
+        `EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) ${sql}`,
+        params(filter)
+      );
+
+      logger.info(`🔎 ${label}`, {
+        nodes: collectNodeTypes(explain.Plan).join(' -> '),
+        rows: explain.Plan['Actual Rows'],
+        planningMs: explain['Planning Time'],
+        executionMs: explain['Execution Time'],
+        sharedHit: explain.Plan['Shared Hit Blocks'],
+        sharedRead: explain.Plan['Shared Read Blocks'],
+      });
+    }
+  } finally {
+    if (AppDataSource.isInitialized) {
+      await AppDataSource.destroy();
+    }
+  }
+}
+
+explainDateFilters()
+  .then(() => process.exit(0))
+  .catch((error) => {
+    logger.error('❌ Erro no benchmark de filtros de data:', error);
+    process.exit(1);
+  });
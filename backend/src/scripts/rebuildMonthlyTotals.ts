@@ -0,0 +1,38 @@
+import 'reflect-metadata';
+import { AppDataSource } from '../config/database';
+import monthlyTotalsService from '../services/monthlyTotals.service';
+import { logger } from '../utils/logger';
+
+/**
+ * Script para recalcular a tabela user_monthly_totals a partir das transações
+ * Uso: npm run totals:rebuild [-- <userId>]
+ */
+async function rebuildMonthlyTotals() {
+  const userId = process.argv[2];
+
+  try {
+    await AppDataSource.initialize();
+    logger.info('✅ Conexão com banco estabelecida');
+
+    logger.info(userId
+      ? `🔄 Recalculando totais mensais do usuário ${userId}...`
+      : '🔄 Recalculando totais mensais de todos os usuários...');
+
+    const startedAt = Date.now();
+    const rows = await monthlyTotalsService.rebuild(userId);
+
+    logger.info(`🎉 ${rows} linha(s) de totais recalculada(s) em ${Date.now() - startedAt}ms`);
+  } catch (error) {
+    logger.error('❌ Erro ao recalcular totais mensais:', error);
+    throw error;
+  } finally {
+    if (AppDataSource.isInitialized) {
+      await AppDataSource.destroy();
+      logger.info('🔌 Conexão com banco encerrada');
+    }
+  }
+}
+
+rebuildMonthlyTotals()
+  .then(() => process.exit(0))
+  .catch(() => process.exit(1));
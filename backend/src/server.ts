@@ -3,6 +3,7 @@ import { config } from '@/config/env';
 import { initializeDatabase } from '@/config/database';
 import { logger } from '@/utils/logger';
 import { scheduleExpirePlansJob } from '@/jobs/expirePlans.job';
+import jobScheduler from '@/services/jobScheduler.service';
 import fs from 'fs';
 import path from 'path';
 
@@ -13,6 +14,8 @@ const createDirectories = () => {
   const dirs = [
     config.upload.dir,
     path.join(config.upload.dir, 'avatars'),
+    path.join(config.upload.dir, 'imports'),
+    path.join(config.upload.dir, 'exports'),
     config.logging.dir,
   ];
 
@@ -42,15 +45,42 @@ const startServer = async (): Promise<void> => {
     //   await runSeeders();
     // }
 
-    // Iniciar job de expiração de planos premium
+    // Registrar job de expiração de planos premium
     scheduleExpirePlansJob();
     logger.info('⏰ Premium plan expiration job scheduled');
 
-    // Iniciar job de transações recorrentes
+    // Registrar job de transações recorrentes
     const { scheduleRecurringTransactionsJob } = await import('./jobs/recurring-transactions.job');
     scheduleRecurringTransactionsJob();
     logger.info('⏰ Recurring transactions job scheduled');
 
+    // Registrar limpeza das lápides de sincronização
+    const { scheduleSyncTombstonesJob } = await import('./jobs/syncTombstones.job');
+    scheduleSyncTombstonesJob();
+
+    // Registrar envio em lotes das notificações em massa
+    const { scheduleNotificationBroadcastsJob } = await import('./jobs/notificationBroadcasts.job');
+    scheduleNotificationBroadcastsJob();
+
+    // Registrar reconciliação dos contadores de não lidas
+    const { scheduleNotificationCountersJob } = await import('./jobs/notificationCounters.job');
+    scheduleNotificationCountersJob();
+
+    // Registrar manutenção das partições de notificações (criação e retenção)
+    const { scheduleNotificationPartitionsJob } = await import('./jobs/notificationPartitions.job');
+    scheduleNotificationPartitionsJob();
+
+    // Agendador persistente: cada execução roda em apenas uma instância
+    await jobScheduler.start();
+
+    // Pub/sub do stream de notificações (LISTEN/NOTIFY entre instâncias)
+    const { default: notificationStream } = await import('./services/notificationStream.service');
+    await notificationStream.start();
+
+    // Iniciar workers de exportação em segundo plano
+    const { default: exportJobService } = await import('./services/exportJob.service');
+    exportJobService.start();
+
     // Iniciar servidor HTTP
     const server = app.listen(config.port, () => {
       logger.info('='.repeat(50));
@@ -67,6 +97,8 @@ const startServer = async (): Promise<void> => {
     // Graceful shutdown
     const gracefulShutdown = (signal: string) => {
       logger.info(`${signal} received. Shutting down gracefully...`);
+      jobScheduler.stop();
+      notificationStream.stop();
       server.close(() => {
         logger.info('Server closed');
         process.exit(0);
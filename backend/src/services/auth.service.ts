@@ -1,6 +1,7 @@
 import { AppDataSource } from '@/config/database';
 import { User } from '@/models/User';
 import { RefreshToken } from '@/models/RefreshToken';
+import passwordHasher from '@/services/passwordHasher.service';
 import { generateAccessToken, generateRefreshToken, verifyRefreshToken } from '@/utils/jwt';
 import { ConflictError, UnauthorizedError, NotFoundError } from '@/utils/errors';
 
@@ -15,7 +16,11 @@ export class AuthService {
       throw new ConflictError('Email já cadastrado');
     }
 
-    const user = this.userRepository.create({ name, email, password });
+    const user = this.userRepository.create({
+      name,
+      email,
+      password: await passwordHasher.hash(password),
+    });
     await this.userRepository.save(user);
 
     const tokens = await this.generateTokens(user);
@@ -26,7 +31,7 @@ export class AuthService {
   async login(email: string, password: string) {
     const user = await this.userRepository.findOne({ where: { email } });
     
-    if (!user || !(await user.comparePassword(password))) {
+    if (!user || !(await passwordHasher.compare(password, user.password))) {
       throw new UnauthorizedError('Email ou senha inválidos');
     }
 
@@ -117,7 +122,7 @@ export class AuthService {
       throw new NotFoundError('Usuário não encontrado');
     }
 
-    user.password = newPassword;
+    user.password = await passwordHasher.hash(newPassword);
     await this.userRepository.save(user);
   }
 }
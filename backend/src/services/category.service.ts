@@ -1,5 +1,8 @@
 import { AppDataSource } from '@/config/database';
 import { Category, CategoryType } from '@/models/Category';
+import dashboardCache from '@/services/dashboardCache.service';
+import dataVersionService from '@/services/dataVersion.service';
+import syncService from '@/services/sync.service';
 import { NotFoundError } from '@/utils/errors';
 
 export class CategoryService {
@@ -7,7 +10,11 @@ export class CategoryService {
 
   async create(userId: string, data: { name: string; type: CategoryType; color: string; icon: string }) {
     const category = this.categoryRepository.create({ ...data, userId });
-    await this.categoryRepository.save(category);
+    await AppDataSource.transaction(async (manager) => {
+      const { categories: syncVersion } = await dataVersionService.bump(manager, userId, 'categories');
+      category.syncVersion = String(syncVersion);
+      await manager.getRepository(Category).save(category);
+    });
     return category;
   }
 
@@ -38,12 +45,25 @@ export class CategoryService {
   async update(id: string, userId: string, data: Partial<Category>) {
     const category = await this.findById(id, userId);
     Object.assign(category, data);
-    await this.categoryRepository.save(category);
+    await AppDataSource.transaction(async (manager) => {
+      // A categoria também é enviada junto das transações
+      const { categories: syncVersion } = await dataVersionService.bump(manager, userId, 'categories', 'transactions');
+      category.syncVersion = String(syncVersion);
+      await manager.getRepository(Category).save(category);
+    });
+    // Nome, cor e ícone aparecem no dashboard dos meses em que a categoria foi usada
+    await dashboardCache.invalidateCategory(userId, id);
     return category;
   }
 
   async delete(id: string, userId: string) {
     const category = await this.findById(id, userId);
-    await this.categoryRepository.remove(category);
+    const months = await dashboardCache.findCategoryMonths(userId, id);
+    await AppDataSource.transaction(async (manager) => {
+      await manager.getRepository(Category).remove(category);
+      const { categories: syncVersion } = await dataVersionService.bump(manager, userId, 'categories');
+      await syncService.recordDeletions(manager, userId, 'category', [id], syncVersion);
+    });
+    await dashboardCache.invalidateMonths(userId, months);
   }
 }
@@ -0,0 +1,202 @@
+import { AppDataSource } from '@/config/database';
+import { config } from '@/config/env';
+import { CacheStore, createCacheStore } from '@/utils/cacheStore';
+import { logger } from '@/utils/logger';
+
+export interface DashboardEntry<T = any> {
+  data: T;
+  // Carimbo gerado a cada cálculo; serve de ETag sem serializar o payload
+  version: string;
+}
+
+interface CachedDashboard extends DashboardEntry {
+  freshUntil: number;
+}
+
+interface InflightLoad {
+  promise: Promise<DashboardEntry>;
+  // Invalidado enquanto calculava: o resultado não deve ir para o cache
+  invalidated: boolean;
+}
+
+export interface MonthKey {
+  year: number;
+  month: number;
+}
+
+/**
+ * Cache do dashboard por (usuário, mês, ano) com stale-while-revalidate:
+ * dentro do TTL a resposta sai do cache; depois dele, e até o fim da janela
+ * de stale, a versão antiga é devolvida enquanto uma nova é calculada em
+ * segundo plano. Escritas que afetam um mês removem apenas a chave desse mês.
+ */
+export class DashboardCacheService {
+  private store: CacheStore = createCacheStore(config.dashboardCache.store, {
+    maxEntries: config.dashboardCache.maxEntries,
+    redisUrl: config.redis.url,
+  });
+  private inflight = new Map<string, InflightLoad>();
+  private freshMs = config.dashboardCache.ttlSeconds * 1000;
+  private staleMs = config.dashboardCache.staleSeconds * 1000;
+  private sequence = 0;
+  private counters = { hits: 0, staleHits: 0, misses: 0, invalidations: 0, errors: 0 };
+
+  async get<T>(userId: string, month: number, year: number, compute: () => Promise<T>): Promise<T> {
+    return (await this.getEntry(userId, month, year, compute)).data;
+  }
+
+  /**
+   * Igual a get, mas devolve também a versão do cálculo em cache
+   */
+  async getEntry<T>(
+    userId: string,
+    month: number,
+    year: number,
+    compute: () => Promise<T>
+  ): Promise<DashboardEntry<T>> {
+    const key = this.key(userId, { year, month });
+    const cached = await this.read(key);
+
+    if (cached) {
+      if (cached.freshUntil > Date.now()) {
+        this.counters.hits++;
+      } else {
+        this.counters.staleHits++;
+        this.load(key, compute).catch((error) =>
+          logger.warn(`⚠️  Dashboard revalidation failed for ${key}:`, error)
+        );
+      }
+      return { data: cached.data, version: cached.version };
+    }
+
+    this.counters.misses++;
+    return this.load(key, compute);
+  }
+
+  /**
+   * Remover os meses que contêm as datas informadas
+   */
+  async invalidateDates(userId: string, dates: (string | Date)[]): Promise<void> {
+    await this.invalidateMonths(userId, dates.map((date) => this.monthOf(date)));
+  }
+
+  async invalidateMonths(userId: string, months: MonthKey[]): Promise<void> {
+    const keys = [...new Set(months.map((month) => this.key(userId, month)))];
+    if (keys.length === 0) {
+      return;
+    }
+
+    for (const key of keys) {
+      const load = this.inflight.get(key);
+      if (load) {
+        load.invalidated = true;
+      }
+    }
+
+    this.counters.invalidations += keys.length;
+    try {
+      await this.store.del(keys);
+    } catch (error) {
+      this.counters.errors++;
+      logger.warn('⚠️  Dashboard cache invalidation failed:', error);
+    }
+  }
+
+  /**
+   * Meses em que a categoria aparece no dashboard do usuário
+   */
+  async findCategoryMonths(userId: string, categoryId: string): Promise<MonthKey[]> {
+    return AppDataSource.query(
+      `SELECT DISTINCT year, month
+       FROM user_monthly_totals
+       WHERE "userId" = $1 AND "categoryId" = $2 AND count > 0`,
+      [userId, categoryId]
+    );
+  }
+
+  async invalidateCategory(userId: string, categoryId: string): Promise<void> {
+    await this.invalidateMonths(userId, await this.findCategoryMonths(userId, categoryId));
+  }
+
+  getStats() {
+    const lookups = this.counters.hits + this.counters.staleHits + this.counters.misses;
+
+    return {
+      store: this.store.name,
+      ...this.counters,
+      hitRate: lookups > 0
+        ? Math.round(((this.counters.hits + this.counters.staleHits) / lookups) * 10000) / 10000
+        : 0,
+      inflight: this.inflight.size,
+      ...(this.store.getStats ? { entries: this.store.getStats().size } : {}),
+    };
+  }
+
+  /**
+   * Calcular e gravar; cálculos simultâneos da mesma chave são compartilhados
+   */
+  private load<T>(key: string, compute: () => Promise<T>): Promise<DashboardEntry<T>> {
+    const existing = this.inflight.get(key);
+    if (existing) {
+      return existing.promise;
+    }
+
+    const load: InflightLoad = { promise: Promise.resolve({ data: null, version: '' }), invalidated: false };
+    load.promise = (async () => {
+      try {
+        const entry: DashboardEntry<T> = { data: await compute(), version: this.nextVersion() };
+        if (!load.invalidated) {
+          await this.write(key, entry);
+        }
+        return entry;
+      } finally {
+        this.inflight.delete(key);
+      }
+    })();
+
+    this.inflight.set(key, load);
+    return load.promise;
+  }
+
+  private async read(key: string): Promise<CachedDashboard | null> {
+    try {
+      const raw = await this.store.get(key);
+      return raw ? JSON.parse(raw) : null;
+    } catch (error) {
+      this.counters.errors++;
+      logger.warn(`⚠️  Dashboard cache read failed for ${key}:`, error);
+      return null;
+    }
+  }
+
+  private async write(key: string, { data, version }: DashboardEntry): Promise<void> {
+    const entry: CachedDashboard = { data, version, freshUntil: Date.now() + this.freshMs };
+
+    try {
+      await this.store.set(key, JSON.stringify(entry), this.freshMs + this.staleMs);
+    } catch (error) {
+      this.counters.errors++;
+      logger.warn(`⚠️  Dashboard cache write failed for ${key}:`, error);
+    }
+  }
+
+  private nextVersion(): string {
+    this.sequence = (this.sequence + 1) % 1296;
+    return `${Date.now().toString(36)}${this.sequence.toString(36)}`;
+  }
+
+  private key(userId: string, { year, month }: MonthKey): string {
+    return `dashboard:${userId}:${year}-${month}`;
+  }
+
+  private monthOf(date: string | Date): MonthKey {
+    if (date instanceof Date) {
+      return { year: date.getFullYear(), month: date.getMonth() + 1 };
+    }
+
+    const [year, month] = String(date).split('T')[0].split('-').map(Number);
+    return { year, month };
+  }
+}
+
+export default new DashboardCacheService();
@@ -0,0 +1,90 @@
+import { EntityManager } from 'typeorm';
+import { AppDataSource } from '@/config/database';
+
+export type DataDomain = 'transactions' | 'categories' | 'goals' | 'preferences';
+
+export const DATA_DOMAINS: DataDomain[] = ['transactions', 'categories', 'goals', 'preferences'];
+
+export type DataVersions = Record<DataDomain, number>;
+
+export class DataVersionService {
+  /**
+   * Incrementar os contadores dos domínios alterados e devolver os novos valores.
+   * Deve ser chamado com o EntityManager da mesma transação da escrita: a linha
+   * fica travada até o commit, então as versões de um usuário são gravadas em ordem.
+   */
+  async bump(manager: EntityManager, userId: string, ...domains: DataDomain[]): Promise<DataVersions> {
+    const versions = await this.bumpMany(manager, [userId], ...domains);
+    return versions.get(userId) || this.toVersions(null);
+  }
+
+  /**
+   * Incrementar os contadores de vários usuários em um único upsert
+   */
+  async bumpMany(
+    manager: EntityManager,
+    userIds: string[],
+    ...domains: DataDomain[]
+  ): Promise<Map<string, DataVersions>> {
+    const uniqueUserIds = [...new Set(userIds)];
+    const columns = [...new Set(domains)].filter((domain) => DATA_DOMAINS.includes(domain));
+    if (uniqueUserIds.length === 0 || columns.length === 0) {
+      return new Map();
+    }
+
+    const rows = await manager.query(
+      `INSERT INTO user_data_versions ("userId", ${columns.map((column) => `"${column}"`).join(', ')})
+       SELECT id, ${columns.map(() => '1').join(', ')} FROM unnest($1::uuid[]) AS id
+       ON CONFLICT ("userId")
+       DO UPDATE SET
+         ${columns.map((column) => `"${column}" = user_data_versions."${column}" + 1`).join(',\n         ')},
+         "updatedAt" = NOW()
+       RETURNING "userId", transactions, categories, goals, preferences`,
+      [uniqueUserIds]
+    );
+
+    return new Map(rows.map((row: any) => [row.userId, this.toVersions(row)]));
+  }
+
+  /**
+   * SQL do incremento de um domínio para uso em CTEs de um único comando.
+   * source deve devolver a coluna "userId"; o CTE devolve a nova versão em "version".
+   */
+  bumpSql(source: string, domain: DataDomain): string {
+    if (!DATA_DOMAINS.includes(domain)) {
+      throw new Error(`Domínio de versão inválido: ${domain}`);
+    }
+
+    return `INSERT INTO user_data_versions ("userId", "${domain}")
+       SELECT DISTINCT s."userId", 1 FROM (${source}) s
+       ON CONFLICT ("userId")
+       DO UPDATE SET "${domain}" = user_data_versions."${domain}" + 1, "updatedAt" = NOW()
+       RETURNING "userId", "${domain}" AS version`;
+  }
+
+  /**
+   * Versões atuais do usuário (leitura pela chave primária; zero se nunca houve escrita)
+   */
+  async get(userId: string, manager: EntityManager = AppDataSource.manager): Promise<DataVersions> {
+    const [row] = await manager.query(
+      `SELECT transactions, categories, goals, preferences
+       FROM user_data_versions
+       WHERE "userId" = $1`,
+      [userId]
+    );
+
+    return this.toVersions(row);
+  }
+
+  private toVersions(row: any): DataVersions {
+    // bigint chega do driver como string
+    return {
+      transactions: Number(row?.transactions ?? 0),
+      categories: Number(row?.categories ?? 0),
+      goals: Number(row?.goals ?? 0),
+      preferences: Number(row?.preferences ?? 0),
+    };
+  }
+}
+
+export default new DataVersionService();
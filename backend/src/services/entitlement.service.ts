@@ -0,0 +1,87 @@
+import { AppDataSource } from '../config/database';
+import { config } from '../config/env';
+import { User } from '../models/User';
+import { LruCache } from '../utils/lruCache';
+
+// Campos de plano guardados no cache (congelados: nunca entregues diretamente)
+interface EntitlementSnapshot {
+  readonly id: string;
+  readonly planType: User['planType'];
+  readonly planStartDate: number | null;
+  readonly planEndDate: number | null;
+  readonly isPremium: boolean;
+}
+
+/**
+ * Cache em memória dos dados de plano do usuário (planType e datas), usado pelos
+ * middlewares premium e pelo status da assinatura. A entrada nunca vive além do
+ * planEndDate e é invalidada pelas operações de assinatura desta instância.
+ */
+export class EntitlementService {
+  private userRepository = AppDataSource.getRepository(User);
+  private cache = new LruCache<string, EntitlementSnapshot>(
+    config.entitlementCache.maxEntries,
+    config.entitlementCache.ttlSeconds * 1000
+  );
+
+  /**
+   * Usuário com os campos de plano (isPlanActive/hasFeatureAccess funcionam normalmente).
+   * Cada chamada recebe uma instância nova: alterações feitas por quem a recebe
+   * (ex: req.premiumUser) não chegam ao cache.
+   */
+  async getUser(userId: string): Promise<User | null> {
+    let snapshot = this.cache.get(userId);
+
+    if (!snapshot) {
+      const user = await this.userRepository.findOne({ where: { id: userId } });
+      if (!user) {
+        return null;
+      }
+
+      snapshot = Object.freeze({
+        id: user.id,
+        planType: user.planType,
+        planStartDate: user.planStartDate ? new Date(user.planStartDate).getTime() : null,
+        planEndDate: user.planEndDate ? new Date(user.planEndDate).getTime() : null,
+        isPremium: user.isPremium,
+      });
+      this.cache.set(userId, snapshot, this.ttlFor(snapshot));
+    }
+
+    return Object.assign(new User(), {
+      id: snapshot.id,
+      planType: snapshot.planType,
+      planStartDate: snapshot.planStartDate === null ? null : new Date(snapshot.planStartDate),
+      planEndDate: snapshot.planEndDate === null ? null : new Date(snapshot.planEndDate),
+      isPremium: snapshot.isPremium,
+    });
+  }
+
+  invalidate(userId: string): void {
+    this.cache.delete(userId);
+  }
+
+  clear(): void {
+    this.cache.clear();
+  }
+
+  getStats() {
+    return this.cache.getStats();
+  }
+
+  /**
+   * TTL padrão, limitado ao fim do plano para que a expiração seja vista a tempo
+   */
+  private ttlFor(snapshot: EntitlementSnapshot): number {
+    const ttl = config.entitlementCache.ttlSeconds * 1000;
+
+    if (snapshot.planEndDate === null) {
+      return ttl;
+    }
+
+    const untilEnd = snapshot.planEndDate - Date.now();
+    return untilEnd > 0 ? Math.min(ttl, untilEnd) : ttl;
+  }
+}
+
+export const entitlementService = new EntitlementService();
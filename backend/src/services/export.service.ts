@@ -0,0 +1,303 @@
+import { Readable, Writable } from 'stream';
+import { finished, pipeline } from 'stream/promises';
+import { stringify } from 'csv-stringify';
+import ExcelJS from 'exceljs';
+import PDFDocument from 'pdfkit';
+import { AppDataSource } from '@/config/database';
+import { TransactionType } from '@/models/Transaction';
+
+// Linhas buscadas por FETCH do cursor (memória constante em qualquer volume)
+const EXPORT_FETCH_SIZE = 1000;
+
+export type ExportFormat = 'csv' | 'xlsx' | 'pdf';
+
+export interface ExportFilters {
+  format: ExportFormat;
+  startDate?: string;
+  endDate?: string;
+  type?: TransactionType;
+  categoryId?: string;
+}
+
+export interface ExportRow {
+  date: string;
+  description: string;
+  category: string | null;
+  type: TransactionType;
+  amount: string;
+}
+
+const CONTENT_TYPES: Record<ExportFormat, string> = {
+  csv: 'text/csv; charset=utf-8',
+  xlsx: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+  pdf: 'application/pdf',
+};
+
+const TYPE_LABELS: Record<TransactionType, string> = {
+  [TransactionType.INCOME]: 'Receita',
+  [TransactionType.EXPENSE]: 'Despesa',
+};
+
+/**
+ * Aguarda o destino esvaziar o buffer antes de continuar escrevendo
+ */
+const waitForDrain = (output: Writable): Promise<void> => {
+  if (!output.writableNeedDrain) {
+    return Promise.resolve();
+  }
+
+  return new Promise((resolve, reject) => {
+    const cleanup = () => {
+      output.off('drain', onDrain);
+      output.off('close', onClose);
+    };
+    const onDrain = () => {
+      cleanup();
+      resolve();
+    };
+    const onClose = () => {
+      cleanup();
+      reject(new Error('Destino encerrado durante a exportação'));
+    };
+
+    output.on('drain', onDrain);
+    output.on('close', onClose);
+  });
+};
+
+const formatDate = (date: string): string => {
+  const [year, month, day] = date.split('-');
+  return `${day}/${month}/${year}`;
+};
+
+export class ExportService {
+  getContentType(format: ExportFormat): string {
+    return CONTENT_TYPES[format];
+  }
+
+  getFileName(format: ExportFormat): string {
+    return `transacoes-${new Date().toISOString().split('T')[0]}.${format}`;
+  }
+
+  /**
+   * Escrever a exportação no destino (resposta HTTP ou arquivo)
+   */
+  async export(userId: string, filters: ExportFilters, output: Writable): Promise<void> {
+    const batches = this.streamTransactions(userId, filters);
+
+    switch (filters.format) {
+      case 'xlsx':
+        return this.writeXlsx(batches, output);
+      case 'pdf':
+        return this.writePdf(batches, filters, output);
+      default:
+        return this.writeCsv(batches, output);
+    }
+  }
+
+  /**
+   * Ler as transações por um cursor do PostgreSQL, em lotes de EXPORT_FETCH_SIZE.
+   * O cursor vive em uma transação somente leitura e é fechado ao final
+   * (ou quando o consumidor interrompe a leitura).
+   */
+  async *streamTransactions(userId: string, filters: ExportFilters): AsyncGenerator<ExportRow[]> {
+    const conditions = ['t."userId" = $1'];
+    const params: any[] = [userId];
+
+    if (filters.startDate) {
+      params.push(filters.startDate);
+      conditions.push(`t.date >= $${params.length}`);
+    }
+
+    if (filters.endDate) {
+      params.push(filters.endDate);
+      conditions.push(`t.date <= $${params.length}`);
+    }
+
+    if (filters.type) {
+      params.push(filters.type);
+      conditions.push(`t.type = $${params.length}`);
+    }
+
+    if (filters.categoryId) {
+      params.push(filters.categoryId);
+      conditions.push(`t."categoryId" = $${params.length}`);
+    }
+
+    const queryRunner = AppDataSource.createQueryRunner();
+    await queryRunner.connect();
+
+    try {
+      await queryRunner.query('BEGIN READ ONLY');
+      await queryRunner.query(
+        `DECLARE export_cursor NO SCROLL CURSOR FOR
+         SELECT t.date::text as date,
+                t.description as description,
+                c.name as category,
+                t.type::text as type,
+                t.amount::text as amount
+         FROM transactions t
+         LEFT JOIN categories c ON c.id = t."categoryId"
+         WHERE ${conditions.join(' AND ')}
+         ORDER BY t.date DESC, t."createdAt" DESC, t.id DESC`,
+        params
+      );
+
+      while (true) {
+        const rows: ExportRow[] = await queryRunner.query(
+          `FETCH FORWARD ${EXPORT_FETCH_SIZE} FROM export_cursor`
+        );
+
+        if (rows.length === 0) {
+          break;
+        }
+
+        yield rows;
+      }
+    } finally {
+      await queryRunner.query('ROLLBACK').catch(() => undefined);
+      await queryRunner.release();
+    }
+  }
+
+  private async writeCsv(batches: AsyncIterable<ExportRow[]>, output: Writable): Promise<void> {
+    async function* records() {
+      for await (const rows of batches) {
+        for (const row of rows) {
+          yield [row.date, row.description, row.category || '', TYPE_LABELS[row.type], row.amount];
+        }
+      }
+    }
+
+    await pipeline(
+      Readable.from(records()),
+      stringify({
+        bom: true,
+        delimiter: ';',
+        header: true,
+        columns: ['Data', 'Descrição', 'Categoria', 'Tipo', 'Valor'],
+      }),
+      output
+    );
+  }
+
+  private async writeXlsx(batches: AsyncIterable<ExportRow[]>, output: Writable): Promise<void> {
+    const workbook = new ExcelJS.stream.xlsx.WorkbookWriter({
+      stream: output,
+      useStyles: true,
+      useSharedStrings: false,
+    });
+    const worksheet = workbook.addWorksheet('Transações');
+
+    worksheet.columns = [
+      { header: 'Data', key: 'date', width: 12, style: { numFmt: 'dd/mm/yyyy' } },
+      { header: 'Descrição', key: 'description', width: 40 },
+      { header: 'Categoria', key: 'category', width: 20 },
+      { header: 'Tipo', key: 'type', width: 10 },
+      { header: 'Valor', key: 'amount', width: 14, style: { numFmt: '#,##0.00' } },
+    ];
+
+    for await (const rows of batches) {
+      for (const row of rows) {
+        worksheet
+          .addRow({
+            date: new Date(`${row.date}T00:00:00Z`),
+            description: row.description,
+            category: row.category || '',
+            type: TYPE_LABELS[row.type],
+            amount: Number(row.amount),
+          })
+          .commit();
+      }
+
+      await waitForDrain(output);
+    }
+
+    worksheet.commit();
+    await workbook.commit();
+  }
+
+  private async writePdf(
+    batches: AsyncIterable<ExportRow[]>,
+    filters: ExportFilters,
+    output: Writable
+  ): Promise<void> {
+    const doc = new PDFDocument({ size: 'A4', margin: 40 });
+    doc.pipe(output);
+
+    const columns = [
+      { label: 'Data', x: 40, width: 60 },
+      { label: 'Descrição', x: 105, width: 210 },
+      { label: 'Categoria', x: 320, width: 110 },
+      { label: 'Tipo', x: 435, width: 50 },
+      { label: 'Valor', x: 490, width: 65 },
+    ];
+    const bottom = doc.page.height - doc.page.margins.bottom;
+    const rowHeight = 16;
+
+    doc.font('Helvetica-Bold').fontSize(16).text('FinControl - Transações');
+    const period = [filters.startDate, filters.endDate].filter(Boolean).map((date) => formatDate(date!)).join(' a ');
+    doc.font('Helvetica').fontSize(10).text(period ? `Período: ${period}` : 'Período: todas as transações');
+    doc.moveDown();
+
+    let y = doc.y;
+    let income = 0;
+    let expense = 0;
+
+    // Cabeçalho da tabela repetido em cada página
+    const startPage = () => {
+      doc.font('Helvetica-Bold').fontSize(9);
+      columns.forEach((column) => doc.text(column.label, column.x, y, { width: column.width }));
+      y += rowHeight;
+      doc.font('Helvetica').fontSize(8);
+    };
+
+    startPage();
+
+    for await (const rows of batches) {
+      for (const row of rows) {
+        if (y + rowHeight > bottom) {
+          doc.addPage();
+          y = doc.page.margins.top;
+          startPage();
+        }
+
+        const amount = Number(row.amount);
+        if (row.type === TransactionType.INCOME) {
+          income += amount;
+        } else {
+          expense += amount;
+        }
+
+        const values = [
+          formatDate(row.date),
+          row.description,
+          row.category || '',
+          TYPE_LABELS[row.type],
+          amount.toFixed(2),
+        ];
+        values.forEach((value, index) =>
+          doc.text(value, columns[index].x, y, { width: columns[index].width, height: rowHeight, ellipsis: true, lineBreak: false })
+        );
+        y += rowHeight;
+      }
+
+      await waitForDrain(output);
+    }
+
+    if (y + rowHeight * 4 > bottom) {
+      doc.addPage();
+      y = doc.page.margins.top;
+    }
+
+    doc.font('Helvetica-Bold').fontSize(10);
+    doc.text(`Receitas: ${income.toFixed(2)}`, 40, y + rowHeight);
+    doc.text(`Despesas: ${expense.toFixed(2)}`, 40, y + rowHeight * 2);
+    doc.text(`Saldo: ${(income - expense).toFixed(2)}`, 40, y + rowHeight * 3);
+
+    doc.end();
+    await finished(output);
+  }
+}
+
+export default new ExportService();
@@ -0,0 +1,231 @@
+import fs from 'fs';
+import path from 'path';
+import { Worker } from 'worker_threads';
+import { v4 as uuidv4 } from 'uuid';
+import { config } from '@/config/env';
+import notificationService from '@/services/notification.service';
+import exportService, { ExportFilters } from '@/services/export.service';
+import type { ExportTask, ExportTaskResult } from '@/workers/export.worker';
+import { NotFoundError, BadRequestError } from '@/utils/errors';
+import { createWorker } from '@/utils/worker';
+import { logger } from '@/utils/logger';
+
+const EXPORTS_DIR = path.join(config.upload.dir, 'exports');
+const ARTIFACT_TTL_MS = config.exports.ttlHours * 60 * 60 * 1000;
+
+export type ExportJobStatus = 'queued' | 'processing' | 'completed' | 'failed' | 'expired';
+
+export interface ExportJob {
+  id: string;
+  userId: string;
+  filters: ExportFilters;
+  status: ExportJobStatus;
+  fileName: string;
+  size?: number;
+  error?: string;
+  createdAt: Date;
+  finishedAt?: Date;
+  expiresAt?: Date;
+}
+
+interface ExportWorker {
+  worker: Worker;
+  jobId: string | null;
+}
+
+export class ExportJobService {
+  private jobs = new Map<string, ExportJob>();
+  private queue: string[] = [];
+  private workers: ExportWorker[] = [];
+
+  /**
+   * Enfileirar uma exportação; o arquivo é gerado por uma worker thread
+   */
+  enqueue(userId: string, filters: ExportFilters): ExportJob {
+    const job: ExportJob = {
+      id: uuidv4(),
+      userId,
+      filters,
+      status: 'queued',
+      fileName: exportService.getFileName(filters.format),
+      createdAt: new Date(),
+    };
+
+    this.jobs.set(job.id, job);
+    this.queue.push(job.id);
+    this.dispatch();
+
+    return job;
+  }
+
+  /**
+   * Status de uma exportação do usuário
+   */
+  getJob(jobId: string, userId: string): ExportJob {
+    const job = this.jobs.get(jobId);
+
+    if (!job || job.userId !== userId) {
+      throw new NotFoundError('Exportação não encontrada');
+    }
+
+    return job;
+  }
+
+  /**
+   * Caminho do arquivo gerado, se a exportação estiver pronta para download
+   */
+  getArtifact(jobId: string, userId: string): { job: ExportJob; filePath: string } {
+    const job = this.getJob(jobId, userId);
+
+    if (job.status !== 'completed') {
+      throw new BadRequestError(
+        job.status === 'expired' ? 'Arquivo de exportação expirado' : 'Exportação ainda não concluída'
+      );
+    }
+
+    return { job, filePath: this.artifactPath(job.id, job.filters.format) };
+  }
+
+  /**
+   * Iniciar o pool de workers e a limpeza periódica dos arquivos expirados
+   */
+  start(): void {
+    const size = Math.max(1, config.exports.workers);
+    for (let index = 0; index < size; index++) {
+      this.workers.push(this.spawnWorker());
+    }
+
+    setInterval(() => this.cleanup(), Math.min(ARTIFACT_TTL_MS, 60 * 60 * 1000)).unref();
+    logger.info(`📤 Export workers started (${size})`);
+  }
+
+  private spawnWorker(): ExportWorker {
+    const worker = createWorker('export');
+    const slot: ExportWorker = { worker, jobId: null };
+
+    worker.on('message', (result: ExportTaskResult) => {
+      slot.jobId = null;
+      this.finish(result).finally(() => this.dispatch());
+    });
+
+    worker.on('error', (error) => {
+      logger.error('❌ Export worker crashed:', error);
+    });
+
+    worker.on('exit', (code) => {
+      // Falha no worker: o job em andamento é marcado como falho e o worker recriado
+      if (slot.jobId) {
+        this.finish({ jobId: slot.jobId, status: 'failed', error: `Worker encerrado (código ${code})` });
+      }
+
+      const index = this.workers.indexOf(slot);
+      if (index !== -1) {
+        this.workers[index] = this.spawnWorker();
+        this.dispatch();
+      }
+    });
+
+    return slot;
+  }
+
+  /**
+   * Entregar jobs da fila aos workers livres
+   */
+  private dispatch(): void {
+    for (const slot of this.workers) {
+      if (slot.jobId || this.queue.length === 0) {
+        continue;
+      }
+
+      const job = this.jobs.get(this.queue.shift()!);
+      if (!job) {
+        continue;
+      }
+
+      job.status = 'processing';
+      slot.jobId = job.id;
+
+      const task: ExportTask = {
+        jobId: job.id,
+        userId: job.userId,
+        filters: job.filters,
+        filePath: this.artifactPath(job.id, job.filters.format),
+      };
+      slot.worker.postMessage(task);
+    }
+  }
+
+  private async finish(result: ExportTaskResult): Promise<void> {
+    const job = this.jobs.get(result.jobId);
+    if (!job) {
+      return;
+    }
+
+    job.finishedAt = new Date();
+
+    if (result.status === 'failed') {
+      job.status = 'failed';
+      job.error = result.error;
+      logger.error(`❌ Export ${job.id} failed: ${result.error}`);
+      return;
+    }
+
+    job.status = 'completed';
+    job.size = result.size;
+    job.expiresAt = new Date(job.finishedAt.getTime() + ARTIFACT_TTL_MS);
+
+    try {
+      await notificationService.create(
+        job.userId,
+        '📤 Exportação concluída',
+        `Seu arquivo ${job.fileName} está pronto para download`,
+        'success',
+        'system',
+        job.id,
+        'export'
+      );
+    } catch (error) {
+      logger.error(`❌ Failed to notify export ${job.id}:`, error);
+    }
+  }
+
+  private artifactPath(jobId: string, format: string): string {
+    return path.join(EXPORTS_DIR, `${jobId}.${format}`);
+  }
+
+  /**
+   * Remover arquivos expirados e esquecer jobs antigos
+   */
+  private cleanup(): void {
+    const now = Date.now();
+
+    for (const [id, job] of this.jobs) {
+      const finishedAt = job.finishedAt ? job.finishedAt.getTime() : null;
+
+      if (job.status === 'completed' && job.expiresAt && job.expiresAt.getTime() <= now) {
+        job.status = 'expired';
+        fs.promises.unlink(this.artifactPath(id, job.filters.format)).catch(() => undefined);
+      } else if (finishedAt && finishedAt + ARTIFACT_TTL_MS * 2 <= now) {
+        this.jobs.delete(id);
+      }
+    }
+
+    // Arquivos sem job conhecido (ex: gerados antes de um restart)
+    fs.promises
+      .readdir(EXPORTS_DIR)
+      .then((files) =>
+        Promise.all(
+          files.map(async (file) => {
+            const filePath = path.join(EXPORTS_DIR, file);
+            const { mtimeMs } = await fs.promises.stat(filePath);
+            if (mtimeMs + ARTIFACT_TTL_MS <= now) {
+              await fs.promises.unlink(filePath);
+            }
+          })
+        )
+      )
+      .catch((error) => logger.warn('⚠️  Failed to clean export artifacts:', error));
+  }
+}
+
+export default new ExportJobService();
@@ -0,0 +1,262 @@
+import os from 'os';
+import { AppDataSource } from '@/config/database';
+import { ScheduledJob } from '@/models/ScheduledJob';
+import { ScheduledJobRun } from '@/models/ScheduledJobRun';
+import { NotFoundError } from '@/utils/errors';
+import { logger } from '@/utils/logger';
+
+// Intervalo de verificação de jobs vencidos em cada instância
+const POLL_INTERVAL_MS = 15 * 1000;
+// Duração do lease; renovado por heartbeat enquanto o job roda
+const LEASE_MS = 5 * 60 * 1000;
+const HEARTBEAT_MS = LEASE_MS / 3;
+
+export type JobSchedule = { everyMs: number } | { dailyAt: string };
+
+export interface JobDefinition {
+  name: string;
+  schedule: JobSchedule;
+  handler: () => Promise<any>;
+  // Primeira execução logo ao criar a linha do job
+  runOnStart?: boolean;
+  // Tentativas antes de desistir até o próximo horário agendado
+  maxAttempts?: number;
+  // Espera da primeira nova tentativa (dobra a cada falha)
+  retryBaseMs?: number;
+}
+
+/**
+ * Agendador persistente: cada execução é reivindicada por UPDATE ... FOR UPDATE
+ * SKIP LOCKED em scheduled_jobs, então apenas uma instância roda cada job por vez,
+ * independentemente de quantas réplicas estejam no ar.
+ */
+export class JobSchedulerService {
+  private jobRepository = AppDataSource.getRepository(ScheduledJob);
+  private runRepository = AppDataSource.getRepository(ScheduledJobRun);
+  private definitions = new Map<string, JobDefinition>();
+  private timer: NodeJS.Timeout | null = null;
+  private polling = false;
+  private workerId = `${os.hostname()}:${process.pid}`;
+
+  register(definition: JobDefinition): void {
+    this.definitions.set(definition.name, definition);
+  }
+
+  /**
+   * Criar as linhas dos jobs registrados (se ainda não existirem) e começar a verificar
+   */
+  async start(): Promise<void> {
+    const now = new Date();
+
+    for (const definition of this.definitions.values()) {
+      await AppDataSource.query(
+        `INSERT INTO scheduled_jobs (name, "nextRunAt")
+         VALUES ($1, $2)
+         ON CONFLICT (name) DO NOTHING`,
+        [definition.name, definition.runOnStart ? now : this.computeNextRun(definition, now)]
+      );
+    }
+
+    this.timer = setInterval(() => this.poll(), POLL_INTERVAL_MS);
+    this.poll();
+
+    logger.info(`⏰ Job scheduler started (${this.definitions.size} job(s), worker ${this.workerId})`);
+  }
+
+  stop(): void {
+    if (this.timer) {
+      clearInterval(this.timer);
+      this.timer = null;
+    }
+  }
+
+  /**
+   * Executar jobs vencidos até não haver mais nenhum disponível
+   */
+  async poll(): Promise<void> {
+    if (this.polling) {
+      return;
+    }
+
+    this.polling = true;
+    try {
+      let claimed = await this.claim();
+      while (claimed) {
+        await this.execute(claimed.job, claimed.trigger);
+        claimed = await this.claim();
+      }
+    } catch (error) {
+      logger.error('❌ Job scheduler poll failed:', error);
+    } finally {
+      this.polling = false;
+    }
+  }
+
+  /**
+   * Pedir a execução imediata de um job (roda na instância que reivindicá-lo)
+   */
+  async trigger(name: string): Promise<ScheduledJob> {
+    if (!this.definitions.has(name)) {
+      throw new NotFoundError('Job não encontrado');
+    }
+
+    const [rows] = await AppDataSource.query(
+      `UPDATE scheduled_jobs
+       SET "nextRunAt" = NOW(), "pendingTrigger" = 'manual', "updatedAt" = NOW()
+       WHERE name = $1
+       RETURNING *`,
+      [name]
+    );
+
+    if (rows.length === 0) {
+      throw new NotFoundError('Job não encontrado');
+    }
+
+    setImmediate(() => this.poll());
+    return rows[0];
+  }
+
+  async findAll(): Promise<ScheduledJob[]> {
+    return this.jobRepository.find({ order: { name: 'ASC' } });
+  }
+
+  async findRuns(name: string, limit = 20): Promise<ScheduledJobRun[]> {
+    return this.runRepository.find({
+      where: { jobName: name },
+      order: { startedAt: 'DESC' },
+      take: limit,
+    });
+  }
+
+  /**
+   * Reivindicar um job vencido cujo lease esteja livre ou expirado
+   */
+  private async claim(): Promise<{ job: ScheduledJob; trigger: string } | null> {
+    const [rows] = await AppDataSource.query(
+      `WITH picked AS (
+         SELECT name, "pendingTrigger"
+         FROM scheduled_jobs
+         WHERE enabled = true
+           AND name = ANY($2)
+           AND "nextRunAt" <= NOW()
+           AND ("lockedUntil" IS NULL OR "lockedUntil" < NOW())
+         ORDER BY "nextRunAt"
+         LIMIT 1
+         FOR UPDATE SKIP LOCKED
+       )
+       UPDATE scheduled_jobs j
+       SET "lockedBy" = $1,
+           "lockedUntil" = NOW() + $3 * interval '1 millisecond',
+           "heartbeatAt" = NOW(),
+           "pendingTrigger" = NULL,
+           "updatedAt" = NOW()
+       FROM picked
+       WHERE j.name = picked.name
+       RETURNING j.*, picked."pendingTrigger" AS "claimedTrigger"`,
+      [this.workerId, [...this.definitions.keys()], LEASE_MS]
+    );
+
+    if (rows.length === 0) {
+      return null;
+    }
+
+    const { claimedTrigger, ...job } = rows[0];
+    return { job, trigger: claimedTrigger || 'schedule' };
+  }
+
+  private async execute(job: ScheduledJob, trigger: string): Promise<void> {
+    const definition = this.definitions.get(job.name)!;
+    const attempt = job.attempts + 1;
+    const startedAt = new Date();
+
+    const run = await this.runRepository.save(
+      this.runRepository.create({
+        jobName: job.name,
+        status: 'running',
+        trigger,
+        attempt,
+        workerId: this.workerId,
+        startedAt,
+      })
+    );
+
+    // Renova o lease enquanto o job roda
+    const heartbeat = setInterval(() => {
+      AppDataSource.query(
+        `UPDATE scheduled_jobs
+         SET "lockedUntil" = NOW() + $3 * interval '1 millisecond', "heartbeatAt" = NOW()
+         WHERE name = $1 AND "lockedBy" = $2`,
+        [job.name, this.workerId, LEASE_MS]
+      ).catch((error) => logger.warn(`⚠️  Heartbeat failed for job ${job.name}:`, error));
+    }, HEARTBEAT_MS);
+
+    let status: 'succeeded' | 'failed' = 'succeeded';
+    let result: any = null;
+    let errorMessage: string | null = null;
+
+    try {
+      logger.info(`▶️  Job ${job.name} started (attempt ${attempt}, ${trigger})`);
+      result = (await definition.handler()) ?? null;
+    } catch (error) {
+      status = 'failed';
+      errorMessage = error instanceof Error ? error.message : String(error);
+      logger.error(`❌ Job ${job.name} failed (attempt ${attempt}):`, error);
+    } finally {
+      clearInterval(heartbeat);
+    }
+
+    const finishedAt = new Date();
+    const maxAttempts = definition.maxAttempts ?? 3;
+    const retry = status === 'failed' && attempt < maxAttempts;
+    const nextRunAt = retry
+      ? new Date(finishedAt.getTime() + (definition.retryBaseMs ?? 60 * 1000) * 2 ** (attempt - 1))
+      : this.computeNextRun(definition, finishedAt);
+
+    // Um pedido manual feito durante a execução antecipa a próxima rodada
+    const [, released] = await AppDataSource.query(
+      `UPDATE scheduled_jobs
+       SET "nextRunAt" = CASE WHEN "pendingTrigger" IS NOT NULL THEN NOW() ELSE $3 END,
+           attempts = $4,
+           "lockedBy" = NULL,
+           "lockedUntil" = NULL,
+           "lastRunAt" = $5,
+           "lastStatus" = $6,
+           "lastError" = $7,
+           "updatedAt" = NOW()
+       WHERE name = $1 AND "lockedBy" = $2`,
+      [job.name, this.workerId, nextRunAt, retry ? attempt : 0, startedAt, status, errorMessage]
+    );
+
+    if (!released) {
+      logger.warn(`⚠️  Job ${job.name} lost its lease before finishing`);
+    }
+
+    await this.runRepository.update(run.id, {
+      status,
+      result,
+      error: errorMessage,
+      finishedAt,
+      durationMs: finishedAt.getTime() - startedAt.getTime(),
+    });
+
+    logger.info(
+      `${status === 'succeeded' ? '✅' : '⏳'} Job ${job.name} ${status} in ${finishedAt.getTime() - startedAt.getTime()}ms; next run at ${nextRunAt.toISOString()}`
+    );
+  }
+
+  private computeNextRun(definition: JobDefinition, from: Date): Date {
+    if ('everyMs' in definition.schedule) {
+      return new Date(from.getTime() + definition.schedule.everyMs);
+    }
+
+    const [hours, minutes] = definition.schedule.dailyAt.split(':').map(Number);
+    const next = new Date(from);
+    next.setHours(hours, minutes, 0, 0);
+    if (next <= from) {
+      next.setDate(next.getDate() + 1);
+    }
+    return next;
+  }
+}
+
+export default new JobSchedulerService();
@@ -0,0 +1,175 @@
+import { EntityManager } from 'typeorm';
+import { AppDataSource } from '@/config/database';
+import { TransactionType } from '@/models/Transaction';
+
+/**
+ * Dados mínimos de uma transação para atualizar os totais mensais
+ */
+export interface MonthlyTotalSource {
+  userId: string;
+  categoryId: string;
+  type: TransactionType | string;
+  amount: number | string;
+  date: string | Date;
+}
+
+export class MonthlyTotalsService {
+  /**
+   * Somar (sign = 1) ou subtrair (sign = -1) uma transação dos totais do mês.
+   * Deve ser chamado com o EntityManager da mesma transação da escrita.
+   */
+  async apply(manager: EntityManager, source: MonthlyTotalSource, sign: 1 | -1 = 1): Promise<void> {
+    await this.applyMany(manager, [source], sign);
+  }
+
+  /**
+   * Aplicar várias transações de uma vez (um único upsert multi-linha)
+   */
+  async applyMany(manager: EntityManager, sources: MonthlyTotalSource[], sign: 1 | -1 = 1): Promise<void> {
+    if (sources.length === 0) {
+      return;
+    }
+
+    // Consolidar por chave antes de enviar ao banco (ON CONFLICT não aceita chaves repetidas)
+    const deltas = new Map<string, { values: any[]; total: number; count: number }>();
+    for (const source of sources) {
+      const [year, month] = this.splitDate(source.date);
+      const key = `${source.userId}|${year}|${month}|${source.categoryId}|${source.type}`;
+      const delta = deltas.get(key) || {
+        values: [source.userId, year, month, source.categoryId, source.type],
+        total: 0,
+        count: 0,
+      };
+      delta.total += sign * Number(source.amount);
+      delta.count += sign;
+      deltas.set(key, delta);
+    }
+
+    const params: any[] = [];
+    const rows: string[] = [];
+    for (const delta of deltas.values()) {
+      const offset = params.length;
+      params.push(...delta.values, delta.total.toFixed(2), delta.count);
+      rows.push(
+        `($${offset + 1}::uuid, $${offset + 2}::smallint, $${offset + 3}::smallint, $${offset + 4}::uuid, $${offset + 5}, $${offset + 6}::numeric, $${offset + 7}::integer)`
+      );
+    }
+
+    await manager.query(
+      `INSERT INTO user_monthly_totals ("userId", year, month, "categoryId", type, total, count)
+       VALUES ${rows.join(', ')}
+       ON CONFLICT ("userId", year, month, "categoryId", type)
+       DO UPDATE SET
+         total = user_monthly_totals.total + EXCLUDED.total,
+         count = user_monthly_totals.count + EXCLUDED.count,
+         "updatedAt" = NOW()`,
+      params
+    );
+  }
+
+  /**
+   * Upsert dos totais a partir de uma subconsulta com as colunas
+   * ("userId", date, "categoryId", type, amount, sign), para uso em CTEs de um
+   * único comando. As linhas são somadas por chave antes do ON CONFLICT, já que
+   * o mesmo total não pode ser alterado duas vezes no mesmo comando.
+   */
+  deltaUpsertSql(source: string): string {
+    return `INSERT INTO user_monthly_totals ("userId", year, month, "categoryId", type, total, count)
+       SELECT s."userId",
+              EXTRACT(YEAR FROM s.date)::smallint,
+              EXTRACT(MONTH FROM s.date)::smallint,
+              s."categoryId",
+              s.type::text,
+              SUM(s.sign * s.amount),
+              SUM(s.sign)::integer
+       FROM (${source}) s
+       GROUP BY 1, 2, 3, 4, 5
+       ON CONFLICT ("userId", year, month, "categoryId", type)
+       DO UPDATE SET
+         total = user_monthly_totals.total + EXCLUDED.total,
+         count = user_monthly_totals.count + EXCLUDED.count,
+         "updatedAt" = NOW()`;
+  }
+
+  /**
+   * Totais de receita e despesa de um mês
+   */
+  async getMonthSummary(userId: string, month: number, year: number): Promise<{ income: number; expense: number }> {
+    const result = await AppDataSource.manager.query(
+      `SELECT
+         COALESCE(SUM(CASE WHEN type = 'income' THEN total ELSE 0 END), 0) as income,
+         COALESCE(SUM(CASE WHEN type = 'expense' THEN total ELSE 0 END), 0) as expense
+       FROM user_monthly_totals
+       WHERE "userId" = $1 AND year = $2 AND month = $3`,
+      [userId, year, month]
+    );
+
+    return {
+      income: parseFloat(result[0].income),
+      expense: parseFloat(result[0].expense),
+    };
+  }
+
+  /**
+   * Totais do mês agrupados por nome de categoria e tipo
+   */
+  async getCategoryTotals(userId: string, month: number, year: number): Promise<any[]> {
+    return AppDataSource.manager.query(
+      `SELECT c.name as name,
+              umt.type as type,
+              MIN(c.color) as color,
+              MIN(c.icon) as icon,
+              SUM(umt.total) as total
+       FROM user_monthly_totals umt
+       INNER JOIN categories c ON c.id = umt."categoryId"
+       WHERE umt."userId" = $1 AND umt.year = $2 AND umt.month = $3 AND umt.count > 0
+       GROUP BY c.name, umt.type`,
+      [userId, year, month]
+    );
+  }
+
+  /**
+   * Recalcular os totais do zero a partir da tabela de transações.
+   * Sem userId, reconstrói a tabela inteira.
+   */
+  async rebuild(userId?: string): Promise<number> {
+    return AppDataSource.transaction(async (manager) => {
+      const filter = userId ? 'WHERE "userId" = $1' : '';
+      const params = userId ? [userId] : [];
+
+      await manager.query(`DELETE FROM user_monthly_totals ${filter}`, params);
+
+      const result = await manager.query(
+        `INSERT INTO user_monthly_totals ("userId", year, month, "categoryId", type, total, count)
+         SELECT "userId",
+                EXTRACT(YEAR FROM date::date)::smallint,
+                EXTRACT(MONTH FROM date::date)::smallint,
+                "categoryId",
+                type::text,
+                SUM(amount),
+                COUNT(*)
+         FROM transactions
+         ${filter}
+         GROUP BY 1, 2, 3, 4, 5
+         RETURNING 1`,
+        params
+      );
+
+      return result.length;
+    });
+  }
+
+  /**
+   * Extrair [ano, mês] de uma data YYYY-MM-DD
+   */
+  private splitDate(date: string | Date): [number, number] {
+    if (date instanceof Date) {
+      return [date.getFullYear(), date.getMonth() + 1];
+    }
+
+    const [year, month] = String(date).split('T')[0].split('-').map(Number);
+    return [year, month];
+  }
+}
+
+export default new MonthlyTotalsService();
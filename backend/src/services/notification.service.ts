@@ -1,5 +1,87 @@
 import { AppDataSource } from '@/config/database';
 import { Notification, NotificationType, NotificationCategory } from '@/models/Notification';
+import notificationStream from '@/services/notificationStream.service';
+
+/**
+ * CTE que soma ao contador de não lidas uma unidade por linha de `source`
+ * (notificações recém-criadas, com "userId"), criando o contador se preciso
+ */
+export const incrementUnreadSql = (source: string) => `
+  INSERT INTO user_notification_counters ("userId", unread)
+  SELECT "userId", COUNT(*) FROM ${source} GROUP BY "userId"
+  ON CONFLICT ("userId") DO UPDATE
+  SET unread = user_notification_counters.unread + EXCLUDED.unread, "updatedAt" = NOW()`;
+
+/**
+ * CTE que subtrai `amount` do contador de não lidas do usuário $userParam
+ */
+const decrementUnreadSql = (userParam: string, amount: string) => `
+  UPDATE user_notification_counters
+  SET unread = GREATEST(unread - ${amount}, 0), "updatedAt" = NOW()
+  WHERE "userId" = ${userParam} AND ${amount} > 0`;
+
+// Cada escrita altera notifications e o contador no mesmo comando
+const CREATE_SQL = `
+  WITH inserted AS (
+    INSERT INTO notifications ("userId", title, message, type, category, "relatedId", "relatedType")
+    VALUES ($1, $2, $3, $4, $5, $6, $7)
+    RETURNING *
+  ),
+  counter AS (${incrementUnreadSql('inserted')})
+  SELECT * FROM inserted`;
+
+const MARK_AS_READ_SQL = `
+  WITH updated AS (
+    UPDATE notifications SET "isRead" = true, "updatedAt" = NOW()
+    WHERE id = $1 AND "userId" = $2 AND "isRead" = false
+    RETURNING *
+  ),
+  counter AS (${decrementUnreadSql('$2', '(SELECT COUNT(*) FROM updated)')})
+  SELECT * FROM updated`;
+
+const MARK_ALL_AS_READ_SQL = `
+  WITH updated AS (
+    UPDATE notifications SET "isRead" = true, "updatedAt" = NOW()
+    WHERE "userId" = $1 AND "isRead" = false
+    RETURNING 1
+  ),
+  counter AS (${decrementUnreadSql('$1', '(SELECT COUNT(*) FROM updated)')})
+  SELECT COUNT(*)::int AS affected FROM updated`;
+
+const DELETE_SQL = `
+  WITH deleted AS (
+    DELETE FROM notifications WHERE id = $1 AND "userId" = $2
+    RETURNING "isRead"
+  ),
+  counter AS (${decrementUnreadSql('$2', '(SELECT COUNT(*) FROM deleted WHERE "isRead" = false)')})
+  SELECT "isRead" FROM deleted`;
+
+/**
+ * Recalcular os contadores divergentes a partir das notificações. Só grava
+ * se o contador não mudou desde o snapshot lido (updatedAt igual); os que
+ * mudaram no meio do caminho ficam para a próxima rodada.
+ */
+const RECONCILE_SQL = `
+  WITH actual AS (
+    SELECT "userId", COUNT(*)::int AS unread
+    FROM notifications
+    WHERE "isRead" = false
+    GROUP BY "userId"
+  ),
+  drift AS (
+    SELECT COALESCE(a."userId", c."userId") AS "userId",
+           COALESCE(a.unread, 0) AS unread,
+           COALESCE(c."updatedAt", NOW()) AS "updatedAt"
+    FROM actual a
+    FULL JOIN user_notification_counters c ON c."userId" = a."userId"
+    WHERE COALESCE(a.unread, 0) IS DISTINCT FROM c.unread
+  )
+  INSERT INTO user_notification_counters ("userId", unread, "updatedAt")
+  SELECT "userId", unread, "updatedAt" FROM drift
+  ON CONFLICT ("userId") DO UPDATE
+  SET unread = EXCLUDED.unread, "updatedAt" = NOW()
+  WHERE user_notification_counters."updatedAt" = EXCLUDED."updatedAt"
+  RETURNING "userId"`;
 
 export class NotificationService {
   private notificationRepository = AppDataSource.getRepository(Notification);
@@ -16,17 +98,18 @@ export class NotificationService {
     relatedId?: string,
     relatedType?: string
   ): Promise<Notification> {
-    const notification = this.notificationRepository.create({
+    const [notification] = await this.notificationRepository.query(CREATE_SQL, [
       userId,
       title,
       message,
       type,
-      category,
-      relatedId,
-      relatedType,
-    });
+      category ?? null,
+      relatedId ?? null,
+      relatedType ?? null,
+    ]);
+    notificationStream.publish(userId, { action: 'created', unreadDelta: 1, notification });
 
-    return await this.notificationRepository.save(notification);
+    return notification;
   }
 
   /**
@@ -47,59 +130,80 @@ export class NotificationService {
   }
 
   /**
-   * Contar notificações não lidas
+   * Contar notificações não lidas (contador desnormalizado, uma leitura pela chave)
    */
   async countUnread(userId: string): Promise<number> {
-    return await this.notificationRepository.count({
-      where: { userId, isRead: false },
-    });
+    const [counter] = await this.notificationRepository.query(
+      `SELECT unread FROM user_notification_counters WHERE "userId" = $1`,
+      [userId]
+    );
+
+    return counter ? counter.unread : 0;
+  }
+
+  /**
+   * Corrigir contadores que divergiram das notificações (job periódico)
+   */
+  async reconcileUnreadCounters(): Promise<{ corrected: number }> {
+    const rows = await this.notificationRepository.query(RECONCILE_SQL);
+    return { corrected: rows.length };
   }
 
   /**
    * Marcar notificação como lida
    */
   async markAsRead(id: string, userId: string): Promise<Notification | null> {
-    const notification = await this.notificationRepository.findOne({
-      where: { id, userId },
-    });
+    // Condicional em isRead: leituras simultâneas geram um único evento e decremento
+    const rows = await this.notificationRepository.query(MARK_AS_READ_SQL, [id, userId]);
 
-    if (!notification) {
-      return null;
+    if (rows.length === 0) {
+      // Já lida ou inexistente
+      return await this.notificationRepository.findOne({
+        where: { id, userId },
+      });
     }
 
-    notification.isRead = true;
-    return await this.notificationRepository.save(notification);
+    notificationStream.publish(userId, { action: 'read', id, unreadDelta: -1 });
+    return rows[0];
   }
 
   /**
    * Marcar todas como lidas
    */
   async markAllAsRead(userId: string): Promise<void> {
-    await this.notificationRepository
-      .createQueryBuilder()
-      .update(Notification)
-      .set({ isRead: true })
-      .where('userId = :userId', { userId })
-      .andWhere('isRead = :isRead', { isRead: false })
-      .execute();
+    const [{ affected }] = await this.notificationRepository.query(MARK_ALL_AS_READ_SQL, [userId]);
+
+    if (affected) {
+      notificationStream.publish(userId, { action: 'read-all', unreadDelta: -affected });
+    }
   }
 
   /**
    * Deletar notificação
    */
   async delete(id: string, userId: string): Promise<boolean> {
-    const result = await this.notificationRepository.delete({ id, userId });
-    return result.affected ? result.affected > 0 : false;
+    const rows = await this.notificationRepository.query(DELETE_SQL, [id, userId]);
+
+    if (rows.length === 0) {
+      return false;
+    }
+
+    notificationStream.publish(userId, { action: 'deleted', id, unreadDelta: rows[0].isRead ? 0 : -1 });
+    return true;
   }
 
   /**
-   * Deletar todas as notificações lidas
+   * Deletar todas as notificações lidas (não altera o contador de não lidas)
    */
   async deleteAllRead(userId: string): Promise<number> {
     const result = await this.notificationRepository.delete({
       userId,
       isRead: true,
     });
+
+    if (result.affected) {
+      notificationStream.publish(userId, { action: 'deleted-read', unreadDelta: 0 });
+    }
     return result.affected || 0;
   }
 }
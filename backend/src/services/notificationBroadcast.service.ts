@@ -0,0 +1,176 @@
+import { AppDataSource } from '@/config/database';
+import { config } from '@/config/env';
+import { NotificationBroadcast } from '@/models/NotificationBroadcast';
+import { NotificationType, NotificationCategory } from '@/models/Notification';
+import jobScheduler from '@/services/jobScheduler.service';
+import { incrementUnreadSql } from '@/services/notification.service';
+import notificationStream from '@/services/notificationStream.service';
+import { NotFoundError } from '@/utils/errors';
+import { logger } from '@/utils/logger';
+
+export const BROADCAST_JOB_NAME = 'notification-broadcasts';
+
+export interface BroadcastInput {
+  title: string;
+  message: string;
+  type: NotificationType;
+  category: NotificationCategory;
+  onlyPremium: boolean;
+  createdBy?: string;
+}
+
+/**
+ * Registrar o envio já com o total de destinatários; nenhuma linha é
+ * inserida quando não há usuários elegíveis (HAVING)
+ */
+const ENQUEUE_SQL = `
+  INSERT INTO notification_broadcasts
+    (title, message, type, category, "onlyPremium", "createdBy", "totalRecipients")
+  SELECT $1::varchar, $2::text, $3::varchar, $4::varchar, $5::boolean, $6::uuid, COUNT(*)
+  FROM users
+  WHERE $5::boolean = false OR "isPremium" = true
+  HAVING COUNT(*) > 0
+  RETURNING *`;
+
+/**
+ * Um lote: próximos usuários após o cursor (keyset por users.id), INSERT ...
+ * SELECT das notificações, contadores de não lidas e avanço do cursor no
+ * mesmo comando, então o progresso salvo sempre corresponde ao que foi
+ * inserido. Usuários criados depois do pedido de envio ficam de fora.
+ */
+const BATCH_SQL = `
+  WITH broadcast AS (
+    SELECT * FROM notification_broadcasts
+    WHERE id = $1 AND status IN ('queued', 'running')
+    FOR UPDATE
+  ),
+  recipients AS (
+    SELECT u.id
+    FROM users u, broadcast b
+    WHERE (b."lastUserId" IS NULL OR u.id > b."lastUserId")
+      AND (b."onlyPremium" = false OR u."isPremium" = true)
+      AND u."createdAt" <= b."createdAt"
+    ORDER BY u.id
+    LIMIT $2
+  ),
+  inserted AS (
+    INSERT INTO notifications ("userId", title, message, type, category, "relatedId", "relatedType")
+    SELECT r.id, b.title, b.message, b.type, b.category, b.id, 'broadcast'
+    FROM recipients r, broadcast b
+    RETURNING "userId"
+  ),
+  counters AS (${incrementUnreadSql('inserted')})
+  UPDATE notification_broadcasts nb
+  SET "sentCount" = nb."sentCount" + (SELECT COUNT(*) FROM inserted),
+      "lastUserId" = COALESCE((SELECT id FROM recipients ORDER BY id DESC LIMIT 1), nb."lastUserId"),
+      status = CASE WHEN (SELECT COUNT(*) FROM recipients) < $2 THEN 'completed' ELSE 'running' END,
+      "startedAt" = COALESCE(nb."startedAt", NOW()),
+      "finishedAt" = CASE WHEN (SELECT COUNT(*) FROM recipients) < $2 THEN NOW() END,
+      error = NULL,
+      "updatedAt" = NOW()
+  FROM broadcast b
+  WHERE nb.id = b.id
+  RETURNING nb.status, nb."sentCount", nb."lastUserId"`;
+
+export class NotificationBroadcastService {
+  private broadcastRepository = AppDataSource.getRepository(NotificationBroadcast);
+
+  /**
+   * Registrar uma notificação em massa e acordar o job de envio.
+   * Retorna imediatamente; o progresso é consultado pelo id.
+   */
+  async enqueue(input: BroadcastInput): Promise<NotificationBroadcast> {
+    const rows = await AppDataSource.query(ENQUEUE_SQL, [
+      input.title,
+      input.message,
+      input.type,
+      input.category,
+      input.onlyPremium,
+      input.createdBy ?? null,
+    ]);
+
+    if (rows.length === 0) {
+      throw new NotFoundError('Nenhum usuário encontrado');
+    }
+
+    // Sem o gatilho o envio ainda sai na próxima rodada agendada do job
+    jobScheduler
+      .trigger(BROADCAST_JOB_NAME)
+      .catch((error) => logger.warn('⚠️  Failed to trigger notification broadcast job:', error));
+
+    return rows[0];
+  }
+
+  async findById(id: string): Promise<NotificationBroadcast> {
+    const broadcast = await this.broadcastRepository.findOne({ where: { id } });
+
+    if (!broadcast) {
+      throw new NotFoundError('Envio não encontrado');
+    }
+
+    return broadcast;
+  }
+
+  async findRecent(limit = 20): Promise<NotificationBroadcast[]> {
+    return this.broadcastRepository.find({
+      order: { createdAt: 'DESC' },
+      take: limit,
+    });
+  }
+
+  /**
+   * Processar os envios pendentes, do mais antigo ao mais novo.
+   * Chamado pelo job agendado (uma instância por vez); um envio interrompido
+   * continua do último lote confirmado.
+   */
+  async processPending(): Promise<{ broadcasts: number; sent: number }> {
+    const batchSize = Math.max(1, config.notifications.broadcastBatchSize);
+    let broadcasts = 0;
+    let sent = 0;
+
+    for (;;) {
+      const [pending] = await AppDataSource.query(
+        `SELECT id, "sentCount", "lastUserId" FROM notification_broadcasts
+         WHERE status IN ('queued', 'running')
+         ORDER BY "createdAt"
+         LIMIT 1`
+      );
+      if (!pending) {
+        break;
+      }
+
+      broadcasts++;
+      const startedWith = pending.sentCount;
+      let result = { status: 'running', sentCount: startedWith, lastUserId: pending.lastUserId };
+
+      try {
+        while (result.status === 'running') {
+          const [rows] = await AppDataSource.query(BATCH_SQL, [pending.id, batchSize]);
+          if (rows.length === 0) {
+            break;
+          }
+
+          // Entrega em tempo real aos usuários do lote conectados ao stream
+          if (rows[0].sentCount > result.sentCount) {
+            notificationStream.publishBroadcast(pending.id, result.lastUserId, rows[0].lastUserId);
+          }
+          result = rows[0];
+        }
+      } catch (error) {
+        // Mantém o envio pendente: a nova tentativa do job retoma do cursor salvo
+        await AppDataSource.query(
+          `UPDATE notification_broadcasts SET error = $2, "updatedAt" = NOW() WHERE id = $1`,
+          [pending.id, error instanceof Error ? error.message : String(error)]
+        );
+        throw error;
+      }
+
+      sent += result.sentCount - startedWith;
+      logger.info(`📣 Broadcast ${pending.id} ${result.status}: ${result.sentCount} notification(s)`);
+    }
+
+    return { broadcasts, sent };
+  }
+}
+
+export default new NotificationBroadcastService();
@@ -0,0 +1,203 @@
+import fs from 'fs';
+import path from 'path';
+import zlib from 'zlib';
+import { once } from 'events';
+import { pipeline } from 'stream/promises';
+import { AppDataSource } from '../config/database';
+import { config } from '../config/env';
+import { createMonthPartitionSql, monthPartition, monthStart, parseMonthPartition } from '../utils/monthPartitions';
+import { logger } from '../utils/logger';
+
+const TABLE = 'notifications';
+// Meses futuros mantidos criados (inserções fora das partições falhariam)
+const PARTITIONS_AHEAD = 3;
+const ARCHIVE_BATCH_SIZE = 5000;
+
+export interface NotificationPartitionInfo {
+  name: string;
+  month: Date;
+  attached: boolean;
+}
+
+export interface PartitionMaintenanceResult {
+  created: string[];
+  dropped: string[];
+  archivedRows: number;
+}
+
+/**
+ * Manutenção das partições mensais de notifications: cria os meses futuros
+ * e aplica a retenção removendo partições inteiras. Antes de remover, a
+ * partição é desanexada (os contadores de não lidas são ajustados na mesma
+ * transação) e exportada para NDJSON gzip; sem exportação bem-sucedida
+ * para NOTIFICATION_ARCHIVE_DIR a partição não é removida.
+ */
+export class NotificationPartitionService {
+  async listPartitions(): Promise<NotificationPartitionInfo[]> {
+    const rows = await AppDataSource.query(
+      `SELECT c.relname AS name, i.inhrelid IS NOT NULL AS attached
+       FROM pg_class c
+       LEFT JOIN pg_inherits i ON i.inhrelid = c.oid
+       WHERE c.relkind = 'r'
+         AND c.relnamespace = current_schema()::regnamespace
+         AND c.relname LIKE $1`,
+      [`${TABLE}\\_y%`]
+    );
+
+    return rows
+      .map((row: any) => ({ name: row.name, attached: row.attached, month: parseMonthPartition(TABLE, row.name) }))
+      .filter((partition: NotificationPartitionInfo) => partition.month !== null)
+      .sort((a: NotificationPartitionInfo, b: NotificationPartitionInfo) => a.month.getTime() - b.month.getTime());
+  }
+
+  /**
+   * Garantir as partições do mês atual até PARTITIONS_AHEAD meses à frente
+   */
+  async ensurePartitions(now = new Date()): Promise<string[]> {
+    const existing = new Set((await this.listPartitions()).map((partition) => partition.name));
+    const created: string[] = [];
+
+    for (let offset = 0; offset <= PARTITIONS_AHEAD; offset++) {
+      const partition = monthPartition(TABLE, monthStart(now, offset));
+      if (!existing.has(partition.name)) {
+        await AppDataSource.query(createMonthPartitionSql(TABLE, partition));
+        created.push(partition.name);
+      }
+    }
+
+    return created;
+  }
+
+  /**
+   * Criar partições futuras e remover as que saíram da janela de retenção
+   */
+  async maintain(now = new Date()): Promise<PartitionMaintenanceResult> {
+    const created = await this.ensurePartitions(now);
+    const result: PartitionMaintenanceResult = { created, dropped: [], archivedRows: 0 };
+
+    if (config.notifications.retentionMonths <= 0) {
+      return result;
+    }
+
+    // Nenhuma partição é removida sem exportação para um destino configurado
+    if (!config.notifications.archiveDir) {
+      logger.error('❌ NOTIFICATION_RETENTION_MONTHS is set without NOTIFICATION_ARCHIVE_DIR; no partition was dropped');
+      return result;
+    }
+
+    const cutoff = monthStart(now, -config.notifications.retentionMonths);
+
+    for (const partition of await this.listPartitions()) {
+      // Só saem as partições anteriores ao corte; desanexadas por uma execução
+      // interrompida continuam de onde pararam, as da janela nunca são tocadas
+      if (partition.month >= cutoff) {
+        continue;
+      }
+
+      if (partition.attached) {
+        await this.detach(partition.name);
+      }
+
+      result.archivedRows += await this.archive(partition.name);
+      await AppDataSource.query(`DROP TABLE IF EXISTS "${partition.name}"`);
+      result.dropped.push(partition.name);
+      logger.info(`🗄️  Notification partition ${partition.name} dropped`);
+    }
+
+    return result;
+  }
+
+  /**
+   * Tirar a partição da tabela e descontar as não lidas dos contadores,
+   * na mesma transação. O lock_timeout evita enfileirar as leituras de
+   * notifications atrás do lock exclusivo do DETACH.
+   */
+  private async detach(name: string): Promise<void> {
+    await AppDataSource.transaction(async (manager) => {
+      await manager.query(`SET LOCAL lock_timeout = '5s'`);
+      await manager.query(`ALTER TABLE "${TABLE}" DETACH PARTITION "${name}"`);
+      await manager.query(
+        `UPDATE user_notification_counters c
+         SET unread = GREATEST(c.unread - d.unread, 0), "updatedAt" = NOW()
+         FROM (
+           SELECT "userId", COUNT(*) AS unread
+           FROM "${name}"
+           WHERE "isRead" = false
+           GROUP BY "userId"
+         ) d
+         WHERE c."userId" = d."userId"`
+      );
+    });
+  }
+
+  /**
+   * Exportar a partição desanexada para <archiveDir>/<partição>.ndjson.gz
+   * lendo por cursor no servidor, em lotes (memória constante)
+   */
+  private async archive(name: string): Promise<number> {
+    await fs.promises.mkdir(config.notifications.archiveDir, { recursive: true });
+    const filePath = path.join(config.notifications.archiveDir, `${name}.ndjson.gz`);
+    const partialPath = `${filePath}.partial`;
+
+    // Erros de escrita (ENOSPC, EACCES...) rejeitam `written` e interrompem a leitura
+    const gzip = zlib.createGzip();
+    const written = pipeline(gzip, fs.createWriteStream(partialPath));
+    let writeError = null as Error | null;
+    written.catch((error) => {
+      writeError = error;
+    });
+
+    const queryRunner = AppDataSource.createQueryRunner();
+    let rows = 0;
+
+    try {
+      await queryRunner.connect();
+      await queryRunner.startTransaction();
+      await queryRunner.query(`DECLARE archive_cursor NO SCROLL CURSOR FOR SELECT * FROM "${name}"`);
+
+      for (;;) {
+        const batch = await queryRunner.query(`FETCH ${ARCHIVE_BATCH_SIZE} FROM archive_cursor`);
+        if (batch.length === 0) {
+          break;
+        }
+
+        for (const row of batch) {
+          if (writeError) {
+            throw writeError;
+          }
+          if (!gzip.write(`${JSON.stringify(row)}\n`)) {
+            await Promise.race([once(gzip, 'drain'), written]);
+          }
+        }
+        rows += batch.length;
+      }
+
+      const [{ total }] = await queryRunner.query(`SELECT COUNT(*)::int AS total FROM "${name}"`);
+      await queryRunner.commitTransaction();
+      gzip.end();
+      await written;
+
+      // A partição só é removida se o arquivo tiver todas as linhas
+      if (total !== rows) {
+        throw new Error(`Archive of ${name} incomplete: ${rows} of ${total} rows exported`);
+      }
+      await fs.promises.rename(partialPath, filePath);
+    } catch (error) {
+      if (queryRunner.isTransactionActive) {
+        await queryRunner.rollbackTransaction();
+      }
+      // Fechar o arquivo antes de apagá-lo
+      gzip.destroy();
+      await written.catch(() => undefined);
+      await fs.promises.unlink(partialPath).catch(() => undefined);
+      throw error;
+    } finally {
+      await queryRunner.release();
+    }
+
+    logger.info(`🗄️  Notification partition ${name} archived (${rows} rows) to ${filePath}`);
+    return rows;
+  }
+}
+
+export default new NotificationPartitionService();
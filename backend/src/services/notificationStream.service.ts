@@ -0,0 +1,268 @@
+import { AppDataSource } from '@/config/database';
+import { config } from '@/config/env';
+import type { Notification } from '@/models/Notification';
+import { logger } from '@/utils/logger';
+
+const CHANNEL = 'notification_events';
+// NOTIFY aceita payloads de até 8000 bytes
+const PAYLOAD_LIMIT = 7900;
+const RECONNECT_MS = 5000;
+const LATENCY_SAMPLES = 1024;
+
+export type NotificationAction = 'created' | 'read' | 'read-all' | 'deleted' | 'deleted-read';
+
+/**
+ * Evento enviado ao cliente: unreadDelta é somado ao contador exibido
+ */
+export interface NotificationEvent {
+  action: NotificationAction;
+  unreadDelta: number;
+  id?: string;
+  notification?: Notification;
+}
+
+export interface NotificationSubscriber {
+  onEvent: (event: NotificationEvent) => void;
+  // Eventos podem ter sido perdidos (ex: reconexão do LISTEN): reenviar o contador
+  onResync: () => void;
+  close: () => void;
+}
+
+type Envelope =
+  | { kind: 'user'; userId: string; event: NotificationEvent; publishedAt: number }
+  | { kind: 'broadcast'; broadcastId: string; afterUserId: string | null; lastUserId: string; publishedAt: number };
+
+/**
+ * Pub/sub das notificações para o stream SSE. Com NOTIFICATION_PUBSUB=postgres
+ * (padrão) os eventos passam por LISTEN/NOTIFY e chegam a todas as instâncias,
+ * inclusive a que publicou; com memory ficam restritos à instância.
+ */
+export class NotificationStreamService {
+  private subscribers = new Map<string, Set<NotificationSubscriber>>();
+  private listener: { client: any; release: (error?: any) => void } | null = null;
+  private reconnectTimer: NodeJS.Timeout | null = null;
+  private stopped = false;
+  private latencies: number[] = [];
+  private counters = { opened: 0, published: 0, received: 0, delivered: 0, dropped: 0 };
+
+  subscribe(userId: string, subscriber: NotificationSubscriber): () => void {
+    let set = this.subscribers.get(userId);
+    if (!set) {
+      set = new Set();
+      this.subscribers.set(userId, set);
+    }
+    set.add(subscriber);
+    this.counters.opened++;
+
+    return () => {
+      set!.delete(subscriber);
+      if (set!.size === 0 && this.subscribers.get(userId) === set) {
+        this.subscribers.delete(userId);
+      }
+    };
+  }
+
+  /**
+   * Publicar um evento para o usuário; falhas são registradas e não
+   * interrompem a escrita que originou o evento
+   */
+  publish(userId: string, event: NotificationEvent): void {
+    this.send({ kind: 'user', userId, event, publishedAt: Date.now() });
+  }
+
+  /**
+   * Um lote de envio em massa: cada instância busca apenas as notificações
+   * dos usuários conectados a ela dentro do intervalo (afterUserId, lastUserId]
+   */
+  publishBroadcast(broadcastId: string, afterUserId: string | null, lastUserId: string): void {
+    this.send({ kind: 'broadcast', broadcastId, afterUserId, lastUserId, publishedAt: Date.now() });
+  }
+
+  async start(): Promise<void> {
+    this.stopped = false;
+    if (config.notifications.pubsub === 'postgres') {
+      await this.listen();
+    }
+    logger.info(`🔔 Notification stream started (${config.notifications.pubsub})`);
+  }
+
+  /**
+   * Encerrar as conexões SSE (permite o server.close terminar) e o LISTEN
+   */
+  async stop(): Promise<void> {
+    this.stopped = true;
+    if (this.reconnectTimer) {
+      clearTimeout(this.reconnectTimer);
+      this.reconnectTimer = null;
+    }
+
+    for (const set of this.subscribers.values()) {
+      for (const subscriber of set) {
+        subscriber.close();
+      }
+    }
+    this.subscribers.clear();
+
+    if (this.listener) {
+      const { client, release } = this.listener;
+      this.listener = null;
+      await client.query(`UNLISTEN ${CHANNEL}`).catch(() => undefined);
+      release();
+    }
+  }
+
+  getStats() {
+    const sorted = [...this.latencies].sort((a, b) => a - b);
+    const percentile = (p: number) => (sorted.length > 0 ? sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))] : 0);
+    let connections = 0;
+    for (const set of this.subscribers.values()) {
+      connections += set.size;
+    }
+
+    return {
+      mode: config.notifications.pubsub,
+      listening: config.notifications.pubsub === 'postgres' ? this.listener !== null : undefined,
+      connections,
+      connectedUsers: this.subscribers.size,
+      ...this.counters,
+      fanOutLatencyMs: {
+        samples: sorted.length,
+        p50: percentile(0.5),
+        p99: percentile(0.99),
+        max: sorted.length > 0 ? sorted[sorted.length - 1] : 0,
+      },
+    };
+  }
+
+  private send(envelope: Envelope): void {
+    this.counters.published++;
+
+    if (config.notifications.pubsub !== 'postgres') {
+      setImmediate(() => this.receive(envelope));
+      return;
+    }
+
+    let payload = JSON.stringify(envelope);
+    if (Buffer.byteLength(payload) > PAYLOAD_LIMIT && envelope.kind === 'user') {
+      // Sem o conteúdo: o cliente ainda recebe o delta e busca a lista quando precisar
+      const { notification, ...event } = envelope.event;
+      payload = JSON.stringify({ ...envelope, event: { ...event, id: event.id ?? notification?.id } });
+    }
+
+    AppDataSource.query('SELECT pg_notify($1, $2)', [CHANNEL, payload]).catch((error) => {
+      this.counters.dropped++;
+      logger.warn('⚠️  Failed to publish notification event:', error);
+    });
+  }
+
+  private async receive(envelope: Envelope): Promise<void> {
+    this.counters.received++;
+
+    if (envelope.kind === 'user') {
+      const set = this.subscribers.get(envelope.userId);
+      if (set) {
+        this.deliver(set, envelope.event, envelope.publishedAt);
+      }
+      return;
+    }
+
+    const userIds = [...this.subscribers.keys()];
+    if (userIds.length === 0) {
+      return;
+    }
+
+    try {
+      const notifications: Notification[] = await AppDataSource.query(
+        `SELECT * FROM notifications
+         WHERE "relatedId" = $1
+           AND "relatedType" = 'broadcast'
+           AND "userId" = ANY($2::uuid[])
+           AND ($3::uuid IS NULL OR "userId" > $3::uuid)
+           AND "userId" <= $4::uuid`,
+        [envelope.broadcastId, userIds, envelope.afterUserId, envelope.lastUserId]
+      );
+
+      for (const notification of notifications) {
+        const set = this.subscribers.get(notification.userId);
+        if (set) {
+          this.deliver(set, { action: 'created', unreadDelta: 1, notification }, envelope.publishedAt);
+        }
+      }
+    } catch (error) {
+      logger.warn(`⚠️  Failed to fan out broadcast ${envelope.broadcastId}:`, error);
+    }
+  }
+
+  private deliver(set: Set<NotificationSubscriber>, event: NotificationEvent, publishedAt: number): void {
+    for (const subscriber of set) {
+      subscriber.onEvent(event);
+      this.counters.delivered++;
+    }
+
+    this.latencies.push(Date.now() - publishedAt);
+    if (this.latencies.length > LATENCY_SAMPLES) {
+      this.latencies.shift();
+    }
+  }
+
+  /**
+   * Conexão dedicada do pool para o LISTEN; em caso de queda, reconecta e
+   * pede aos clientes conectados que recarreguem o contador
+   */
+  private async listen(): Promise<void> {
+    try {
+      const [client, release] = await (AppDataSource.driver as any).obtainMasterConnection();
+      this.listener = { client, release };
+
+      client.on('notification', (message: { channel: string; payload?: string }) => {
+        if (message.channel !== CHANNEL || !message.payload) {
+          return;
+        }
+        try {
+          this.receive(JSON.parse(message.payload));
+        } catch (error) {
+          logger.warn('⚠️  Invalid notification event payload:', error);
+        }
+      });
+
+      client.on('error', (error: Error) => {
+        logger.error('❌ Notification LISTEN connection lost:', error);
+        if (this.listener?.client === client) {
+          this.listener = null;
+          release(error);
+          this.scheduleReconnect();
+        }
+      });
+
+      await client.query(`LISTEN ${CHANNEL}`);
+    } catch (error) {
+      logger.error('❌ Failed to LISTEN for notification events:', error);
+      if (this.listener) {
+        this.listener.release(error);
+        this.listener = null;
+      }
+      this.scheduleReconnect();
+    }
+  }
+
+  private scheduleReconnect(): void {
+    if (this.stopped || this.reconnectTimer) {
+      return;
+    }
+
+    this.reconnectTimer = setTimeout(async () => {
+      this.reconnectTimer = null;
+      await this.listen();
+      if (this.listener) {
+        for (const set of this.subscribers.values()) {
+          for (const subscriber of set) {
+            subscriber.onResync();
+          }
+        }
+      }
+    }, RECONNECT_MS);
+    this.reconnectTimer.unref();
+  }
+}
+
+export default new NotificationStreamService();
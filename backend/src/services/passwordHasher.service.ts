@@ -0,0 +1,188 @@
+import bcrypt from 'bcryptjs';
+import { Worker } from 'worker_threads';
+import { config } from '../config/env';
+import type { PasswordTask, PasswordTaskResult } from '../workers/password.worker';
+import { logger } from '../utils/logger';
+import { createWorker } from '../utils/worker';
+
+type PasswordOperation =
+  | { op: 'hash'; password: string; rounds: number }
+  | { op: 'compare'; password: string; hash: string };
+
+interface PendingTask {
+  task: PasswordTask;
+  enqueuedAt: number;
+  resolve: (value: any) => void;
+  reject: (error: Error) => void;
+}
+
+interface HasherWorker {
+  worker: Worker;
+  current: PendingTask | null;
+}
+
+export interface PasswordHasherStats {
+  poolSize: number;
+  busy: number;
+  queueDepth: number;
+  maxQueueDepth: number;
+  completed: number;
+  failed: number;
+  avgWaitMs: number;
+}
+
+/**
+ * Hash e comparação de senhas em um pool de worker threads.
+ * Os workers são criados no primeiro uso e liberam o processo quando ociosos;
+ * com PASSWORD_HASH_WORKERS=0 o bcrypt roda na thread principal.
+ */
+export class PasswordHasherService {
+  private workers: HasherWorker[] = [];
+  private queue: PendingTask[] = [];
+  private nextId = 1;
+  private started = false;
+  private completed = 0;
+  private failed = 0;
+  private maxQueueDepth = 0;
+  private totalWaitMs = 0;
+
+  hash(password: string): Promise<string> {
+    return this.run({ op: 'hash', password, rounds: config.passwordHashing.rounds });
+  }
+
+  compare(password: string, hash: string): Promise<boolean> {
+    return this.run({ op: 'compare', password, hash });
+  }
+
+  /**
+   * Se o valor já é um hash bcrypt ($2a$, $2b$ ou $2y$)
+   */
+  isHashed(value: string): boolean {
+    return /^\$2[aby]\$\d{2}\$/.test(value);
+  }
+
+  getStats(): PasswordHasherStats {
+    return {
+      poolSize: this.workers.length,
+      busy: this.workers.filter((slot) => slot.current).length,
+      queueDepth: this.queue.length,
+      maxQueueDepth: this.maxQueueDepth,
+      completed: this.completed,
+      failed: this.failed,
+      avgWaitMs: this.completed + this.failed > 0
+        ? Math.round((this.totalWaitMs / (this.completed + this.failed)) * 100) / 100
+        : 0,
+    };
+  }
+
+  async stop(): Promise<void> {
+    const workers = this.workers;
+    this.workers = [];
+    this.started = false;
+    await Promise.all(workers.map((slot) => slot.worker.terminate()));
+  }
+
+  private run<T>(operation: PasswordOperation): Promise<T> {
+    if (config.passwordHashing.workers <= 0) {
+      return (operation.op === 'hash'
+        ? bcrypt.hash(operation.password, operation.rounds)
+        : bcrypt.compare(operation.password, operation.hash)) as Promise<any>;
+    }
+
+    this.ensureStarted();
+
+    return new Promise<T>((resolve, reject) => {
+      this.queue.push({
+        task: { id: this.nextId++, ...operation },
+        enqueuedAt: Date.now(),
+        resolve,
+        reject,
+      });
+      this.maxQueueDepth = Math.max(this.maxQueueDepth, this.queue.length);
+      this.dispatch();
+    });
+  }
+
+  private ensureStarted(): void {
+    if (this.started) {
+      return;
+    }
+
+    this.started = true;
+    for (let index = 0; index < config.passwordHashing.workers; index++) {
+      this.workers.push(this.spawnWorker());
+    }
+
+    logger.info(`🔐 Password hashing workers started (${config.passwordHashing.workers})`);
+  }
+
+  private spawnWorker(): HasherWorker {
+    const worker = createWorker('password');
+    const slot: HasherWorker = { worker, current: null };
+
+    // Ocioso o worker não mantém o processo vivo (scripts e seeders terminam normalmente)
+    worker.unref();
+
+    worker.on('message', (result: PasswordTaskResult) => {
+      const pending = slot.current;
+      slot.current = null;
+
+      if (pending && pending.task.id === result.id) {
+        if ('error' in result) {
+          this.failed++;
+          pending.reject(new Error(result.error));
+        } else {
+          this.completed++;
+          pending.resolve(result.value);
+        }
+      }
+
+      this.dispatch();
+    });
+
+    worker.on('error', (error) => {
+      logger.error('❌ Password worker crashed:', error);
+    });
+
+    worker.on('exit', (code) => {
+      // Falha no worker: a operação em andamento é rejeitada e o worker recriado
+      if (slot.current) {
+        this.failed++;
+        slot.current.reject(new Error(`Worker de senhas encerrado (código ${code})`));
+        slot.current = null;
+      }
+
+      const index = this.workers.indexOf(slot);
+      if (index !== -1) {
+        this.workers[index] = this.spawnWorker();
+        this.dispatch();
+      }
+    });
+
+    return slot;
+  }
+
+  /**
+   * Entregar operações da fila aos workers livres
+   */
+  private dispatch(): void {
+    for (const slot of this.workers) {
+      if (slot.current) {
+        continue;
+      }
+
+      const pending = this.queue.shift();
+      if (!pending) {
+        slot.worker.unref();
+        continue;
+      }
+
+      this.totalWaitMs += Date.now() - pending.enqueuedAt;
+      slot.current = pending;
+      slot.worker.ref();
+      slot.worker.postMessage(pending.task);
+    }
+  }
+}
+
+export default new PasswordHasherService();
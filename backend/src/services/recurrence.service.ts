@@ -1,10 +1,112 @@
 import { AppDataSource } from '@/config/database';
 import { Transaction, RecurrenceType } from '@/models/Transaction';
+import monthlyTotalsService from '@/services/monthlyTotals.service';
+import dashboardCache from '@/services/dashboardCache.service';
+import dataVersionService from '@/services/dataVersion.service';
 import { logger } from '@/utils/logger';
-import { LessThanOrEqual } from 'typeorm';
+
+// Transações recorrentes (pais) processadas por lote/transação
+const RECURRENCE_CHUNK_SIZE = 500;
+
+/**
+ * Gera, para os pais do lote ($1), todas as ocorrências de nextOccurrence até
+ * $2 (ou até recurrenceEndDate) e avança nextOccurrence no mesmo comando.
+ * As ocorrências são calculadas como nextOccurrence + k * passo (sem acumular
+ * o desvio de fim de mês) e a recorrência é encerrada quando passa do fim.
+ * Os totais mensais são atualizados no mesmo comando; só os meses afetados
+ * por usuário voltam para invalidar o cache do dashboard.
+ */
+const CATCH_UP_SQL = `
+  WITH due AS (
+    SELECT t.id, t.type, t.amount, t.description, t."categoryId", t."userId",
+           t."nextOccurrence", t."recurrenceEndDate",
+           CASE t."recurrenceType"
+             WHEN 'daily' THEN interval '1 day'
+             WHEN 'weekly' THEN interval '7 days'
+             WHEN 'monthly' THEN interval '1 month'
+             ELSE interval '1 year'
+           END AS step,
+           -- Menor duração possível do passo, para limitar a série de k
+           CASE t."recurrenceType"
+             WHEN 'daily' THEN 86400
+             WHEN 'weekly' THEN 604800
+             WHEN 'monthly' THEN 2419200
+             ELSE 31536000
+           END AS min_step_seconds,
+           LEAST($2::timestamp, COALESCE(t."recurrenceEndDate", $2::timestamp)) AS until
+    FROM transactions t
+    WHERE t.id = ANY($1::uuid[]) AND t."isRecurring" = true AND t."nextOccurrence" <= $2
+  ),
+  occurrences AS (
+    SELECT d.id AS parent_id, d.type, d.amount, d.description, d."categoryId", d."userId",
+           k, d."nextOccurrence" + k * d.step AS occurrence
+    FROM due d
+    CROSS JOIN LATERAL generate_series(
+      0,
+      GREATEST(0, FLOOR(EXTRACT(EPOCH FROM (d.until - d."nextOccurrence")) / d.min_step_seconds))::int
+    ) AS k
+    WHERE d."nextOccurrence" + k * d.step <= d.until
+  ),
+  inserted AS (
+    INSERT INTO transactions (type, amount, description, date, "categoryId", "userId", "isRecurring", "parentTransactionId", "syncVersion", "createdAt", "updatedAt")
+    SELECT o.type, o.amount, o.description, o.occurrence::date, o."categoryId", o."userId", false, o.parent_id, v.transactions, NOW(), NOW()
+    FROM occurrences o
+    JOIN user_data_versions v ON v."userId" = o."userId"
+    RETURNING "userId", "categoryId", type, amount, date
+  ),
+  totals AS (
+    ${monthlyTotalsService.deltaUpsertSql('SELECT "userId", date, "categoryId", type, amount, 1 AS sign FROM inserted')}
+  ),
+  months AS (
+    SELECT DISTINCT "userId", date_trunc('month', date)::date::text AS date FROM inserted
+  ),
+  plan AS (
+    SELECT d.id, d."recurrenceEndDate",
+           d."nextOccurrence" + COALESCE(MAX(o.k) + 1, 0) * d.step AS next
+    FROM due d
+    LEFT JOIN occurrences o ON o.parent_id = d.id
+    GROUP BY d.id, d."recurrenceEndDate", d."nextOccurrence", d.step
+  ),
+  advanced AS (
+    UPDATE transactions t
+    SET "nextOccurrence" = CASE WHEN p."recurrenceEndDate" < p.next THEN NULL ELSE p.next END,
+        "isRecurring" = COALESCE(p."recurrenceEndDate" >= p.next, true),
+        "syncVersion" = v.transactions,
+        "updatedAt" = NOW()
+    FROM plan p, user_data_versions v
+    WHERE t.id = p.id AND v."userId" = t."userId"
+    RETURNING t.id
+  )
+  SELECT (SELECT COUNT(*) FROM advanced)::int AS advanced,
+         (SELECT COUNT(*) FROM inserted)::int AS created,
+         COALESCE((SELECT json_agg(m) FROM months m), '[]'::json) AS months
+`;
+
+/**
+ * Métricas de uma execução do processamento de recorrências
+ */
+export interface RecurrenceRunStats {
+  startedAt: Date;
+  finishedAt: Date | null;
+  chunks: number;
+  parents: number;
+  created: number;
+  // Pais com erro nesta execução (ignorados; tentados de novo na próxima)
+  failed: string[];
+  durationMs: number;
+  rowsPerSecond: number;
+}
+
+interface ChunkResult {
+  parents: number;
+  created: number;
+  // (usuário, primeiro dia do mês) que receberam ocorrências
+  months: { userId: string; date: string }[];
+}
 
 export class RecurrenceService {
   private transactionRepository = AppDataSource.getRepository(Transaction);
+  private lastRun: RecurrenceRunStats | null = null;
 
   /**
    * Calcular próxima ocorrência baseada no tipo de recorrência
@@ -31,75 +133,168 @@ export class RecurrenceService {
   }
 
   /**
-   * Processar transações recorrentes que devem ser geradas
+   * Processar transações recorrentes vencidas em lotes.
+   * Cada lote é uma transação: trava os pais com SKIP LOCKED, gera todas as
+   * ocorrências perdidas até agora e avança nextOccurrence no mesmo comando.
+   * Como o avanço é gravado junto com as ocorrências, rodar de novo não duplica nada.
+   * Se um lote falhar, seus pais são reprocessados um a um e os que falharem
+   * de novo são registrados e ignorados até a próxima execução.
+   * Retorna a quantidade de transações recorrentes (pais) processadas.
    */
-  async processRecurringTransactions(): Promise<number> {
-    try {
-      const now = new Date();
-      let processedCount = 0;
-
-      // Buscar transações recorrentes que precisam gerar nova ocorrência
-      const recurringTransactions = await this.transactionRepository.find({
-        where: {
-          isRecurring: true,
-          nextOccurrence: LessThanOrEqual(now),
-        },
-      });
+  async processRecurringTransactions(chunkSize: number = RECURRENCE_CHUNK_SIZE): Promise<number> {
+    const now = new Date();
+    const startedAt = Date.now();
+    const stats: RecurrenceRunStats = {
+      startedAt: new Date(startedAt),
+      finishedAt: null,
+      chunks: 0,
+      parents: 0,
+      created: 0,
+      failed: [],
+      durationMs: 0,
+      rowsPerSecond: 0,
+    };
 
-      logger.info(`📅 Found ${recurringTransactions.length} recurring transactions to process`);
+    try {
+      while (true) {
+        const chunkStartedAt = Date.now();
+        const locked: string[] = [];
+        let chunk: ChunkResult | null;
 
-      for (const transaction of recurringTransactions) {
         try {
-          // Verificar se ainda está dentro do período de recorrência
-          if (transaction.recurrenceEndDate && new Date(transaction.recurrenceEndDate) < now) {
-            logger.info(`⏹️  Recurring transaction ${transaction.id} has ended, skipping`);
-            
-            // Desativar recorrência
-            transaction.isRecurring = false;
-            transaction.nextOccurrence = null;
-            await this.transactionRepository.save(transaction);
-            continue;
+          chunk = await this.runChunk(now, chunkSize, stats.failed, null, locked);
+        } catch (error) {
+          // Falha antes de travar qualquer pai: erro de infraestrutura, não de dados
+          if (locked.length === 0) {
+            throw error;
           }
 
-          // Criar nova transação baseada na recorrente
-          const nextDate = new Date(transaction.nextOccurrence!);
-          const dateString = `${nextDate.getFullYear()}-${String(nextDate.getMonth() + 1).padStart(2, '0')}-${String(nextDate.getDate()).padStart(2, '0')}`;
-          
-          const newTransaction = this.transactionRepository.create({
-            type: transaction.type,
-            amount: transaction.amount,
-            description: transaction.description,
-            date: dateString,
-            categoryId: transaction.categoryId,
-            userId: transaction.userId,
-            isRecurring: false, // Transações geradas não são recorrentes
-            parentTransactionId: transaction.id,
-          });
-
-          await this.transactionRepository.save(newTransaction);
-          logger.info(`✅ Created new transaction from recurring ${transaction.id}`);
-
-          // Atualizar próxima ocorrência
-          transaction.nextOccurrence = this.calculateNextOccurrence(
-            transaction.nextOccurrence!,
-            transaction.recurrenceType!
-          );
-          await this.transactionRepository.save(transaction);
-
-          processedCount++;
-        } catch (error) {
-          logger.error(`❌ Error processing recurring transaction ${transaction.id}:`, error);
+          logger.warn(`⚠️  Recurrence chunk failed, retrying its ${locked.length} parent(s) one by one:`, error);
+          chunk = await this.retryOneByOne(now, locked, stats.failed);
+        }
+
+        // Nada vencido (ou tudo travado por outra execução)
+        if (!chunk) {
+          break;
         }
-      }
 
-      logger.info(`🎉 Processed ${processedCount} recurring transactions`);
-      return processedCount;
+        await this.invalidateDashboards(chunk.months);
+
+        stats.chunks++;
+        stats.parents += chunk.parents;
+        stats.created += chunk.created;
+
+        const chunkSeconds = Math.max((Date.now() - chunkStartedAt) / 1000, 0.001);
+        logger.info(
+          `📅 Recurrence chunk ${stats.chunks}: ${chunk.parents} parent(s), ${chunk.created} occurrence(s) ` +
+            `(${Math.round(chunk.created / chunkSeconds)} rows/s)`
+        );
+
+        if (locked.length < chunkSize) {
+          break;
+        }
+      }
     } catch (error) {
       logger.error('❌ Error in processRecurringTransactions:', error);
       throw error;
+    } finally {
+      stats.finishedAt = new Date();
+      stats.durationMs = Date.now() - startedAt;
+      stats.rowsPerSecond = Math.round(stats.created / Math.max(stats.durationMs / 1000, 0.001));
+      this.lastRun = stats;
+    }
+
+    logger.info(
+      `🎉 Processed ${stats.parents} recurring transaction(s): ${stats.created} occurrence(s) ` +
+        `in ${stats.durationMs}ms (${stats.rowsPerSecond} rows/s)` +
+        (stats.failed.length > 0 ? `, ${stats.failed.length} skipped after errors` : '')
+    );
+    return stats.parents;
+  }
+
+  /**
+   * Um lote em uma transação. `exclude`: pais que já falharam nesta execução;
+   * `only`: restringe aos ids informados. Os ids travados são acrescentados a
+   * `locked` antes do processamento, para o reprocessamento em caso de erro.
+   */
+  private runChunk(
+    now: Date,
+    limit: number,
+    exclude: string[],
+    only: string[] | null,
+    locked: string[]
+  ): Promise<ChunkResult | null> {
+    return AppDataSource.transaction(async (manager) => {
+      const due = await manager.query(
+        `SELECT id, "userId" FROM transactions
+         WHERE "isRecurring" = true AND "nextOccurrence" <= $1
+           AND id <> ALL($3::uuid[])
+           AND ($4::uuid[] IS NULL OR id = ANY($4::uuid[]))
+         ORDER BY "nextOccurrence", id
+         LIMIT $2
+         FOR UPDATE SKIP LOCKED`,
+        [now, limit, exclude, only]
+      );
+
+      if (due.length === 0) {
+        return null;
+      }
+      locked.push(...due.map((row: any) => row.id));
+
+      // Versões incrementadas antes do CATCH_UP_SQL, que as lê para marcar as linhas gravadas
+      await dataVersionService.bumpMany(manager, due.map((row: any) => row.userId), 'transactions');
+      const [result] = await manager.query(CATCH_UP_SQL, [due.map((row: any) => row.id), now]);
+      return { parents: result.advanced as number, created: result.created as number, months: result.months as any[] };
+    });
+  }
+
+  /**
+   * Reprocessar os pais de um lote que falhou, cada um na sua transação;
+   * os que falharem são registrados em `failed` e ignorados
+   */
+  private async retryOneByOne(now: Date, ids: string[], failed: string[]): Promise<ChunkResult> {
+    const result: ChunkResult = { parents: 0, created: 0, months: [] };
+
+    for (const id of ids) {
+      try {
+        const single = await this.runChunk(now, 1, failed, [id], []);
+        if (single) {
+          result.parents += single.parents;
+          result.created += single.created;
+          result.months.push(...single.months);
+        }
+      } catch (error) {
+        failed.push(id);
+        logger.error(`❌ Error processing recurring transaction ${id}, skipping:`, error);
+      }
+    }
+
+    return result;
+  }
+
+  /**
+   * Remover do cache os dashboards dos meses que receberam ocorrências
+   */
+  private async invalidateDashboards(months: { userId: string; date: string }[]): Promise<void> {
+    const datesByUser = new Map<string, string[]>();
+    for (const row of months) {
+      const dates = datesByUser.get(row.userId) || [];
+      dates.push(row.date);
+      datesByUser.set(row.userId, dates);
+    }
+
+    for (const [userId, dates] of datesByUser) {
+      await dashboardCache.invalidateDates(userId, dates);
     }
   }
 
+  /**
+   * Métricas da última execução do processamento
+   */
+  getLastRunStats(): RecurrenceRunStats | null {
+    return this.lastRun;
+  }
+
   /**
    * Criar transação recorrente
    */
@@ -154,23 +349,38 @@ export class RecurrenceService {
     const nextOccurrence = this.calculateNextOccurrence(firstOccurrenceForCalc, recurrenceType);
 
     // Usar query SQL direta para garantir que a data seja salva corretamente
-    const result = await this.transactionRepository.query(
-      `INSERT INTO transactions (type, amount, description, date, "categoryId", "userId", "isRecurring", "recurrenceType", "recurrenceEndDate", "nextOccurrence")
-       VALUES ($1, $2, $3, $4::date, $5, $6, $7, $8, $9, $10)
-       RETURNING id`,
-      [
-        transactionData.type,
-        transactionData.amount,
-        transactionData.description,
-        transactionDate, // String no formato YYYY-MM-DD
-        transactionData.categoryId,
-        transactionData.userId,
-        true, // isRecurring
-        recurrenceType,
-        recurrenceEndDate || null,
-        nextOccurrence
-      ]
-    );
+    const result = await AppDataSource.transaction(async (manager) => {
+      const { transactions: syncVersion } = await dataVersionService.bump(manager, transactionData.userId!, 'transactions');
+      const inserted = await manager.query(
+        `INSERT INTO transactions (type, amount, description, date, "categoryId", "userId", "isRecurring", "recurrenceType", "recurrenceEndDate", "nextOccurrence", "syncVersion")
+         VALUES ($1, $2, $3, $4::date, $5, $6, $7, $8, $9, $10, $11)
+         RETURNING id`,
+        [
+          transactionData.type,
+          transactionData.amount,
+          transactionData.description,
+          transactionDate, // String no formato YYYY-MM-DD
+          transactionData.categoryId,
+          transactionData.userId,
+          true, // isRecurring
+          recurrenceType,
+          recurrenceEndDate || null,
+          nextOccurrence,
+          syncVersion
+        ]
+      );
+
+      await monthlyTotalsService.apply(manager, {
+        userId: transactionData.userId!,
+        categoryId: transactionData.categoryId!,
+        type: transactionData.type!,
+        amount: transactionData.amount!,
+        date: transactionDate,
+      });
+
+      return inserted;
+    });
+    await dashboardCache.invalidateDates(transactionData.userId!, [transactionDate]);
     
     const transactionId = result[0].id;
     logger.info(`✅ Created recurring transaction ${transactionId} (${recurrenceType})`);
@@ -205,8 +415,14 @@ export class RecurrenceService {
       updates.nextOccurrence = this.calculateNextOccurrence(currentNext, updates.recurrenceType);
     }
 
+    const previousDate = transaction.date;
     Object.assign(transaction, updates);
-    await this.transactionRepository.save(transaction);
+    await AppDataSource.transaction(async (manager) => {
+      const { transactions: syncVersion } = await dataVersionService.bump(manager, transaction.userId, 'transactions');
+      transaction.syncVersion = String(syncVersion);
+      await manager.getRepository(Transaction).save(transaction);
+    });
+    await dashboardCache.invalidateDates(transaction.userId, [previousDate, transaction.date]);
 
     return transaction;
   }
@@ -225,7 +441,12 @@ export class RecurrenceService {
 
     transaction.isRecurring = false;
     transaction.nextOccurrence = null;
-    await this.transactionRepository.save(transaction);
+    await AppDataSource.transaction(async (manager) => {
+      const { transactions: syncVersion } = await dataVersionService.bump(manager, transaction.userId, 'transactions');
+      transaction.syncVersion = String(syncVersion);
+      await manager.getRepository(Transaction).save(transaction);
+    });
+    await dashboardCache.invalidateDates(transaction.userId, [transaction.date]);
 
     logger.info(`⏹️  Cancelled recurrence for transaction ${transactionId}`);
     return transaction;
@@ -0,0 +1,191 @@
+import { AppDataSource } from '@/config/database';
+
+export type ReportGranularity = 'day' | 'week' | 'month';
+
+export interface ChartOptions {
+  // Quantidade de meses (incluindo o atual)
+  period: number;
+  granularity: ReportGranularity;
+  // Intervalo das categorias: período inteiro ou apenas o mês atual
+  breakdown: 'period' | 'current_month';
+}
+
+export interface TrendPoint {
+  period: string;
+  total: number;
+  cumulative: number;
+}
+
+export interface BalancePoint {
+  period: string;
+  balance: number;
+  cumulative: number;
+}
+
+export class ReportService {
+  /**
+   * Séries do gráfico de relatórios, já agregadas no banco.
+   * As tendências usam uma única consulta com funções de janela (acumulados);
+   * na granularidade mensal elas saem de user_monthly_totals.
+   */
+  async getChartData(userId: string, options: ChartOptions) {
+    const [startDate, endDate] = this.getPeriodRange(options.period);
+    const breakdownStart = options.breakdown === 'current_month'
+      ? this.getPeriodRange(1)[0]
+      : startDate;
+
+    const [trendRows, breakdownRows] = await Promise.all([
+      options.granularity === 'month'
+        ? this.queryMonthlyTrends(userId, startDate, endDate)
+        : this.queryTransactionTrends(userId, startDate, endDate, options.granularity),
+      this.queryCategoryBreakdown(userId, breakdownStart, endDate),
+    ]);
+
+    const incomeTrends: TrendPoint[] = [];
+    const expenseTrends: TrendPoint[] = [];
+    const balanceTrends: BalancePoint[] = [];
+
+    for (const row of trendRows) {
+      incomeTrends.push({
+        period: row.period,
+        total: parseFloat(row.income),
+        cumulative: parseFloat(row.income_cumulative),
+      });
+      expenseTrends.push({
+        period: row.period,
+        total: parseFloat(row.expense),
+        cumulative: parseFloat(row.expense_cumulative),
+      });
+      balanceTrends.push({
+        period: row.period,
+        balance: parseFloat(row.income) - parseFloat(row.expense),
+        cumulative: parseFloat(row.balance_cumulative),
+      });
+    }
+
+    return {
+      startDate,
+      endDate,
+      granularity: options.granularity,
+      income_trends: incomeTrends,
+      expense_trends: expenseTrends,
+      balance_trends: balanceTrends,
+      category_breakdown: breakdownRows.map((row: any) => ({
+        categoryId: row.categoryId,
+        name: row.name,
+        type: row.type,
+        color: row.color,
+        icon: row.icon,
+        total: parseFloat(row.total),
+        percentage: parseFloat(row.percentage) || 0,
+      })),
+    };
+  }
+
+  /**
+   * Tendências por dia/semana a partir das transações (buckets vazios incluídos)
+   */
+  private queryTransactionTrends(
+    userId: string,
+    startDate: string,
+    endDate: string,
+    granularity: ReportGranularity
+  ): Promise<any[]> {
+    return AppDataSource.manager.query(
+      `WITH buckets AS (
+         SELECT generate_series(
+                  date_trunc($4, $2::timestamp),
+                  $3::timestamp,
+                  ('1 ' || $4)::interval
+                )::date AS bucket
+       ),
+       per_bucket AS (
+         SELECT date_trunc($4, t.date::timestamp)::date AS bucket,
+                SUM(CASE WHEN t.type = 'income' THEN t.amount ELSE 0 END) AS income,
+                SUM(CASE WHEN t.type = 'expense' THEN t.amount ELSE 0 END) AS expense
+         FROM transactions t
+         WHERE t."userId" = $1 AND t.date BETWEEN $2 AND $3
+         GROUP BY 1
+       )
+       ${this.trendSelect()}`,
+      [userId, startDate, endDate, granularity]
+    );
+  }
+
+  /**
+   * Tendências mensais a partir dos totais mensais mantidos incrementalmente
+   */
+  private queryMonthlyTrends(userId: string, startDate: string, endDate: string): Promise<any[]> {
+    return AppDataSource.manager.query(
+      `WITH buckets AS (
+         SELECT generate_series($2::timestamp, $3::timestamp, '1 month'::interval)::date AS bucket
+       ),
+       per_bucket AS (
+         SELECT make_date(umt.year, umt.month, 1) AS bucket,
+                SUM(CASE WHEN umt.type = 'income' THEN umt.total ELSE 0 END) AS income,
+                SUM(CASE WHEN umt.type = 'expense' THEN umt.total ELSE 0 END) AS expense
+         FROM user_monthly_totals umt
+         WHERE umt."userId" = $1
+           AND make_date(umt.year, umt.month, 1) BETWEEN $2::date AND $3::date
+         GROUP BY 1
+       )
+       ${this.trendSelect()}`,
+      [userId, startDate, endDate]
+    );
+  }
+
+  /**
+   * Valores por bucket com somas acumuladas (janela ordenada pelo bucket)
+   */
+  private trendSelect(): string {
+    return `SELECT b.bucket::text AS period,
+                   COALESCE(p.income, 0) AS income,
+                   COALESCE(p.expense, 0) AS expense,
+                   SUM(COALESCE(p.income, 0)) OVER w AS income_cumulative,
+                   SUM(COALESCE(p.expense, 0)) OVER w AS expense_cumulative,
+                   SUM(COALESCE(p.income, 0) - COALESCE(p.expense, 0)) OVER w AS balance_cumulative
+            FROM buckets b
+            LEFT JOIN per_bucket p ON p.bucket = b.bucket
+            WINDOW w AS (ORDER BY b.bucket)
+            ORDER BY b.bucket`;
+  }
+
+  /**
+   * Totais por categoria e percentual dentro do tipo (receita/despesa)
+   */
+  private queryCategoryBreakdown(userId: string, startDate: string, endDate: string): Promise<any[]> {
+    return AppDataSource.manager.query(
+      `SELECT c.id AS "categoryId",
+              c.name AS name,
+              c.color AS color,
+              c.icon AS icon,
+              umt.type AS type,
+              SUM(umt.total) AS total,
+              ROUND(SUM(umt.total) * 100 / NULLIF(SUM(SUM(umt.total)) OVER (PARTITION BY umt.type), 0), 2) AS percentage
+       FROM user_monthly_totals umt
+       INNER JOIN categories c ON c.id = umt."categoryId"
+       WHERE umt."userId" = $1
+         AND make_date(umt.year, umt.month, 1) BETWEEN $2::date AND $3::date
+         AND umt.count > 0
+       GROUP BY c.id, umt.type
+       ORDER BY total DESC`,
+      [userId, startDate, endDate]
+    );
+  }
+
+  /**
+   * [primeiro dia de (period - 1) meses atrás, último dia do mês atual]
+   */
+  private getPeriodRange(period: number): [string, string] {
+    const now = new Date();
+    const start = new Date(now.getFullYear(), now.getMonth() - (period - 1), 1);
+    const end = new Date(now.getFullYear(), now.getMonth() + 1, 0);
+
+    const format = (date: Date) =>
+      `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}-${String(date.getDate()).padStart(2, '0')}`;
+
+    return [format(start), format(end)];
+  }
+}
+
+export default new ReportService();
@@ -1,5 +1,7 @@
 import { AppDataSource } from '../config/database';
 import { SavingsGoal, CreateSavingsGoalData } from '../models/SavingsGoal';
+import monthlyTotalsService from './monthlyTotals.service';
+import dataVersionService from './dataVersion.service';
 
 export class SavingsGoalService {
   /**
@@ -19,7 +21,11 @@ export class SavingsGoalService {
       RETURNING *
     `;
 
-    const result = await AppDataSource.manager.query(query, [userId, targetAmount, month, year, description || null]);
+    const result = await AppDataSource.transaction(async (manager) => {
+      const rows = await manager.query(query, [userId, targetAmount, month, year, description || null]);
+      await dataVersionService.bump(manager, userId, 'goals');
+      return rows;
+    });
     return this.mapToSavingsGoal(result[0]);
   }
 
@@ -56,29 +62,25 @@ export class SavingsGoalService {
    * Atualizar valor atual da meta baseado nas transações do mês
    */
   async updateCurrentAmount(userId: string, month: number, year: number): Promise<void> {
-    // Calcular saldo do mês (receitas - despesas)
-    const transactionsQuery = `
-      SELECT 
-        COALESCE(SUM(CASE WHEN type = 'income' THEN amount ELSE 0 END), 0) as income,
-        COALESCE(SUM(CASE WHEN type = 'expense' THEN amount ELSE 0 END), 0) as expense
-      FROM transactions
-      WHERE "userId" = $1
-        AND EXTRACT(MONTH FROM date) = $2
-        AND EXTRACT(YEAR FROM date) = $3
-    `;
-
-    const transactionsResult = await AppDataSource.manager.query(transactionsQuery, [userId, month, year]);
-    const { income, expense } = transactionsResult[0];
-    const currentAmount = Math.max(0, parseFloat(income) - parseFloat(expense));
+    // Calcular saldo do mês (receitas - despesas) a partir dos totais mensais
+    const { income, expense } = await monthlyTotalsService.getMonthSummary(userId, month, year);
+    const currentAmount = Math.max(0, income - expense);
 
-    // Atualizar current_amount na meta
+    // Atualizar current_amount na meta (apenas se mudou, para não alterar updated_at à toa)
     const updateQuery = `
       UPDATE savings_goals
       SET current_amount = $1, updated_at = CURRENT_TIMESTAMP
       WHERE user_id = $2 AND month = $3 AND year = $4
+        AND current_amount IS DISTINCT FROM $1::numeric
     `;
 
-    await AppDataSource.manager.query(updateQuery, [currentAmount, userId, month, year]);
+    await AppDataSource.transaction(async (manager) => {
+      // UPDATE retorna [linhas, quantidade afetada]
+      const [, affected] = await manager.query(updateQuery, [currentAmount, userId, month, year]);
+      if (affected > 0) {
+        await dataVersionService.bump(manager, userId, 'goals');
+      }
+    });
   }
 
   /**
@@ -104,8 +106,16 @@ export class SavingsGoalService {
       WHERE id = $1 AND user_id = $2
     `;
 
-    const result = await AppDataSource.manager.query(query, [goalId, userId]);
-    return result.length > 0;
+    return AppDataSource.transaction(async (manager) => {
+      // DELETE retorna [linhas, quantidade afetada]
+      const [, affected] = await manager.query(query, [goalId, userId]);
+      if (affected === 0) {
+        return false;
+      }
+
+      await dataVersionService.bump(manager, userId, 'goals');
+      return true;
+    });
   }
 
   /**
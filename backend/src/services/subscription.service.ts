@@ -1,5 +1,6 @@
 import { AppDataSource } from '../config/database';
 import { User } from '../models/User';
+import { entitlementService } from './entitlement.service';
 
 export class SubscriptionService {
   private userRepository = AppDataSource.getRepository(User);
@@ -8,7 +9,7 @@ export class SubscriptionService {
    * Obter status da assinatura do usuário
    */
   async getSubscriptionStatus(userId: string) {
-    const user = await this.userRepository.findOne({ where: { id: userId } });
+    const user = await entitlementService.getUser(userId);
 
     if (!user) {
       throw new Error('Usuário não encontrado');
@@ -51,6 +52,7 @@ export class SubscriptionService {
     user.isPremium = true;
 
     await this.userRepository.save(user);
+    entitlementService.invalidate(userId);
 
     return user;
   }
@@ -70,6 +72,7 @@ export class SubscriptionService {
     user.isPremium = false;
 
     await this.userRepository.save(user);
+    entitlementService.invalidate(userId);
 
     return user;
   }
@@ -104,6 +107,7 @@ export class SubscriptionService {
     user.isPremium = true;
 
     await this.userRepository.save(user);
+    entitlementService.invalidate(userId);
 
     return user;
   }
@@ -125,6 +129,12 @@ export class SubscriptionService {
       .andWhere('planType = :planType', { planType: 'premium' })
       .execute();
 
+    // Os usuários afetados não são conhecidos aqui; entradas ainda em cache já
+    // expiram sozinhas no planEndDate, então basta descartar o cache desta instância
+    if (result.affected) {
+      entitlementService.clear();
+    }
+
     return result.affected || 0;
   }
 
@@ -0,0 +1,141 @@
+import { EntityManager, MoreThan } from 'typeorm';
+import { AppDataSource } from '@/config/database';
+import { config } from '@/config/env';
+import { Transaction } from '@/models/Transaction';
+import { Category } from '@/models/Category';
+import { SyncEntity } from '@/models/SyncTombstone';
+import dataVersionService from '@/services/dataVersion.service';
+import { decodeSyncCursor, encodeSyncCursor } from '@/utils/cursor';
+
+export interface SyncChanges {
+  // true: lista completa (sem cursor ou cursor expirado); o cliente substitui o estado local
+  full: boolean;
+  cursor: string;
+  transactions: Transaction[];
+  categories: Category[];
+  deleted: {
+    transactions: string[];
+    categories: string[];
+  };
+}
+
+export class SyncService {
+  /**
+   * Registrar exclusões para a sincronização incremental.
+   * Deve ser chamado com o EntityManager da mesma transação da exclusão,
+   * com a versão devolvida por dataVersionService.bump.
+   */
+  async recordDeletions(
+    manager: EntityManager,
+    userId: string,
+    entity: SyncEntity,
+    entityIds: string[],
+    syncVersion: number
+  ): Promise<void> {
+    if (entityIds.length === 0) {
+      return;
+    }
+
+    await manager.query(
+      this.tombstoneSql(`SELECT $1::varchar AS entity, id AS "entityId", $2::uuid AS "userId", $3::bigint AS "syncVersion" FROM unnest($4::uuid[]) AS id`),
+      [entity, userId, syncVersion, entityIds]
+    );
+  }
+
+  /**
+   * SQL de gravação de lápides para uso em CTEs de um único comando.
+   * source deve devolver (entity, "entityId", "userId", "syncVersion").
+   */
+  tombstoneSql(source: string): string {
+    return `INSERT INTO sync_tombstones (entity, "entityId", "userId", "syncVersion", "deletedAt")
+       SELECT s.entity, s."entityId", s."userId", s."syncVersion", NOW() FROM (${source}) s
+       ON CONFLICT (entity, "entityId")
+       DO UPDATE SET "syncVersion" = EXCLUDED."syncVersion", "deletedAt" = NOW()`;
+  }
+
+  /**
+   * Transações e categorias criadas, alteradas ou excluídas desde o cursor
+   */
+  async getChanges(userId: string, since?: string): Promise<SyncChanges> {
+    const cursor = since ? decodeSyncCursor(since) : null;
+    const issuedAt = Date.now();
+    // Lápides mais antigas que a retenção já podem ter sido removidas
+    const horizon = issuedAt - config.sync.tombstoneRetentionDays * 24 * 60 * 60 * 1000;
+    const full = !cursor || cursor.issuedAt < horizon;
+
+    if (cursor && !full) {
+      // Caminho comum de clientes atualizados: uma leitura pela chave primária
+      const versions = await dataVersionService.get(userId);
+      if (versions.transactions === cursor.transactions && versions.categories === cursor.categories) {
+        return {
+          full: false,
+          cursor: encodeSyncCursor({ ...cursor, issuedAt }),
+          transactions: [],
+          categories: [],
+          deleted: { transactions: [], categories: [] },
+        };
+      }
+    }
+
+    // Snapshot único: o cursor devolvido corresponde exatamente às linhas lidas
+    return AppDataSource.transaction('REPEATABLE READ', async (manager) => {
+      const versions = await dataVersionService.get(userId, manager);
+
+      // Mesma conexão: consultas em sequência
+      const transactions = await manager.getRepository(Transaction).find({
+        where: full ? { userId } : { userId, syncVersion: MoreThan(String(cursor!.transactions)) },
+        relations: ['category'],
+        order: { date: 'DESC', createdAt: 'DESC' },
+      });
+      const categories = await manager.getRepository(Category).find({
+        where: full ? { userId } : { userId, syncVersion: MoreThan(String(cursor!.categories)) },
+        order: { name: 'ASC' },
+      });
+      const tombstones = full
+        ? []
+        : await manager.query(
+            `SELECT entity, "entityId" FROM sync_tombstones
+             WHERE "userId" = $1
+               AND ((entity = 'transaction' AND "syncVersion" > $2)
+                 OR (entity = 'category' AND "syncVersion" > $3))`,
+            [userId, cursor!.transactions, cursor!.categories]
+          );
+
+      const deleted: SyncChanges['deleted'] = { transactions: [], categories: [] };
+      for (const tombstone of tombstones) {
+        if (tombstone.entity === 'transaction') {
+          deleted.transactions.push(tombstone.entityId);
+        } else {
+          deleted.categories.push(tombstone.entityId);
+        }
+      }
+
+      return {
+        full,
+        cursor: encodeSyncCursor({
+          transactions: versions.transactions,
+          categories: versions.categories,
+          issuedAt,
+        }),
+        transactions,
+        categories,
+        deleted,
+      };
+    });
+  }
+
+  /**
+   * Remover lápides fora da janela de retenção
+   */
+  async pruneTombstones(): Promise<{ deleted: number }> {
+    // DELETE retorna [linhas, quantidade afetada]
+    const [, deleted] = await AppDataSource.query(
+      `DELETE FROM sync_tombstones WHERE "deletedAt" < NOW() - make_interval(days => $1)`,
+      [config.sync.tombstoneRetentionDays]
+    );
+
+    return { deleted };
+  }
+}
+
+export default new SyncService();
@@ -1,101 +1,302 @@
 import { AppDataSource } from '@/config/database';
 import { Transaction, TransactionType } from '@/models/Transaction';
+import { Category } from '@/models/Category';
+import monthlyTotalsService from '@/services/monthlyTotals.service';
+import dashboardCache from '@/services/dashboardCache.service';
+import dataVersionService from '@/services/dataVersion.service';
+import syncService from '@/services/sync.service';
 import { NotFoundError } from '@/utils/errors';
+import { encodeCursor, decodeCursor } from '@/utils/cursor';
+import { createTransactionSchema } from '@/validators/transaction.validator';
 import { Between } from 'typeorm';
+import { v4 as uuidv4 } from 'uuid';
+
+// Linhas por INSERT multi-linha (7 parâmetros por linha, abaixo do limite do PostgreSQL)
+const BULK_INSERT_CHUNK_SIZE = 1000;
+
+export interface BulkRowResult {
+  index: number;
+  status: 'created' | 'invalid' | 'duplicate';
+  id?: string;
+  errors?: { field: string; message: string }[];
+}
+
+export interface BulkCreateOptions {
+  // Ignorar linhas com mesma (data, valor, descrição) já gravadas ou repetidas no lote
+  skipDuplicates?: boolean;
+  // Gravar a data exatamente como recebida (ex: extratos importados)
+  preserveDates?: boolean;
+}
+
+// Campos que a atualização pode alterar (demais chaves do corpo são ignoradas)
+const UPDATABLE_FIELDS = ['type', 'amount', 'description', 'date', 'categoryId'] as const;
+
+// Colunas devolvidas pelas escritas: transação (t) e categoria (c) em uma linha
+const RETURNING_COLUMNS = `
+  t.id, t.type, t.amount, t.description, t.date::text AS date, t."categoryId", t."userId",
+  t."isRecurring", t."recurrenceType", t."recurrenceEndDate", t."nextOccurrence",
+  t."parentTransactionId", t."syncVersion", t."createdAt", t."updatedAt",
+  c.name AS category_name, c.type AS category_type, c.color AS category_color, c.icon AS category_icon,
+  c."syncVersion" AS "category_syncVersion", c."createdAt" AS "category_createdAt", c."updatedAt" AS "category_updatedAt"`;
+
+/**
+ * Criação: $1 = campos da transação em JSON, $2 = categoria, $3 = usuário.
+ * json_populate_record converte cada campo para o tipo da coluna (enums, date).
+ * Sem linha no resultado quando a categoria não pertence ao usuário.
+ */
+const CREATE_SQL = `
+  WITH category AS (
+    SELECT * FROM categories WHERE id = $2 AND "userId" = $3
+  ),
+  version AS (
+    ${dataVersionService.bumpSql('SELECT "userId" FROM category', 'transactions')}
+  ),
+  inserted AS (
+    INSERT INTO transactions (type, amount, description, date, "categoryId", "userId", "isRecurring", "recurrenceType", "recurrenceEndDate", "syncVersion", "createdAt", "updatedAt")
+    SELECT r.type, r.amount, r.description, r.date, c.id, c."userId", r."isRecurring", r."recurrenceType", r."recurrenceEndDate", v.version, NOW(), NOW()
+    FROM json_populate_record(NULL::transactions, $1::json) r, category c, version v
+    RETURNING *
+  ),
+  totals AS (
+    ${monthlyTotalsService.deltaUpsertSql('SELECT "userId", date, "categoryId", type, amount, 1 AS sign FROM inserted')}
+  )
+  SELECT ${RETURNING_COLUMNS}
+  FROM inserted t
+  JOIN category c ON c.id = t."categoryId"
+`;
+
+/**
+ * Atualização: $1 = transação, $2 = usuário, $3 = campos alterados em JSON.
+ * Sem linha quando a transação não é do usuário; linha com id nulo quando a
+ * nova categoria não pertence a ele.
+ */
+const UPDATE_SQL = `
+  WITH previous AS (
+    SELECT t AS original, t.id, t."userId", t.date, t."categoryId", t.type, t.amount
+    FROM transactions t
+    WHERE t.id = $1 AND t."userId" = $2
+    FOR UPDATE
+  ),
+  patched AS (
+    SELECT (jsonb_populate_record(p.original, $3::jsonb)).* FROM previous p
+  ),
+  category AS (
+    SELECT c.* FROM categories c JOIN patched n ON c.id = n."categoryId" WHERE c."userId" = $2
+  ),
+  version AS (
+    ${dataVersionService.bumpSql('SELECT "userId" FROM category', 'transactions')}
+  ),
+  updated AS (
+    UPDATE transactions t
+    SET type = n.type,
+        amount = n.amount,
+        description = n.description,
+        date = n.date,
+        "categoryId" = n."categoryId",
+        "syncVersion" = v.version,
+        "updatedAt" = NOW()
+    FROM patched n, version v
+    WHERE t.id = n.id
+    RETURNING t.*
+  ),
+  totals AS (
+    ${monthlyTotalsService.deltaUpsertSql(`
+      SELECT "userId", date, "categoryId", type, amount, -1 AS sign FROM previous WHERE EXISTS (SELECT 1 FROM updated)
+      UNION ALL
+      SELECT "userId", date, "categoryId", type, amount, 1 AS sign FROM updated`)}
+  )
+  SELECT p.date::text AS "previousDate", ${RETURNING_COLUMNS}
+  FROM previous p
+  LEFT JOIN updated t ON t.id = p.id
+  LEFT JOIN category c ON c.id = t."categoryId"
+`;
+
+/**
+ * Exclusão: $1 = transação, $2 = usuário. Sem linha quando não é do usuário.
+ */
+const DELETE_SQL = `
+  WITH deleted AS (
+    DELETE FROM transactions
+    WHERE id = $1 AND "userId" = $2
+    RETURNING id, "userId", date, "categoryId", type, amount
+  ),
+  version AS (
+    ${dataVersionService.bumpSql('SELECT "userId" FROM deleted', 'transactions')}
+  ),
+  tombstone AS (
+    ${syncService.tombstoneSql(`SELECT 'transaction'::varchar AS entity, d.id AS "entityId", d."userId", v.version AS "syncVersion" FROM deleted d JOIN version v ON v."userId" = d."userId"`)}
+  ),
+  totals AS (
+    ${monthlyTotalsService.deltaUpsertSql('SELECT "userId", date, "categoryId", type, amount, -1 AS sign FROM deleted')}
+  )
+  SELECT date::text AS date FROM deleted
+`;
 
 export class TransactionService {
   private transactionRepository = AppDataSource.getRepository(Transaction);
 
+  /**
+   * Criar transação em um único comando: checa a categoria do usuário, incrementa
+   * a versão de sincronização, insere, atualiza os totais mensais e devolve a
+   * transação com a categoria
+   */
   async create(userId: string, data: any) {
-    // Log para debug
-    console.log('📅 [DEBUG] Data recebida:', data.date, 'Tipo:', typeof data.date);
-    
     // Garantir que a data seja tratada corretamente (sem timezone)
-    // ADICIONAR 2 DIAS para compensar o timezone do PostgreSQL
-    let transactionDate: string;
-    if (data.date) {
-      if (typeof data.date === 'string') {
-        // Adicionar 2 dias à data
-        const [year, month, day] = data.date.split('-').map(Number);
-        const dateObj = new Date(year, month - 1, day);
-        dateObj.setDate(dateObj.getDate() + 2); // ADICIONAR 2 DIAS
-        
-        const newYear = dateObj.getFullYear();
-        const newMonth = String(dateObj.getMonth() + 1).padStart(2, '0');
-        const newDay = String(dateObj.getDate()).padStart(2, '0');
-        transactionDate = `${newYear}-${newMonth}-${newDay}`;
-        
-        console.log('📅 [DEBUG] Data original:', data.date);
-        console.log('📅 [DEBUG] Data +2 dias:', transactionDate);
-      } else {
-        const dateObj = new Date(data.date);
-        dateObj.setDate(dateObj.getDate() + 2); // ADICIONAR 2 DIAS
-        
-        const year = dateObj.getFullYear();
-        const month = String(dateObj.getMonth() + 1).padStart(2, '0');
-        const day = String(dateObj.getDate()).padStart(2, '0');
-        transactionDate = `${year}-${month}-${day}`;
-      }
-    } else {
-      // Se não vier data, usar hoje no formato string + 2 dias
-      const today = new Date();
-      today.setDate(today.getDate() + 2); // ADICIONAR 2 DIAS
-      transactionDate = `${today.getFullYear()}-${String(today.getMonth() + 1).padStart(2, '0')}-${String(today.getDate()).padStart(2, '0')}`;
+    const transactionDate = this.normalizeTransactionDate(data.date);
+
+    const [row] = await this.transactionRepository.query(CREATE_SQL, [
+      JSON.stringify({
+        type: data.type,
+        amount: data.amount,
+        description: data.description,
+        date: transactionDate, // String no formato YYYY-MM-DD
+        isRecurring: data.isRecurring || false,
+        recurrenceType: data.recurrenceType || null,
+        recurrenceEndDate: data.recurrenceEndDate || null,
+      }),
+      data.categoryId,
+      userId,
+    ]);
+
+    if (!row) {
+      throw new NotFoundError('Categoria não encontrada');
     }
-    
-    // Log dos parâmetros que serão enviados
-    console.log('💾 [DEBUG] Salvando transação com parâmetros:');
-    console.log('  - Data:', transactionDate);
-    console.log('  - Tipo:', data.type);
-    console.log('  - Descrição:', data.description);
-    
-    // Testar query direta para ver o que o PostgreSQL está fazendo
-    const testResult = await this.transactionRepository.query(
-      `SELECT $1::date as test_date, CURRENT_TIMESTAMP as current_time, current_setting('TIMEZONE') as timezone`,
-      [transactionDate]
-    );
-    console.log('🧪 [DEBUG] Teste de conversão PostgreSQL:');
-    console.log('  - Input:', transactionDate);
-    console.log('  - Output:', testResult[0].test_date);
-    console.log('  - Timezone:', testResult[0].timezone);
-    console.log('  - Current time:', testResult[0].current_time);
-    
-    // Usar query SQL direta com cast simples para date
-    // O PostgreSQL vai interpretar a string como data local
-    const result = await this.transactionRepository.query(
-      `INSERT INTO transactions (type, amount, description, date, "categoryId", "userId", "isRecurring", "recurrenceType", "recurrenceEndDate", "createdAt", "updatedAt")
-       VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, NOW(), NOW())
-       RETURNING id, date::text as date`,
-      [
-        data.type,
-        data.amount,
-        data.description,
-        transactionDate, // String no formato YYYY-MM-DD (sem cast, deixar PostgreSQL interpretar)
-        data.categoryId,
-        userId,
-        data.isRecurring || false,
-        data.recurrenceType || null,
-        data.recurrenceEndDate || null
-      ]
-    );
-    
-    console.log('💾 [DEBUG] Transação salva no banco:');
-    console.log('  - ID:', result[0].id);
-    console.log('  - Data retornada:', result[0].date);
-    console.log('  - Data retornada (tipo):', typeof result[0].date);
-    console.log('  - Data retornada (instanceof Date):', result[0].date instanceof Date);
-    
-    const transactionId = result[0].id;
-    console.log('✅ [DEBUG] Transação criada com ID:', transactionId);
-    
-    return this.transactionRepository.findOne({
-      where: { id: transactionId },
-      relations: ['category'],
+
+    await dashboardCache.invalidateDates(userId, [row.date]);
+    return this.toTransaction(row);
+  }
+
+  /**
+   * Criação em lote: valida cada linha com o schema de criação, insere as
+   * válidas com INSERT multi-linha em uma única transação e retorna o
+   * resultado de cada linha na ordem recebida
+   */
+  async createBulk(userId: string, rows: any[], options: BulkCreateOptions = {}) {
+    const results: BulkRowResult[] = [];
+    const valid: { index: number; id: string; data: any; date: string }[] = [];
+
+    rows.forEach((row, index) => {
+      const { error, value } = createTransactionSchema.validate(row, {
+        abortEarly: false,
+        stripUnknown: true,
+      });
+
+      if (error) {
+        results[index] = {
+          index,
+          status: 'invalid',
+          errors: error.details.map((detail) => ({
+            field: detail.path.join('.'),
+            message: detail.message,
+          })),
+        };
+        return;
+      }
+
+      if (value.isRecurring) {
+        results[index] = {
+          index,
+          status: 'invalid',
+          errors: [{ field: 'isRecurring', message: 'Transações recorrentes não são suportadas na criação em lote' }],
+        };
+        return;
+      }
+
+      const date = options.preserveDates
+        ? this.toDateString(value.date)
+        : this.normalizeTransactionDate(value.date);
+      valid.push({ index, id: uuidv4(), data: value, date });
     });
+
+    // Categorias precisam pertencer ao usuário (uma consulta para o lote inteiro)
+    const categoryIds = [...new Set(valid.map((row) => row.data.categoryId))];
+    const ownedCategories = categoryIds.length > 0
+      ? await this.transactionRepository.query(
+          `SELECT id FROM categories WHERE "userId" = $1 AND id = ANY($2::uuid[])`,
+          [userId, categoryIds]
+        )
+      : [];
+    const ownedCategoryIds = new Set(ownedCategories.map((category: any) => category.id));
+
+    let toInsert = valid.filter((row) => {
+      if (ownedCategoryIds.has(row.data.categoryId)) {
+        return true;
+      }
+
+      results[row.index] = {
+        index: row.index,
+        status: 'invalid',
+        errors: [{ field: 'categoryId', message: 'Categoria não encontrada' }],
+      };
+      return false;
+    });
+
+    let duplicates = 0;
+    if (options.skipDuplicates && toInsert.length > 0) {
+      const existingKeys = await this.findExistingKeys(userId, toInsert);
+      toInsert = toInsert.filter((row) => {
+        const key = this.duplicateKey(row.date, row.data.amount, row.data.description);
+        if (!existingKeys.has(key)) {
+          // Também evita repetições dentro do próprio lote
+          existingKeys.add(key);
+          return true;
+        }
+
+        duplicates++;
+        results[row.index] = { index: row.index, status: 'duplicate' };
+        return false;
+      });
+    }
+
+    if (toInsert.length > 0) {
+      await AppDataSource.transaction(async (manager) => {
+        const { transactions: syncVersion } = await dataVersionService.bump(manager, userId, 'transactions');
+
+        for (let offset = 0; offset < toInsert.length; offset += BULK_INSERT_CHUNK_SIZE) {
+          const chunk = toInsert.slice(offset, offset + BULK_INSERT_CHUNK_SIZE);
+          // $1 é a versão de sincronização, compartilhada por todas as linhas do lote
+          const params: any[] = [syncVersion];
+          const values = chunk.map((row) => {
+            const base = params.length;
+            params.push(row.id, row.data.type, row.data.amount, row.data.description, row.date, row.data.categoryId, userId);
+            return `($${base + 1}, $${base + 2}, $${base + 3}, $${base + 4}, $${base + 5}, $${base + 6}, $${base + 7}, $1, NOW(), NOW())`;
+          });
+
+          await manager.query(
+            `INSERT INTO transactions (id, type, amount, description, date, "categoryId", "userId", "syncVersion", "createdAt", "updatedAt")
+             VALUES ${values.join(', ')}`,
+            params
+          );
+        }
+
+        await monthlyTotalsService.applyMany(
+          manager,
+          toInsert.map((row) => ({
+            userId,
+            categoryId: row.data.categoryId,
+            type: row.data.type,
+            amount: row.data.amount,
+            date: row.date,
+          }))
+        );
+      });
+
+      await dashboardCache.invalidateDates(userId, toInsert.map((row) => row.date));
+
+      for (const row of toInsert) {
+        results[row.index] = { index: row.index, status: 'created', id: row.id };
+      }
+    }
+
+    return {
+      created: toInsert.length,
+      duplicates,
+      failed: rows.length - toInsert.length - duplicates,
+      results,
+    };
   }
 
   async findAll(userId: string, filters: any) {
-    console.log('🔍 [DEBUG] Buscando transações...');
     const { 
       month, 
       year, 
@@ -117,15 +318,10 @@ export class TransactionService {
       where.categoryId = categoryId;
     }
 
-    // Filtro por mês/ano
-    if (month && year) {
-      const startDate = new Date(year, month - 1, 1);
-      const endDate = new Date(year, month, 0, 23, 59, 59, 999);
-      where.date = Between(startDate, endDate);
-    } else if (year) {
-      const startDate = new Date(year, 0, 1);
-      const endDate = new Date(year, 11, 31, 23, 59, 59, 999);
-      where.date = Between(startDate, endDate);
+    // Filtro por mês/ano como intervalo de datas (usa os índices de data)
+    const range = this.getDateRange(month, year);
+    if (range) {
+      where.date = Between(range[0], range[1]);
     }
 
     const [transactions, total] = await this.transactionRepository.findAndCount({
@@ -136,35 +332,9 @@ export class TransactionService {
       take: limit,
     });
 
-    // Converter datas para string no formato YYYY-MM-DD
-    const transactionsWithFixedDates = transactions.map((t: any) => {
-      let dateString: string;
-      const dateValue = t.date;
-      
-      if (typeof dateValue === 'string') {
-        // Se já é string, extrair apenas YYYY-MM-DD
-        dateString = dateValue.includes('T') ? dateValue.split('T')[0] : dateValue;
-      } else if (dateValue instanceof Date) {
-        // Se é Date, extrair apenas a parte da data usando toISOString
-        dateString = dateValue.toISOString().split('T')[0];
-      } else {
-        dateString = String(dateValue);
-      }
-      
-      return {
-        ...t,
-        date: dateString
-      };
-    });
-
-    console.log('🔍 [DEBUG] Primeira transação após conversão:');
-    if (transactionsWithFixedDates.length > 0) {
-      console.log('  - Descrição:', transactionsWithFixedDates[0].description);
-      console.log('  - Data:', transactionsWithFixedDates[0].date);
-    }
-
+    // A data sai como YYYY-MM-DD pelo serializer de transações (sem copiar cada entidade)
     return { 
-      transactions: transactionsWithFixedDates as any, 
+      transactions, 
       total, 
       page: Number(page), 
       limit: Number(limit),
@@ -172,6 +342,88 @@ export class TransactionService {
     };
   }
 
+  /**
+   * Listagem paginada por cursor (keyset) sobre a tupla (date, createdAt, id).
+   * Não usa OFFSET nem COUNT(*), então o custo de páginas profundas é constante.
+   * O total só é calculado quando solicitado explicitamente (includeTotal).
+   */
+  async findAllByCursor(userId: string, filters: any) {
+    const {
+      month,
+      year,
+      type,
+      categoryId,
+      cursor,
+      limit = 10,
+      sortOrder = 'desc',
+      includeTotal = false,
+    } = filters;
+
+    const take = Number(limit);
+    const direction = String(sortOrder).toUpperCase() === 'ASC' ? 'ASC' : 'DESC';
+
+    const query = this.transactionRepository
+      .createQueryBuilder('transaction')
+      .leftJoinAndSelect('transaction.category', 'category')
+      .where('transaction.userId = :userId', { userId });
+
+    if (type) {
+      query.andWhere('transaction.type = :type', { type });
+    }
+
+    if (categoryId) {
+      query.andWhere('transaction.categoryId = :categoryId', { categoryId });
+    }
+
+    const range = this.getDateRange(month, year);
+    if (range) {
+      query.andWhere('transaction.date BETWEEN :startDate AND :endDate', {
+        startDate: range[0],
+        endDate: range[1],
+      });
+    }
+
+    const total = includeTotal ? await query.clone().getCount() : undefined;
+
+    if (cursor) {
+      const key = decodeCursor(cursor);
+      const operator = direction === 'DESC' ? '<' : '>';
+      query.andWhere(
+        `("transaction"."date", "transaction"."createdAt", "transaction"."id") ${operator} (:cursorDate, CAST(:cursorCreatedAt AS timestamp), :cursorId)`,
+        { cursorDate: key.date, cursorCreatedAt: key.createdAt, cursorId: key.id }
+      );
+    }
+
+    // createdAt em texto preserva os microssegundos que o Date do JS descartaria
+    const { entities, raw } = await query
+      .addSelect('CAST("transaction"."createdAt" AS text)', 'cursor_created_at')
+      .orderBy('transaction.date', direction)
+      .addOrderBy('transaction.createdAt', direction)
+      .addOrderBy('transaction.id', direction)
+      .limit(take + 1)
+      .getRawAndEntities();
+
+    const createdAtById = new Map<string, string>(
+      raw.map((row: any) => [row.transaction_id, row.cursor_created_at])
+    );
+
+    const hasMore = entities.length > take;
+    const transactions = hasMore ? entities.slice(0, take) : entities;
+
+    const last = transactions[transactions.length - 1];
+    const nextCursor = hasMore && last
+      ? encodeCursor({ date: this.toDateString(last.date), createdAt: createdAtById.get(last.id)!, id: last.id })
+      : null;
+
+    return {
+      transactions,
+      limit: take,
+      nextCursor,
+      hasMore,
+      total,
+    };
+  }
+
   async findById(id: string, userId: string) {
     const transaction = await this.transactionRepository.findOne({
       where: { id, userId },
@@ -185,64 +437,107 @@ export class TransactionService {
     return transaction;
   }
 
+  /**
+   * Atualizar em um único comando: trava a linha do usuário, aplica apenas os
+   * campos enviados, troca os valores antigos pelos novos nos totais mensais e
+   * devolve a transação com a categoria
+   */
   async update(id: string, userId: string, data: Partial<Transaction>) {
-    const transaction = await this.findById(id, userId);
-    Object.assign(transaction, data);
-    await this.transactionRepository.save(transaction);
-    
-    return this.transactionRepository.findOne({
-      where: { id: transaction.id },
-      relations: ['category'],
-    });
+    const patch: Record<string, any> = {};
+    for (const field of UPDATABLE_FIELDS) {
+      if (data[field] !== undefined) {
+        patch[field] = field === 'date' ? this.toColumnDate(data.date) : data[field];
+      }
+    }
+
+    const [row] = await this.transactionRepository.query(UPDATE_SQL, [id, userId, JSON.stringify(patch)]);
+
+    if (!row) {
+      throw new NotFoundError('Transação não encontrada');
+    }
+
+    if (!row.id) {
+      throw new NotFoundError('Categoria não encontrada');
+    }
+
+    await dashboardCache.invalidateDates(userId, [row.previousDate, row.date]);
+    return this.toTransaction(row);
   }
 
+  /**
+   * Excluir em um único comando, com lápide para a sincronização e baixa nos totais
+   */
   async delete(id: string, userId: string) {
-    const transaction = await this.findById(id, userId);
-    await this.transactionRepository.remove(transaction);
+    const [row] = await this.transactionRepository.query(DELETE_SQL, [id, userId]);
+
+    if (!row) {
+      throw new NotFoundError('Transação não encontrada');
+    }
+
+    await dashboardCache.invalidateDates(userId, [row.date]);
   }
 
   async getDashboardData(userId: string, month?: number, year?: number) {
+    return (await this.getDashboard(userId, month, year)).data;
+  }
+
+  /**
+   * Dashboard com a versão do cálculo em cache (usada como ETag)
+   */
+  async getDashboard(userId: string, month?: number, year?: number) {
     const now = new Date();
     const targetMonth = month || now.getMonth() + 1;
     const targetYear = year || now.getFullYear();
-    
-    // Criar strings de data no formato YYYY-MM-DD
-    const startOfMonth = `${targetYear}-${String(targetMonth).padStart(2, '0')}-01`;
-    const lastDay = new Date(targetYear, targetMonth, 0).getDate();
-    const endOfMonth = `${targetYear}-${String(targetMonth).padStart(2, '0')}-${String(lastDay).padStart(2, '0')}`;
 
-    const transactions = await this.transactionRepository.find({
-      where: {
-        userId,
-        date: Between(startOfMonth, endOfMonth),
-      },
-      relations: ['category'],
-      order: { date: 'DESC' },
-    });
+    const { data, version } = await dashboardCache.getEntry(userId, targetMonth, targetYear, () =>
+      this.computeDashboardData(userId, targetMonth, targetYear)
+    );
+    return { data, version, month: targetMonth, year: targetYear };
+  }
+
+  private async computeDashboardData(userId: string, targetMonth: number, targetYear: number) {
+    // Criar strings de data no formato YYYY-MM-DD
+    const [startOfMonth, endOfMonth] = this.getDateRange(targetMonth, targetYear)!;
 
-    const income = transactions
-      .filter(t => t.type === TransactionType.INCOME)
-      .reduce((sum, t) => sum + Number(t.amount), 0);
+    // Totais lidos da tabela de totais mensais e apenas as 10 transações recentes
+    const [rows, recentTransactions] = await Promise.all([
+      monthlyTotalsService.getCategoryTotals(userId, targetMonth, targetYear),
+      this.transactionRepository.find({
+        where: {
+          userId,
+          date: Between(startOfMonth, endOfMonth),
+        },
+        relations: ['category'],
+        order: { date: 'DESC', createdAt: 'DESC' },
+        take: 10,
+      }),
+    ]);
 
-    const expense = transactions
-      .filter(t => t.type === TransactionType.EXPENSE)
-      .reduce((sum, t) => sum + Number(t.amount), 0);
+    let income = 0;
+    let expense = 0;
 
     // Agrupar por categoria
-    const byCategory = transactions.reduce((acc: any, t) => {
-      const categoryName = t.category.name;
-      if (!acc[categoryName]) {
-        acc[categoryName] = {
-          name: categoryName,
-          type: t.type,
+    const byCategory: Record<string, any> = {};
+    for (const row of rows) {
+      const total = Number(row.total);
+
+      if (row.type === TransactionType.INCOME) {
+        income += total;
+      } else if (row.type === TransactionType.EXPENSE) {
+        expense += total;
+      }
+
+      if (!byCategory[row.name]) {
+        byCategory[row.name] = {
+          name: row.name,
+          type: row.type,
           total: 0,
-          color: t.category.color,
-          icon: t.category.icon,
+          color: row.color,
+          icon: row.icon,
         };
       }
-      acc[categoryName].total += Number(t.amount);
-      return acc;
-    }, {});
+      byCategory[row.name].total += total;
+    }
 
     return {
       summary: {
@@ -252,8 +547,157 @@ export class TransactionService {
         month: targetMonth,
         year: targetYear,
       },
-      recentTransactions: transactions.slice(0, 10),
+      recentTransactions,
       byCategory: Object.values(byCategory),
     };
   }
+
+  /**
+   * Normaliza a data recebida para YYYY-MM-DD
+   * ADICIONAR 2 DIAS para compensar o timezone do PostgreSQL
+   */
+  private normalizeTransactionDate(date: any): string {
+    if (date) {
+      if (typeof date === 'string') {
+        // Adicionar 2 dias à data
+        const [year, month, day] = date.split('-').map(Number);
+        const dateObj = new Date(year, month - 1, day);
+        dateObj.setDate(dateObj.getDate() + 2); // ADICIONAR 2 DIAS
+        
+        const newYear = dateObj.getFullYear();
+        const newMonth = String(dateObj.getMonth() + 1).padStart(2, '0');
+        const newDay = String(dateObj.getDate()).padStart(2, '0');
+        return `${newYear}-${newMonth}-${newDay}`;
+      }
+
+      const dateObj = new Date(date);
+      dateObj.setDate(dateObj.getDate() + 2); // ADICIONAR 2 DIAS
+      
+      const year = dateObj.getFullYear();
+      const month = String(dateObj.getMonth() + 1).padStart(2, '0');
+      const day = String(dateObj.getDate()).padStart(2, '0');
+      return `${year}-${month}-${day}`;
+    }
+
+    // Se não vier data, usar hoje no formato string + 2 dias
+    const today = new Date();
+    today.setDate(today.getDate() + 2); // ADICIONAR 2 DIAS
+    return `${today.getFullYear()}-${String(today.getMonth() + 1).padStart(2, '0')}-${String(today.getDate()).padStart(2, '0')}`;
+  }
+
+  /**
+   * Chaves (data, valor, descrição) do lote que já existem para o usuário
+   */
+  private async findExistingKeys(
+    userId: string,
+    rows: { date: string; data: any }[]
+  ): Promise<Set<string>> {
+    const existing = await this.transactionRepository.query(
+      `SELECT date::text as date, amount::text as amount, description
+       FROM transactions
+       WHERE "userId" = $1
+         AND (date, amount, description) IN (
+           SELECT * FROM unnest($2::date[], $3::numeric[], $4::text[])
+         )`,
+      [
+        userId,
+        rows.map((row) => row.date),
+        rows.map((row) => Number(row.data.amount).toFixed(2)),
+        rows.map((row) => row.data.description),
+      ]
+    );
+
+    return new Set(
+      existing.map((row: any) => this.duplicateKey(row.date, row.amount, row.description))
+    );
+  }
+
+  private duplicateKey(date: string, amount: number | string, description: string): string {
+    return `${date}|${Number(amount).toFixed(2)}|${description}`;
+  }
+
+  /**
+   * Intervalo [início, fim] em YYYY-MM-DD para filtros de mês/ano
+   */
+  private getDateRange(month?: number, year?: number): [string, string] | null {
+    if (!year) {
+      return null;
+    }
+
+    if (month) {
+      const lastDay = new Date(year, month, 0).getDate();
+      const monthString = String(month).padStart(2, '0');
+      return [`${year}-${monthString}-01`, `${year}-${monthString}-${String(lastDay).padStart(2, '0')}`];
+    }
+
+    return [`${year}-01-01`, `${year}-12-31`];
+  }
+
+  /**
+   * Data recebida na atualização para YYYY-MM-DD, com a mesma conversão que o
+   * TypeORM aplicava ao salvar a entidade (componentes locais de um Date)
+   */
+  private toColumnDate(value: any): string {
+    if (value instanceof Date) {
+      const year = value.getFullYear();
+      const month = String(value.getMonth() + 1).padStart(2, '0');
+      const day = String(value.getDate()).padStart(2, '0');
+      return `${year}-${month}-${day}`;
+    }
+
+    return String(value).split('T')[0];
+  }
+
+  /**
+   * Montar a entidade (com a categoria) a partir de uma linha de RETURNING_COLUMNS
+   */
+  private toTransaction(row: any): Transaction {
+    const category = Object.assign(new Category(), {
+      id: row.categoryId,
+      name: row.category_name,
+      type: row.category_type,
+      color: row.category_color,
+      icon: row.category_icon,
+      userId: row.userId,
+      syncVersion: row.category_syncVersion,
+      createdAt: row.category_createdAt,
+      updatedAt: row.category_updatedAt,
+    });
+
+    return Object.assign(new Transaction(), {
+      id: row.id,
+      type: row.type,
+      amount: row.amount,
+      description: row.description,
+      date: row.date,
+      categoryId: row.categoryId,
+      userId: row.userId,
+      isRecurring: row.isRecurring,
+      recurrenceType: row.recurrenceType,
+      recurrenceEndDate: row.recurrenceEndDate,
+      nextOccurrence: row.nextOccurrence,
+      parentTransactionId: row.parentTransactionId,
+      syncVersion: row.syncVersion,
+      createdAt: row.createdAt,
+      updatedAt: row.updatedAt,
+      category,
+    });
+  }
+
+  /**
+   * Normaliza o valor de data retornado pelo banco para YYYY-MM-DD
+   */
+  private toDateString(dateValue: any): string {
+    if (typeof dateValue === 'string') {
+      // Se já é string, extrair apenas YYYY-MM-DD
+      return dateValue.includes('T') ? dateValue.split('T')[0] : dateValue;
+    }
+
+    if (dateValue instanceof Date) {
+      // Se é Date, extrair apenas a parte da data usando toISOString
+      return dateValue.toISOString().split('T')[0];
+    }
+
+    return String(dateValue);
+  }
 }
@@ -0,0 +1,310 @@
+import fs from 'fs';
+import path from 'path';
+import { v4 as uuidv4 } from 'uuid';
+import { AppDataSource } from '@/config/database';
+import { config } from '@/config/env';
+import { ImportRule } from '@/models/ImportRule';
+import { Category } from '@/models/Category';
+import { TransactionType } from '@/models/Transaction';
+import { TransactionService } from '@/services/transaction.service';
+import { NotFoundError } from '@/utils/errors';
+import { logger } from '@/utils/logger';
+import { StatementEntry, parseCsvStatement, parseOfxStatement } from '@/utils/statementParser';
+
+// Lançamentos enviados por INSERT em lote (memória constante por importação)
+const IMPORT_BATCH_SIZE = 500;
+// Quantidade máxima de erros guardados por importação
+const MAX_JOB_ERRORS = 100;
+// Tempo que o status de uma importação finalizada fica disponível
+const JOB_TTL_MS = 60 * 60 * 1000;
+
+export type ImportFormat = 'csv' | 'ofx';
+export type ImportJobStatus = 'queued' | 'processing' | 'completed' | 'failed';
+
+export interface ImportOptions {
+  format?: ImportFormat;
+  defaultIncomeCategoryId?: string;
+  defaultExpenseCategoryId?: string;
+}
+
+export interface ImportJob {
+  id: string;
+  userId: string;
+  fileName: string;
+  format: ImportFormat;
+  status: ImportJobStatus;
+  progress: number;
+  processed: number;
+  created: number;
+  duplicates: number;
+  failed: number;
+  errors: { line: number; message: string }[];
+  error?: string;
+  startedAt: Date;
+  finishedAt?: Date;
+}
+
+interface PendingRow {
+  line: number;
+  data: {
+    type: TransactionType;
+    amount: number;
+    description: string;
+    date: string;
+    categoryId: string;
+  };
+}
+
+export class TransactionImportService {
+  private ruleRepository = AppDataSource.getRepository(ImportRule);
+  private categoryRepository = AppDataSource.getRepository(Category);
+  private transactionService = new TransactionService();
+  private jobs = new Map<string, ImportJob>();
+
+  constructor() {
+    // Limpa jobs expirados e arquivos órfãos (ex: upload rejeitado na validação)
+    setInterval(() => this.cleanup(), JOB_TTL_MS / 4).unref();
+  }
+
+  /**
+   * Registrar a importação de um arquivo já salvo em disco e processá-la em segundo plano
+   */
+  enqueue(userId: string, file: { path: string; originalname: string }, options: ImportOptions): ImportJob {
+    const format = options.format || this.detectFormat(file.originalname);
+    const job: ImportJob = {
+      id: uuidv4(),
+      userId,
+      fileName: file.originalname,
+      format,
+      status: 'queued',
+      progress: 0,
+      processed: 0,
+      created: 0,
+      duplicates: 0,
+      failed: 0,
+      errors: [],
+      startedAt: new Date(),
+    };
+
+    this.jobs.set(job.id, job);
+
+    setImmediate(() => {
+      this.run(job, file.path, options)
+        .catch((error) => {
+          job.status = 'failed';
+          job.error = error.message;
+          logger.error(`❌ Import ${job.id} failed:`, error);
+        })
+        .finally(() => {
+          job.finishedAt = new Date();
+          fs.promises.unlink(file.path).catch(() => undefined);
+        });
+    });
+
+    return job;
+  }
+
+  /**
+   * Status de uma importação do usuário
+   */
+  getJob(jobId: string, userId: string): ImportJob {
+    const job = this.jobs.get(jobId);
+
+    if (!job || job.userId !== userId) {
+      throw new NotFoundError('Importação não encontrada');
+    }
+
+    return job;
+  }
+
+  async findRules(userId: string) {
+    return this.ruleRepository.find({
+      where: { userId },
+      relations: ['category'],
+      order: { priority: 'DESC', createdAt: 'ASC' },
+    });
+  }
+
+  async createRule(
+    userId: string,
+    data: { pattern: string; categoryId: string; type?: TransactionType; priority?: number }
+  ) {
+    const category = await this.categoryRepository.findOne({
+      where: { id: data.categoryId, userId },
+    });
+
+    if (!category) {
+      throw new NotFoundError('Categoria não encontrada');
+    }
+
+    const rule = this.ruleRepository.create({ ...data, userId });
+    await this.ruleRepository.save(rule);
+    return rule;
+  }
+
+  async deleteRule(id: string, userId: string) {
+    const rule = await this.ruleRepository.findOne({ where: { id, userId } });
+
+    if (!rule) {
+      throw new NotFoundError('Regra não encontrada');
+    }
+
+    await this.ruleRepository.remove(rule);
+  }
+
+  private async run(job: ImportJob, filePath: string, options: ImportOptions): Promise<void> {
+    job.status = 'processing';
+
+    const rules = (await this.findRules(job.userId)).map((rule) => ({
+      ...rule,
+      pattern: rule.pattern.toLowerCase(),
+    }));
+
+    const { size } = await fs.promises.stat(filePath);
+    const input = fs.createReadStream(filePath);
+    const entries = job.format === 'ofx' ? parseOfxStatement(input) : parseCsvStatement(input);
+
+    let batch: PendingRow[] = [];
+    for await (const entry of entries) {
+      job.processed++;
+
+      const row = this.toPendingRow(entry, rules, options);
+      if (typeof row === 'string') {
+        this.recordError(job, entry.line, row);
+      } else {
+        batch.push(row);
+      }
+
+      if (batch.length >= IMPORT_BATCH_SIZE) {
+        await this.flush(job, batch);
+        batch = [];
+        job.progress = size > 0 ? Math.min(99, Math.floor((input.bytesRead / size) * 100)) : 0;
+      }
+    }
+
+    await this.flush(job, batch);
+
+    job.progress = 100;
+    job.status = 'completed';
+    logger.info(
+      `📥 Import ${job.id} completed: ${job.created} created, ${job.duplicates} duplicates, ${job.failed} failed`
+    );
+  }
+
+  /**
+   * Gravar um lote (duplicados por data/valor/descrição são ignorados)
+   */
+  private async flush(job: ImportJob, batch: PendingRow[]): Promise<void> {
+    if (batch.length === 0) {
+      return;
+    }
+
+    const result = await this.transactionService.createBulk(
+      job.userId,
+      batch.map((row) => row.data),
+      { skipDuplicates: true, preserveDates: true }
+    );
+
+    job.created += result.created;
+    job.duplicates += result.duplicates;
+
+    for (const rowResult of result.results) {
+      if (rowResult.status === 'invalid') {
+        const message = (rowResult.errors || []).map((error) => error.message).join('; ');
+        this.recordError(job, batch[rowResult.index].line, message);
+      }
+    }
+  }
+
+  /**
+   * Converter um lançamento do extrato em transação (ou mensagem de erro)
+   */
+  private toPendingRow(
+    entry: StatementEntry,
+    rules: { pattern: string; type: TransactionType | null; categoryId: string }[],
+    options: ImportOptions
+  ): PendingRow | string {
+    if (!entry.date) {
+      return 'Data inválida';
+    }
+
+    if (entry.amount === null || entry.amount === 0) {
+      return 'Valor inválido';
+    }
+
+    const type = entry.type
+      ? (entry.type as TransactionType)
+      : entry.amount < 0
+        ? TransactionType.EXPENSE
+        : TransactionType.INCOME;
+
+    const description = entry.description.trim().slice(0, 500);
+    const normalizedDescription = description.toLowerCase();
+
+    const rule = rules.find(
+      (candidate) =>
+        (!candidate.type || candidate.type === type) &&
+        normalizedDescription.includes(candidate.pattern)
+    );
+
+    const categoryId = rule
+      ? rule.categoryId
+      : type === TransactionType.INCOME
+        ? options.defaultIncomeCategoryId
+        : options.defaultExpenseCategoryId;
+
+    if (!categoryId) {
+      return 'Nenhuma regra ou categoria padrão para o lançamento';
+    }
+
+    return {
+      line: entry.line,
+      data: {
+        type,
+        amount: Math.abs(entry.amount),
+        description,
+        date: entry.date,
+        categoryId,
+      },
+    };
+  }
+
+  private recordError(job: ImportJob, line: number, message: string): void {
+    job.failed++;
+    if (job.errors.length < MAX_JOB_ERRORS) {
+      job.errors.push({ line, message });
+    }
+  }
+
+  private detectFormat(fileName: string): ImportFormat {
+    return path.extname(fileName).toLowerCase() === '.ofx' ? 'ofx' : 'csv';
+  }
+
+  private cleanup(): void {
+    const expiresBefore = Date.now() - JOB_TTL_MS;
+
+    for (const [id, job] of this.jobs) {
+      if (job.finishedAt && job.finishedAt.getTime() < expiresBefore) {
+        this.jobs.delete(id);
+      }
+    }
+
+    const importsDir = path.join(config.upload.dir, 'imports');
+    fs.promises
+      .readdir(importsDir)
+      .then((files) =>
+        Promise.all(
+          files.map(async (file) => {
+            const filePath = path.join(importsDir, file);
+            const { mtimeMs } = await fs.promises.stat(filePath);
+            if (mtimeMs < expiresBefore) {
+              await fs.promises.unlink(filePath);
+            }
+          })
+        )
+      )
+      .catch((error) => logger.warn('⚠️  Failed to clean import uploads:', error));
+  }
+}
+
+export default new TransactionImportService();
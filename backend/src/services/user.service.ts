@@ -1,5 +1,6 @@
 import { AppDataSource } from '@/config/database';
 import { User } from '@/models/User';
+import passwordHasher from '@/services/passwordHasher.service';
 import { NotFoundError, ConflictError, UnauthorizedError } from '@/utils/errors';
 // import sharp from 'sharp'; // Temporariamente desabilitado
 import path from 'path';
@@ -41,11 +42,11 @@ export class UserService {
       throw new NotFoundError('Usuário não encontrado');
     }
 
-    if (!(await user.comparePassword(currentPassword))) {
+    if (!(await passwordHasher.compare(currentPassword, user.password))) {
       throw new UnauthorizedError('Senha atual incorreta');
     }
 
-    user.password = newPassword;
+    user.password = await passwordHasher.hash(newPassword);
     await this.userRepository.save(user);
   }
 
@@ -1,6 +1,7 @@
 import { Repository } from 'typeorm';
 import { AppDataSource } from '../config/database';
 import { UserPreference } from '../entities/UserPreference';
+import dataVersionService from './dataVersion.service';
 
 export class UserPreferenceService {
   private repository: Repository<UserPreference>;
@@ -38,10 +39,13 @@ export class UserPreferenceService {
    */
   async set(userId: string, key: string, value: string): Promise<UserPreference> {
     // Usar upsert para inserir ou atualizar
-    await this.repository.upsert(
-      { userId, key, value },
-      ['userId', 'key']
-    );
+    await AppDataSource.transaction(async (manager) => {
+      await manager.getRepository(UserPreference).upsert(
+        { userId, key, value },
+        ['userId', 'key']
+      );
+      await dataVersionService.bump(manager, userId, 'preferences');
+    });
 
     // Buscar e retornar a preferência atualizada
     const preference = await this.repository.findOne({
@@ -69,20 +73,33 @@ export class UserPreferenceService {
       return;
     }
 
-    await this.repository.upsert(entries, ['userId', 'key']);
+    await AppDataSource.transaction(async (manager) => {
+      await manager.getRepository(UserPreference).upsert(entries, ['userId', 'key']);
+      await dataVersionService.bump(manager, userId, 'preferences');
+    });
   }
 
   /**
    * Excluir uma preferência do usuário
    */
   async delete(userId: string, key: string): Promise<void> {
-    await this.repository.delete({ userId, key });
+    await AppDataSource.transaction(async (manager) => {
+      const result = await manager.getRepository(UserPreference).delete({ userId, key });
+      if (result.affected) {
+        await dataVersionService.bump(manager, userId, 'preferences');
+      }
+    });
   }
 
   /**
    * Excluir todas as preferências do usuário
    */
   async deleteAll(userId: string): Promise<void> {
-    await this.repository.delete({ userId });
+    await AppDataSource.transaction(async (manager) => {
+      const result = await manager.getRepository(UserPreference).delete({ userId });
+      if (result.affected) {
+        await dataVersionService.bump(manager, userId, 'preferences');
+      }
+    });
   }
 }
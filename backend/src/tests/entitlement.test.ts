@@ -0,0 +1,50 @@
+import { EntitlementService } from '../services/entitlement.service';
+
+jest.mock('../config/database', () => {
+  const repository = { findOne: jest.fn() };
+  return { AppDataSource: { getRepository: () => repository } };
+});
+
+jest.mock('../config/env', () => ({
+  config: { entitlementCache: { maxEntries: 10, ttlSeconds: 60 } },
+}));
+
+describe('Entitlement Service', () => {
+  const { AppDataSource } = require('../config/database');
+  const repository = AppDataSource.getRepository();
+  const planEndDate = new Date(Date.now() + 24 * 60 * 60 * 1000);
+
+  beforeEach(() => {
+    repository.findOne.mockReset();
+    repository.findOne.mockResolvedValue({
+      id: 'user-1',
+      name: 'Test User',
+      planType: 'premium',
+      planStartDate: new Date('2026-01-01T00:00:00Z'),
+      planEndDate,
+      isPremium: true,
+    });
+  });
+
+  it('should serve repeated lookups from the cache', async () => {
+    const service = new EntitlementService();
+
+    expect((await service.getUser('user-1'))?.isPlanActive()).toBe(true);
+    expect((await service.getUser('user-1'))?.isPlanActive()).toBe(true);
+    expect(repository.findOne).toHaveBeenCalledTimes(1);
+  });
+
+  it('should not let callers mutate the cached entitlement', async () => {
+    const service = new EntitlementService();
+
+    const first = await service.getUser('user-1');
+    first!.planType = 'free';
+    first!.planEndDate!.setTime(0);
+
+    const second = await service.getUser('user-1');
+    expect(second).not.toBe(first);
+    expect(second?.planType).toBe('premium');
+    expect(second?.planEndDate?.getTime()).toBe(planEndDate.getTime());
+    expect(second?.isPlanActive()).toBe(true);
+  });
+});
@@ -0,0 +1,40 @@
+import { Request, Response } from 'express';
+import { weakETag, sendNotModified } from '../utils/etag';
+
+const mockResponse = () => {
+  const res: any = { headers: {} };
+  res.setHeader = jest.fn((name: string, value: string) => {
+    res.headers[name] = value;
+  });
+  res.status = jest.fn(() => res);
+  res.end = jest.fn(() => res);
+  return res as Response & { headers: Record<string, string> };
+};
+
+describe('ETag', () => {
+  it('should build weak tags from version stamps', () => {
+    expect(weakETag('categories', undefined, 3, new Date(1000), null)).toBe('W/"categories.0.3.1000.0"');
+  });
+
+  it('should answer 304 when If-None-Match has the current version', () => {
+    const etag = weakETag('goals', '2.1000');
+    const req = { headers: { 'if-none-match': `"other", ${etag.slice(2)}` } } as Request;
+    const res = mockResponse();
+
+    expect(sendNotModified(req, res, etag)).toBe(true);
+    expect(res.status).toHaveBeenCalledWith(304);
+    expect(res.headers.ETag).toBe(etag);
+  });
+
+  it('should not answer 304 for a stale or missing tag', () => {
+    const etag = weakETag('goals', '2.2000');
+
+    const stale = mockResponse();
+    expect(sendNotModified({ headers: { 'if-none-match': 'W/"goals.2.1000"' } } as any, stale, etag)).toBe(false);
+    expect(stale.status).not.toHaveBeenCalled();
+
+    const missing = mockResponse();
+    expect(sendNotModified({ headers: {} } as any, missing, etag)).toBe(false);
+    expect(missing.headers.ETag).toBe(etag);
+  });
+});
@@ -0,0 +1,15 @@
+import { exportTransactionsSchema } from '../validators/export.validator';
+
+describe('Export validator', () => {
+  it('should accept real calendar dates', () => {
+    const { error } = exportTransactionsSchema.validate({ startDate: '2024-02-29', endDate: '2026-12-31' });
+
+    expect(error).toBeUndefined();
+  });
+
+  it.each(['2026-02-30', '2026-13-01', '2026-00-10', '2026-1-01'])('should reject %s with the format message', (date) => {
+    const { error } = exportTransactionsSchema.validate({ startDate: date });
+
+    expect(error?.details[0].message).toBe('Data inicial deve estar no formato YYYY-MM-DD');
+  });
+});
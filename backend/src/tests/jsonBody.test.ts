@@ -0,0 +1,107 @@
+import http from 'http';
+import { AddressInfo } from 'net';
+import express, { NextFunction, Request, Response } from 'express';
+import { jsonBody, normalizeDateStrings } from '../middlewares/jsonBody.middleware';
+
+describe('normalizeDateStrings', () => {
+  it('should convert ISO datetimes to YYYY-MM-DD in place', () => {
+    const body = {
+      date: '2024-03-05T03:00:00.000Z',
+      transactions: [{ date: '2024-03-06T00:00:00Z', description: 'Mercado' }],
+      tags: ['2024-03-07T10:20:30'],
+    };
+
+    expect(normalizeDateStrings(body)).toBe(body);
+    expect(body.date).toBe('2024-03-05');
+    expect(body.transactions[0].date).toBe('2024-03-06');
+    expect(body.tags[0]).toBe('2024-03-07');
+  });
+
+  it('should keep other strings untouched', () => {
+    const body = { date: '2024-03-05', description: '2024-03-05T03:00 reunião', amount: 10, note: null };
+
+    expect(normalizeDateStrings(body)).toEqual({
+      date: '2024-03-05',
+      description: '2024-03-05T03:00 reunião',
+      amount: 10,
+      note: null,
+    });
+  });
+});
+
+describe('jsonBody middleware', () => {
+  const LIMIT = 64;
+  let server: http.Server;
+
+  // Envia o corpo em partes; sem Content-Length a requisição vai em chunked
+  const send = (chunks: string[], contentLength?: number): Promise<{ status: number; body: any }> =>
+    new Promise((resolve, reject) => {
+      const headers: http.OutgoingHttpHeaders = { 'Content-Type': 'application/json' };
+      if (contentLength !== undefined) {
+        headers['Content-Length'] = contentLength;
+      }
+
+      const req = http.request(
+        { port: (server.address() as AddressInfo).port, method: 'POST', path: '/', headers },
+        (res) => {
+          let raw = '';
+          res.on('data', (chunk) => (raw += chunk));
+          res.on('end', () => resolve({ status: res.statusCode || 0, body: JSON.parse(raw) }));
+        }
+      );
+      req.on('error', reject);
+      chunks.forEach((chunk) => req.write(chunk));
+      req.end();
+    });
+
+  beforeAll((done) => {
+    const app = express();
+    app.use(jsonBody(LIMIT));
+    app.post('/', (req: Request, res: Response) => res.json(req.body));
+    app.use((error: any, _req: Request, res: Response, _next: NextFunction) =>
+      res.status(error.statusCode || 500).json({ message: error.message })
+    );
+    server = app.listen(0, done);
+  });
+
+  afterAll((done) => {
+    server.close(done);
+  });
+
+  it('should parse a valid body and normalize its dates', async () => {
+    const body = JSON.stringify({ date: '2024-03-05T03:00:00.000Z', amount: 10 });
+
+    const response = await send([body], Buffer.byteLength(body));
+
+    expect(response.status).toBe(200);
+    expect(response.body).toEqual({ date: '2024-03-05', amount: 10 });
+  });
+
+  it('should reject with 413 when Content-Length is over the limit', async () => {
+    const body = JSON.stringify({ description: 'x'.repeat(LIMIT) });
+
+    const response = await send([body], Buffer.byteLength(body));
+
+    expect(response.status).toBe(413);
+  });
+
+  it('should parse a body without Content-Length under the limit', async () => {
+    const response = await send(['{"description":', '"Mercado"}']);
+
+    expect(response.status).toBe(200);
+    expect(response.body).toEqual({ description: 'Mercado' });
+  });
+
+  it('should reject with 413 when the streamed bytes pass the limit', async () => {
+    const response = await send(['{"description":"', 'x'.repeat(LIMIT), '"}']);
+
+    expect(response.status).toBe(413);
+  });
+
+  it('should reject invalid JSON with 400', async () => {
+    const response = await send(['{"description":'], 15);
+
+    expect(response.status).toBe(400);
+    expect(response.body.message).toBe('JSON inválido');
+  });
+});
@@ -0,0 +1,45 @@
+import { compileSerializer } from '../utils/jsonSerializer';
+
+describe('compileSerializer', () => {
+  const serialize = compileSerializer({
+    type: 'array',
+    items: {
+      type: 'object',
+      properties: {
+        id: { type: 'string' },
+        amount: { type: 'number' },
+        date: { type: 'dateOnly' },
+        isRecurring: { type: 'boolean' },
+        createdAt: { type: 'date' },
+        category: {
+          type: 'object',
+          properties: { name: { type: 'string' }, icon: { type: 'string' } },
+        },
+      },
+    },
+  });
+
+  it('should match JSON.stringify for the schema properties', () => {
+    const rows = [
+      {
+        id: 'a1',
+        amount: '12.50',
+        date: '2024-03-05',
+        isRecurring: false,
+        createdAt: new Date('2024-03-05T10:00:00.000Z'),
+        category: { name: 'Alimentação "casa"\n', icon: '🍔' },
+      },
+      { id: 'a2', amount: 3, date: '2024-03-06', isRecurring: true, createdAt: null, category: null },
+    ];
+
+    expect(serialize(rows)).toBe(JSON.stringify(rows));
+  });
+
+  it('should format dates and skip undefined or unknown properties', () => {
+    const output = serialize([
+      { id: 'a3', amount: Number.NaN, date: new Date('2024-03-07T00:00:00.000Z'), extra: 1, category: undefined },
+    ]);
+
+    expect(output).toBe('[{"id":"a3","amount":null,"date":"2024-03-07"}]');
+  });
+});
@@ -0,0 +1,30 @@
+import { LruCache } from '../utils/lruCache';
+
+describe('LruCache', () => {
+  it('should evict the least recently used entry', () => {
+    const cache = new LruCache<string, number>(2, 60000);
+    cache.set('a', 1);
+    cache.set('b', 2);
+    cache.get('a');
+    cache.set('c', 3);
+
+    expect(cache.get('a')).toBe(1);
+    expect(cache.get('b')).toBeUndefined();
+    expect(cache.get('c')).toBe(3);
+    expect(cache.getStats()).toMatchObject({ size: 2, evictions: 1, hits: 3, misses: 1 });
+  });
+
+  it('should expire entries after their ttl', () => {
+    jest.useFakeTimers();
+    const cache = new LruCache<string, number>(10, 60000);
+    cache.set('short', 1, 1000);
+    cache.set('default', 2);
+
+    jest.advanceTimersByTime(1500);
+
+    expect(cache.get('short')).toBeUndefined();
+    expect(cache.get('default')).toBe(2);
+    expect(cache.getStats().hitRate).toBe(0.5);
+    jest.useRealTimers();
+  });
+});
@@ -0,0 +1,21 @@
+import { monthPartition, monthStart, parseMonthPartition } from '../utils/monthPartitions';
+
+describe('Month partitions', () => {
+  it('should name and bound the partition of a date in UTC', () => {
+    const partition = monthPartition('notifications', new Date('2026-12-31T23:59:59Z'));
+
+    expect(partition.name).toBe('notifications_y2026m12');
+    expect(partition.from).toBe('2026-12-01 00:00:00');
+    expect(partition.to).toBe('2027-01-01 00:00:00');
+  });
+
+  it('should shift months across year boundaries', () => {
+    expect(monthStart(new Date('2026-01-15T00:00:00Z'), -13).toISOString()).toBe('2024-12-01T00:00:00.000Z');
+  });
+
+  it('should parse only partitions of the given table', () => {
+    expect(parseMonthPartition('notifications', 'notifications_y2025m03')).toEqual(new Date('2025-03-01T00:00:00Z'));
+    expect(parseMonthPartition('notifications', 'notifications_unpartitioned')).toBeNull();
+    expect(parseMonthPartition('notifications', 'sync_notifications_y2025m03')).toBeNull();
+  });
+});
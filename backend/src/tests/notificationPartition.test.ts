@@ -0,0 +1,112 @@
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import zlib from 'zlib';
+import { Writable } from 'stream';
+import { NotificationPartitionService } from '../services/notificationPartition.service';
+
+const mockArchiveDir = fs.mkdtempSync(path.join(os.tmpdir(), 'notification-archive-'));
+
+jest.mock('../config/database', () => ({
+  AppDataSource: {
+    query: jest.fn(),
+    transaction: jest.fn(),
+    createQueryRunner: jest.fn(),
+  },
+}));
+
+jest.mock('../config/env', () => ({
+  config: {
+    notifications: {
+      retentionMonths: 3,
+      get archiveDir() {
+        return mockArchiveDir;
+      },
+    },
+  },
+}));
+
+jest.mock('../utils/logger', () => ({
+  logger: { info: jest.fn(), warn: jest.fn(), error: jest.fn() },
+}));
+
+describe('Notification partition maintenance', () => {
+  const now = new Date('2026-06-15T12:00:00Z');
+  const service = new NotificationPartitionService();
+  let AppDataSource: any;
+
+  const droppedTables = () =>
+    AppDataSource.query.mock.calls
+      .map(([sql]: [string]) => sql)
+      .filter((sql: string) => sql.startsWith('DROP TABLE'));
+
+  beforeEach(() => {
+    jest.clearAllMocks();
+    fs.readdirSync(mockArchiveDir).forEach((file) => fs.unlinkSync(path.join(mockArchiveDir, file)));
+
+    AppDataSource = require('../config/database').AppDataSource;
+    AppDataSource.query.mockImplementation(async (sql: string) =>
+      sql.includes('pg_class')
+        ? [
+            { name: 'notifications_y2026m01', attached: true },
+            // Desanexada manualmente, mas dentro da janela de retenção
+            { name: 'notifications_y2026m05', attached: false },
+          ]
+        : []
+    );
+    AppDataSource.transaction.mockImplementation(async (work: any) => work({ query: jest.fn().mockResolvedValue([]) }));
+
+    let fetched = false;
+    AppDataSource.createQueryRunner.mockReturnValue({
+      isTransactionActive: false,
+      connect: jest.fn(),
+      startTransaction: jest.fn(),
+      commitTransaction: jest.fn(),
+      rollbackTransaction: jest.fn(),
+      release: jest.fn(),
+      query: jest.fn(async (sql: string) => {
+        if (sql.startsWith('FETCH')) {
+          const batch = fetched ? [] : [{ id: 'n1', title: 'Olá' }];
+          fetched = true;
+          return batch;
+        }
+        return sql.startsWith('SELECT COUNT') ? [{ total: 1 }] : [];
+      }),
+    });
+  });
+
+  afterAll(() => {
+    fs.rmSync(mockArchiveDir, { recursive: true, force: true });
+  });
+
+  it('should archive and drop only partitions older than the cutoff', async () => {
+    const result = await service.maintain(now);
+
+    expect(result.dropped).toEqual(['notifications_y2026m01']);
+    expect(result.archivedRows).toBe(1);
+    expect(droppedTables()).toEqual(['DROP TABLE IF EXISTS "notifications_y2026m01"']);
+
+    const archive = path.join(mockArchiveDir, 'notifications_y2026m01.ndjson.gz');
+    expect(zlib.gunzipSync(fs.readFileSync(archive)).toString()).toBe('{"id":"n1","title":"Olá"}\n');
+  });
+
+  it('should keep the partition and remove the partial file when the archive write fails', async () => {
+    const createWriteStream = jest.spyOn(fs, 'createWriteStream').mockImplementation((file: any) => {
+      fs.writeFileSync(file, '');
+      return new Writable({
+        write(_chunk, _encoding, callback) {
+          callback(Object.assign(new Error('ENOSPC: no space left on device'), { code: 'ENOSPC' }));
+        },
+      }) as any;
+    });
+
+    try {
+      await expect(service.maintain(now)).rejects.toThrow('ENOSPC');
+    } finally {
+      createWriteStream.mockRestore();
+    }
+
+    expect(droppedTables()).toEqual([]);
+    expect(fs.readdirSync(mockArchiveDir)).toEqual([]);
+  });
+});
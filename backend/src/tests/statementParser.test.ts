@@ -0,0 +1,51 @@
+import { Readable } from 'stream';
+import { parseAmount, parseStatementDate, parseCsvStatement, parseOfxStatement } from '../utils/statementParser';
+
+const collect = async (entries: AsyncGenerator<any>) => {
+  const result = [];
+  for await (const entry of entries) {
+    result.push(entry);
+  }
+  return result;
+};
+
+describe('Statement Parser', () => {
+  it('should parse brazilian and plain amounts', () => {
+    expect(parseAmount('1.234,56')).toBe(1234.56);
+    expect(parseAmount('R$ -10,00')).toBe(-10);
+    expect(parseAmount('-50.25')).toBe(-50.25);
+    expect(parseAmount('abc')).toBeNull();
+  });
+
+  it('should parse statement dates', () => {
+    expect(parseStatementDate('05/03/2024')).toBe('2024-03-05');
+    expect(parseStatementDate('2024-03-05')).toBe('2024-03-05');
+    expect(parseStatementDate('20240305120000[-3:BRT]')).toBe('2024-03-05');
+    expect(parseStatementDate('março')).toBeNull();
+  });
+
+  it('should read CSV records with localized headers', async () => {
+    const csv = 'Data;Descrição;Valor\n05/03/2024;Mercado;-120,50\n06/03/2024;Salário;3.000,00\n';
+    const entries = await collect(parseCsvStatement(Readable.from([csv])));
+
+    expect(entries).toEqual([
+      { line: 2, date: '2024-03-05', description: 'Mercado', amount: -120.5, type: undefined },
+      { line: 3, date: '2024-03-06', description: 'Salário', amount: 3000, type: undefined },
+    ]);
+  });
+
+  it('should read OFX transactions split across chunks', async () => {
+    const ofx = [
+      'OFXHEADER:100\nCHARSET:UTF-8\n<OFX><BANKTRANLIST><STMTTRN><TRNTYPE>DEBIT',
+      '<DTPOSTED>20240305<TRNAMT>-42.10<MEMO>Padaria</STMTTRN>',
+      '<STMTTRN><TRNTYPE>CREDIT<DTPOSTED>20240306<TRNAMT>100.00<NAME>Pix</STMTTRN></BANKTRANLIST></OFX>',
+    ].map((chunk) => Buffer.from(chunk));
+
+    const entries = await collect(parseOfxStatement(Readable.from(ofx)));
+
+    expect(entries).toEqual([
+      { line: 1, date: '2024-03-05', description: 'Padaria', amount: -42.1, type: 'expense' },
+      { line: 2, date: '2024-03-06', description: 'Pix', amount: 100, type: 'income' },
+    ]);
+  });
+});
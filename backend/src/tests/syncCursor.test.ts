@@ -0,0 +1,17 @@
+import { encodeSyncCursor, decodeSyncCursor } from '../utils/cursor';
+import { BadRequestError } from '../utils/errors';
+
+describe('Sync cursor', () => {
+  it('should round-trip the domain versions and issue time', () => {
+    const cursor = { transactions: 42, categories: 7, issuedAt: 1760000000000 };
+
+    expect(decodeSyncCursor(encodeSyncCursor(cursor))).toEqual(cursor);
+  });
+
+  it('should reject tampered or malformed cursors', () => {
+    const negative = Buffer.from(JSON.stringify([-1, 0, 0])).toString('base64url');
+
+    expect(() => decodeSyncCursor('not-a-cursor')).toThrow(BadRequestError);
+    expect(() => decodeSyncCursor(negative)).toThrow(BadRequestError);
+  });
+});
@@ -0,0 +1,72 @@
+import { BadRequestError } from '@/utils/errors';
+
+/**
+ * Chave de ordenação usada na paginação por cursor (keyset) de transações
+ */
+export interface TransactionCursor {
+  date: string;
+  createdAt: string;
+  id: string;
+}
+
+/**
+ * Codifica a chave (date, createdAt, id) em um cursor opaco
+ */
+export const encodeCursor = (cursor: TransactionCursor): string => {
+  return Buffer.from(JSON.stringify([cursor.date, cursor.createdAt, cursor.id])).toString('base64url');
+};
+
+/**
+ * Decodifica um cursor recebido do cliente
+ */
+export const decodeCursor = (value: string): TransactionCursor => {
+  try {
+    const parsed = JSON.parse(Buffer.from(value, 'base64url').toString('utf8'));
+
+    if (
+      Array.isArray(parsed) &&
+      parsed.length === 3 &&
+      parsed.every((part) => typeof part === 'string' && part.length > 0)
+    ) {
+      const [date, createdAt, id] = parsed;
+      return { date, createdAt, id };
+    }
+  } catch (error) {
+    // Tratado abaixo
+  }
+
+  throw new BadRequestError('Cursor de paginação inválido');
+};
+
+/**
+ * Posição de um cliente na sincronização incremental: versões dos contadores
+ * de transações e categorias e o momento em que o cursor foi emitido
+ */
+export interface SyncCursor {
+  transactions: number;
+  categories: number;
+  issuedAt: number;
+}
+
+export const encodeSyncCursor = (cursor: SyncCursor): string => {
+  return Buffer.from(JSON.stringify([cursor.transactions, cursor.categories, cursor.issuedAt])).toString('base64url');
+};
+
+export const decodeSyncCursor = (value: string): SyncCursor => {
+  try {
+    const parsed = JSON.parse(Buffer.from(value, 'base64url').toString('utf8'));
+
+    if (
+      Array.isArray(parsed) &&
+      parsed.length === 3 &&
+      parsed.every((part) => Number.isSafeInteger(part) && part >= 0)
+    ) {
+      const [transactions, categories, issuedAt] = parsed;
+      return { transactions, categories, issuedAt };
+    }
+  } catch (error) {
+    // Tratado abaixo
+  }
+
+  throw new BadRequestError('Cursor de sincronização inválido');
+};
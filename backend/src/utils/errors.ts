@@ -45,6 +45,12 @@ export class ConflictError extends AppError {
   }
 }
 
+export class PayloadTooLargeError extends AppError {
+  constructor(message: string = 'Requisição muito grande') {
+    super(message, 413);
+  }
+}
+
 export class ValidationError extends AppError {
   public readonly errors: any;
 
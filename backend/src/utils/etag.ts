@@ -0,0 +1,38 @@
+import { Request, Response } from 'express';
+
+type VersionPart = string | number | Date | null | undefined;
+
+/**
+ * ETag fraco a partir de carimbos de versão baratos (contadores, MAX(updatedAt)),
+ * sem serializar nem calcular hash do corpo da resposta
+ */
+export const weakETag = (...parts: VersionPart[]): string =>
+  `W/"${parts
+    .map((part) => (part instanceof Date ? part.getTime() : part ?? '0'))
+    .join('.')}"`;
+
+const opaqueTag = (tag: string) => (tag.startsWith('W/') ? tag.slice(2) : tag);
+
+/**
+ * Definir o ETag e, se o cliente já tiver essa versão (If-None-Match),
+ * responder 304 sem corpo. Retorna true quando a resposta já foi enviada.
+ */
+export const sendNotModified = (req: Request, res: Response, etag: string): boolean => {
+  res.setHeader('ETag', etag);
+  res.setHeader('Cache-Control', 'private, no-cache');
+
+  const header = req.headers['if-none-match'];
+  if (!header) {
+    return false;
+  }
+
+  // Comparação fraca (RFC 9110): o prefixo W/ é ignorado
+  const matches = header.trim() === '*'
+    || header.split(',').some((tag) => opaqueTag(tag.trim()) === opaqueTag(etag));
+
+  if (matches) {
+    res.status(304).end();
+  }
+
+  return matches;
+};
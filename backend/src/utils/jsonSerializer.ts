@@ -0,0 +1,120 @@
+/**
+ * Serialização JSON compilada a partir de um schema (no estilo fast-json-stringify).
+ * O schema é transformado uma única vez em funções especializadas que leem apenas
+ * as propriedades conhecidas, sem a enumeração genérica de chaves do JSON.stringify.
+ * Valores fora do tipo esperado caem no JSON.stringify, então a saída é sempre
+ * JSON válido e equivalente ao res.json para as propriedades do schema.
+ */
+export type JsonSchema =
+  | { type: 'string' | 'number' | 'boolean' | 'any' }
+  // Timestamp: Date vira ISO 8601
+  | { type: 'date' }
+  // Data sem horário: Date ou string ISO viram YYYY-MM-DD
+  | { type: 'dateOnly' }
+  | { type: 'object'; properties: Record<string, JsonSchema> }
+  | { type: 'array'; items: JsonSchema };
+
+export type Serializer = (value: any) => string;
+
+// Caracteres que exigem escape (controle, aspas, barra invertida e surrogates)
+const NEEDS_ESCAPE = /[\u0000-\u001f"\\\ud800-\udfff]/;
+
+const runtime = {
+  any: (value: any): string => {
+    const json = JSON.stringify(value);
+    return json === undefined ? 'null' : json;
+  },
+  string: (value: any): string => {
+    if (typeof value !== 'string') {
+      return runtime.any(value);
+    }
+    return NEEDS_ESCAPE.test(value) ? JSON.stringify(value) : `"${value}"`;
+  },
+  number: (value: any): string => {
+    if (typeof value !== 'number') {
+      return runtime.any(value);
+    }
+    return Number.isFinite(value) ? String(value) : 'null';
+  },
+  boolean: (value: any): string => {
+    if (typeof value !== 'boolean') {
+      return runtime.any(value);
+    }
+    return value ? 'true' : 'false';
+  },
+  date: (value: any): string => {
+    if (value instanceof Date && !Number.isNaN(value.getTime())) {
+      return `"${value.toISOString()}"`;
+    }
+    return runtime.string(value);
+  },
+  dateOnly: (value: any): string => {
+    if (value instanceof Date && !Number.isNaN(value.getTime())) {
+      return `"${value.toISOString().slice(0, 10)}"`;
+    }
+    if (typeof value === 'string' && value.length > 10 && value.charCodeAt(10) === 84) {
+      return `"${value.slice(0, 10)}"`;
+    }
+    return runtime.string(value);
+  },
+};
+
+/**
+ * Compilar um schema em uma função de serialização
+ */
+export const compileSerializer = (schema: JsonSchema): Serializer => {
+  const functions: string[] = [];
+
+  const build = (node: JsonSchema): string => {
+    if (node.type !== 'object' && node.type !== 'array') {
+      return `rt.${node.type}`;
+    }
+
+    const name = `s${functions.length}`;
+    functions.push('');
+
+    if (node.type === 'array') {
+      const item = build(node.items);
+      functions[Number(name.slice(1))] = `
+        function ${name}(value) {
+          if (!Array.isArray(value)) return rt.any(value);
+          let out = '[';
+          for (let i = 0; i < value.length; i++) {
+            if (i > 0) out += ',';
+            const item = value[i];
+            out += item === undefined || typeof item === 'function' ? 'null' : ${item}(item);
+          }
+          return out + ']';
+        }`;
+      return name;
+    }
+
+    const lines = Object.entries(node.properties).map(([key, property]) => {
+      const serializer = build(property);
+      const field = JSON.stringify(key);
+      return `
+          item = value[${field}];
+          if (item !== undefined && typeof item !== 'function') {
+            out += (first ? '' : ',') + ${JSON.stringify(`${field}:`)} + ${serializer}(item);
+            first = false;
+          }`;
+    });
+
+    functions[Number(name.slice(1))] = `
+        function ${name}(value) {
+          if (value === null || typeof value !== 'object' || typeof value.toJSON === 'function') return rt.any(value);
+          let out = '{';
+          let first = true;
+          let item;
+          ${lines.join('')}
+          return out + '}';
+        }`;
+    return name;
+  };
+
+  const root = build(schema);
+  const source = `${functions.join('\n')}\nreturn ${root};`;
+
+  // eslint-disable-next-line no-new-func
+  return new Function('rt', source)(runtime) as Serializer;
+};
@@ -0,0 +1,79 @@
+export interface LruCacheStats {
+  size: number;
+  maxEntries: number;
+  hits: number;
+  misses: number;
+  evictions: number;
+  hitRate: number;
+}
+
+interface LruEntry<V> {
+  value: V;
+  expiresAt: number;
+}
+
+/**
+ * Cache LRU limitado por quantidade de entradas, com expiração por entrada.
+ * A ordem de inserção do Map é a ordem de uso: cada acesso reinsere a chave no fim
+ * e a remoção por capacidade descarta a primeira.
+ */
+export class LruCache<K, V> {
+  private entries = new Map<K, LruEntry<V>>();
+  private hits = 0;
+  private misses = 0;
+  private evictions = 0;
+
+  constructor(private maxEntries: number, private defaultTtlMs: number) {}
+
+  get(key: K): V | undefined {
+    const entry = this.entries.get(key);
+
+    if (!entry || entry.expiresAt <= Date.now()) {
+      if (entry) {
+        this.entries.delete(key);
+      }
+      this.misses++;
+      return undefined;
+    }
+
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    this.hits++;
+    return entry.value;
+  }
+
+  set(key: K, value: V, ttlMs: number = this.defaultTtlMs): void {
+    if (ttlMs <= 0 || this.maxEntries <= 0) {
+      return;
+    }
+
+    this.entries.delete(key);
+    this.entries.set(key, { value, expiresAt: Date.now() + ttlMs });
+
+    while (this.entries.size > this.maxEntries) {
+      this.entries.delete(this.entries.keys().next().value as K);
+      this.evictions++;
+    }
+  }
+
+  delete(key: K): boolean {
+    return this.entries.delete(key);
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+
+  getStats(): LruCacheStats {
+    const lookups = this.hits + this.misses;
+
+    return {
+      size: this.entries.size,
+      maxEntries: this.maxEntries,
+      hits: this.hits,
+      misses: this.misses,
+      evictions: this.evictions,
+      hitRate: lookups > 0 ? Math.round((this.hits / lookups) * 10000) / 10000 : 0,
+    };
+  }
+}
@@ -0,0 +1,47 @@
+/**
+ * Partição mensal (PARTITION BY RANGE em uma coluna timestamp).
+ * Meses e limites calculados em UTC.
+ */
+export interface MonthPartition {
+  name: string;
+  month: Date;
+  // Limites da partição: [from, to)
+  from: string;
+  to: string;
+}
+
+const pad = (value: number) => String(value).padStart(2, '0');
+
+const toBound = (month: Date) => `${month.getUTCFullYear()}-${pad(month.getUTCMonth() + 1)}-01 00:00:00`;
+
+/**
+ * Início do mês de `date`, deslocado em `offsetMonths` meses
+ */
+export const monthStart = (date: Date, offsetMonths = 0): Date =>
+  new Date(Date.UTC(date.getUTCFullYear(), date.getUTCMonth() + offsetMonths, 1));
+
+/**
+ * Partição do mês de `date` (ex: notifications_y2026m10)
+ */
+export const monthPartition = (table: string, date: Date): MonthPartition => {
+  const month = monthStart(date);
+
+  return {
+    name: `${table}_y${month.getUTCFullYear()}m${pad(month.getUTCMonth() + 1)}`,
+    month,
+    from: toBound(month),
+    to: toBound(monthStart(month, 1)),
+  };
+};
+
+/**
+ * Mês de uma partição a partir do nome; null se não seguir o padrão
+ */
+export const parseMonthPartition = (table: string, name: string): Date | null => {
+  const match = new RegExp(`^${table}_y(\\d{4})m(\\d{2})$`).exec(name);
+  return match ? new Date(Date.UTC(Number(match[1]), Number(match[2]) - 1, 1)) : null;
+};
+
+export const createMonthPartitionSql = (table: string, partition: MonthPartition): string =>
+  `CREATE TABLE IF NOT EXISTS "${partition.name}" PARTITION OF "${table}"
+   FOR VALUES FROM ('${partition.from}') TO ('${partition.to}')`;
@@ -1,4 +1,5 @@
 import { Response } from 'express';
+import type { Serializer } from '@/utils/jsonSerializer';
 
 /**
  * Interface para resposta de sucesso
@@ -12,6 +13,8 @@ interface SuccessResponse<T = any> {
     limit?: number;
     total?: number;
     totalPages?: number;
+    nextCursor?: string | null;
+    hasMore?: boolean;
   };
 }
 
@@ -26,15 +29,26 @@ interface ErrorResponse {
 }
 
 /**
- * Envia resposta de sucesso
+ * Envia resposta de sucesso.
+ * Com um serializer compilado (utils/serializers) o corpo é montado sem res.json
  */
 export const sendSuccess = <T = any>(
   res: Response,
   data?: T,
   message?: string,
   statusCode: number = 200,
-  meta?: any
+  meta?: any,
+  serializer?: Serializer
 ): Response => {
+  if (serializer) {
+    let body = '{"success":true';
+    if (message) body += `,"message":${JSON.stringify(message)}`;
+    if (data !== undefined) body += `,"data":${data === null ? 'null' : serializer(data)}`;
+    if (meta) body += `,"meta":${JSON.stringify(meta)}`;
+
+    return res.status(statusCode).type('application/json').send(`${body}}`);
+  }
+
   const response: SuccessResponse<T> = {
     success: true,
   };
@@ -75,9 +89,10 @@ export const sendError = (
 export const sendCreated = <T = any>(
   res: Response,
   data: T,
-  message: string = 'Recurso criado com sucesso'
+  message: string = 'Recurso criado com sucesso',
+  serializer?: Serializer
 ): Response => {
-  return sendSuccess(res, data, message, 201);
+  return sendSuccess(res, data, message, 201, undefined, serializer);
 };
 
 /**
@@ -96,7 +111,8 @@ export const sendPaginated = <T = any>(
   page: number,
   limit: number,
   total: number,
-  message?: string
+  message?: string,
+  serializer?: Serializer
 ): Response => {
   const totalPages = Math.ceil(total / limit);
 
@@ -110,6 +126,31 @@ export const sendPaginated = <T = any>(
       limit,
       total,
       totalPages,
-    }
+    },
+    serializer
   );
 };
+
+/**
+ * Envia resposta paginada por cursor (keyset)
+ */
+export const sendCursorPaginated = <T = any>(
+  res: Response,
+  data: T[],
+  limit: number,
+  nextCursor: string | null,
+  hasMore: boolean,
+  total?: number,
+  message?: string,
+  serializer?: Serializer
+): Response => {
+  const meta: SuccessResponse['meta'] = {
+    limit,
+    nextCursor,
+    hasMore,
+  };
+
+  if (total !== undefined) meta.total = total;
+
+  return sendSuccess(res, data, message, 200, meta, serializer);
+};
@@ -0,0 +1,137 @@
+import { compileSerializer, JsonSchema } from '@/utils/jsonSerializer';
+
+/**
+ * Schemas de resposta derivados dos models, compilados uma vez no carregamento.
+ * Propriedades fora do schema não são enviadas: ao adicionar colunas nos
+ * models, atualize o schema correspondente.
+ */
+const categorySchema: JsonSchema = {
+  type: 'object',
+  properties: {
+    id: { type: 'string' },
+    name: { type: 'string' },
+    type: { type: 'string' },
+    color: { type: 'string' },
+    icon: { type: 'string' },
+    userId: { type: 'string' },
+    createdAt: { type: 'date' },
+    updatedAt: { type: 'date' },
+  },
+};
+
+const transactionSchema: JsonSchema = {
+  type: 'object',
+  properties: {
+    id: { type: 'string' },
+    type: { type: 'string' },
+    // decimal chega do driver como string e é mantido assim
+    amount: { type: 'number' },
+    description: { type: 'string' },
+    date: { type: 'dateOnly' },
+    categoryId: { type: 'string' },
+    userId: { type: 'string' },
+    isRecurring: { type: 'boolean' },
+    recurrenceType: { type: 'string' },
+    recurrenceEndDate: { type: 'date' },
+    nextOccurrence: { type: 'date' },
+    parentTransactionId: { type: 'string' },
+    createdAt: { type: 'date' },
+    updatedAt: { type: 'date' },
+    category: categorySchema,
+  },
+};
+
+const dashboardSchema: JsonSchema = {
+  type: 'object',
+  properties: {
+    summary: {
+      type: 'object',
+      properties: {
+        income: { type: 'number' },
+        expense: { type: 'number' },
+        balance: { type: 'number' },
+        month: { type: 'number' },
+        year: { type: 'number' },
+      },
+    },
+    recentTransactions: { type: 'array', items: transactionSchema },
+    byCategory: {
+      type: 'array',
+      items: {
+        type: 'object',
+        properties: {
+          name: { type: 'string' },
+          type: { type: 'string' },
+          total: { type: 'number' },
+          color: { type: 'string' },
+          icon: { type: 'string' },
+        },
+      },
+    },
+  },
+};
+
+const notificationSchema: JsonSchema = {
+  type: 'object',
+  properties: {
+    id: { type: 'string' },
+    userId: { type: 'string' },
+    title: { type: 'string' },
+    message: { type: 'string' },
+    type: { type: 'string' },
+    category: { type: 'string' },
+    isRead: { type: 'boolean' },
+    relatedId: { type: 'string' },
+    relatedType: { type: 'string' },
+    createdAt: { type: 'date' },
+    updatedAt: { type: 'date' },
+  },
+};
+
+const savingsGoalSchema: JsonSchema = {
+  type: 'object',
+  properties: {
+    id: { type: 'string' },
+    userId: { type: 'string' },
+    targetAmount: { type: 'number' },
+    currentAmount: { type: 'number' },
+    month: { type: 'number' },
+    year: { type: 'number' },
+    description: { type: 'string' },
+    createdAt: { type: 'date' },
+    updatedAt: { type: 'date' },
+  },
+};
+
+export const serializers = {
+  transaction: compileSerializer(transactionSchema),
+  transactionList: compileSerializer({ type: 'array', items: transactionSchema }),
+  category: compileSerializer(categorySchema),
+  categoryList: compileSerializer({ type: 'array', items: categorySchema }),
+  dashboard: compileSerializer(dashboardSchema),
+  notificationList: compileSerializer({
+    type: 'object',
+    properties: {
+      notifications: { type: 'array', items: notificationSchema },
+      unreadCount: { type: 'number' },
+    },
+  }),
+  savingsGoal: compileSerializer(savingsGoalSchema),
+  savingsGoalList: compileSerializer({ type: 'array', items: savingsGoalSchema }),
+  syncChanges: compileSerializer({
+    type: 'object',
+    properties: {
+      full: { type: 'boolean' },
+      cursor: { type: 'string' },
+      transactions: { type: 'array', items: transactionSchema },
+      categories: { type: 'array', items: categorySchema },
+      deleted: {
+        type: 'object',
+        properties: {
+          transactions: { type: 'array', items: { type: 'string' } },
+          categories: { type: 'array', items: { type: 'string' } },
+        },
+      },
+    },
+  }),
+};
@@ -0,0 +1,173 @@
+import { Readable } from 'stream';
+import { StringDecoder } from 'string_decoder';
+import { parse } from 'csv-parse';
+
+/**
+ * Lançamento extraído de um extrato bancário
+ */
+export interface StatementEntry {
+  line: number;
+  date: string | null;
+  description: string;
+  amount: number | null;
+  type?: 'income' | 'expense';
+}
+
+// Nomes de colunas aceitos no CSV (já normalizados: minúsculas e sem acentos)
+const CSV_HEADER_ALIASES: Record<string, string[]> = {
+  date: ['date', 'data', 'data lancamento', 'data do lancamento', 'dt'],
+  description: ['description', 'descricao', 'historico', 'memo', 'lancamento', 'estabelecimento'],
+  amount: ['amount', 'valor', 'value', 'valor (r$)'],
+  type: ['type', 'tipo'],
+};
+
+/**
+ * Normaliza um texto de cabeçalho (minúsculas, sem acentos e espaços extras)
+ */
+const normalizeHeader = (header: string): string => {
+  const normalized = header
+    .normalize('NFD')
+    .replace(/[\u0300-\u036f]/g, '')
+    .trim()
+    .toLowerCase();
+
+  for (const [field, aliases] of Object.entries(CSV_HEADER_ALIASES)) {
+    if (aliases.includes(normalized)) {
+      return field;
+    }
+  }
+
+  return normalized;
+};
+
+/**
+ * Converte valores como "1.234,56", "-50.00" ou "R$ 10,00" em número
+ */
+export const parseAmount = (raw: string | undefined): number | null => {
+  if (!raw) return null;
+
+  let value = raw.trim().replace(/R\$|\s/g, '');
+  if (value.includes(',') && value.lastIndexOf(',') > value.lastIndexOf('.')) {
+    // Formato brasileiro: ponto como milhar e vírgula como decimal
+    value = value.replace(/\./g, '').replace(',', '.');
+  } else {
+    value = value.replace(/,/g, '');
+  }
+
+  const amount = Number(value);
+  return value !== '' && Number.isFinite(amount) ? amount : null;
+};
+
+/**
+ * Converte DD/MM/YYYY, YYYY-MM-DD ou YYYYMMDD[hhmmss...] (OFX) em YYYY-MM-DD
+ */
+export const parseStatementDate = (raw: string | undefined): string | null => {
+  if (!raw) return null;
+  const value = raw.trim();
+
+  let match = value.match(/^(\d{4})-(\d{2})-(\d{2})/);
+  if (match) return `${match[1]}-${match[2]}-${match[3]}`;
+
+  match = value.match(/^(\d{2})\/(\d{2})\/(\d{4})$/);
+  if (match) return `${match[3]}-${match[2]}-${match[1]}`;
+
+  match = value.match(/^(\d{4})(\d{2})(\d{2})/);
+  if (match) return `${match[1]}-${match[2]}-${match[3]}`;
+
+  return null;
+};
+
+/**
+ * Interpreta a coluna de tipo do CSV (receita/despesa, crédito/débito)
+ */
+const parseType = (raw: string | undefined): 'income' | 'expense' | undefined => {
+  const value = (raw || '').trim().toLowerCase();
+  if (['income', 'receita', 'credito', 'crédito', 'credit', 'c'].includes(value)) return 'income';
+  if (['expense', 'despesa', 'debito', 'débito', 'debit', 'd'].includes(value)) return 'expense';
+  return undefined;
+};
+
+/**
+ * Lê um CSV registro a registro (delimitador vírgula ou ponto e vírgula)
+ */
+export async function* parseCsvStatement(input: Readable): AsyncGenerator<StatementEntry> {
+  const parser = input.pipe(
+    parse({
+      bom: true,
+      columns: (headers: string[]) => headers.map(normalizeHeader),
+      delimiter: [';', ','],
+      relax_column_count: true,
+      skip_empty_lines: true,
+      trim: true,
+    })
+  );
+
+  let line = 1;
+  for await (const record of parser) {
+    line++;
+    yield {
+      line,
+      date: parseStatementDate(record.date),
+      description: record.description || '',
+      amount: parseAmount(record.amount),
+      type: parseType(record.type),
+    };
+  }
+}
+
+// Tamanho máximo de um bloco <STMTTRN> antes de considerar o arquivo inválido
+const MAX_OFX_BLOCK_SIZE = 64 * 1024;
+
+/**
+ * Extrai o valor de uma tag OFX (SGML, com ou sem tag de fechamento)
+ */
+const readOfxTag = (block: string, tag: string): string | undefined => {
+  const match = block.match(new RegExp(`<${tag}>([^<\\r\\n]*)`, 'i'));
+  return match ? match[1].trim() : undefined;
+};
+
+/**
+ * Lê um OFX bloco <STMTTRN> a bloco, mantendo em memória apenas o bloco atual
+ */
+export async function* parseOfxStatement(input: Readable): AsyncGenerator<StatementEntry> {
+  let decoder: StringDecoder | null = null;
+  let buffer = '';
+  let line = 0;
+
+  for await (const chunk of input) {
+    if (!decoder) {
+      // Bancos brasileiros costumam exportar OFX em windows-1252
+      const header = chunk.toString('latin1', 0, Math.min(chunk.length, 512));
+      decoder = new StringDecoder(/CHARSET:\s*1252/i.test(header) ? 'latin1' : 'utf8');
+    }
+    buffer += decoder.write(chunk);
+
+    let start = buffer.search(/<STMTTRN>/i);
+    while (start !== -1) {
+      const end = buffer.slice(start).search(/<\/STMTTRN>/i);
+      if (end === -1) break;
+
+      const block = buffer.slice(start, start + end);
+      buffer = buffer.slice(start + end + '</STMTTRN>'.length);
+      line++;
+
+      const amount = parseAmount(readOfxTag(block, 'TRNAMT'));
+      yield {
+        line,
+        date: parseStatementDate(readOfxTag(block, 'DTPOSTED')),
+        description: readOfxTag(block, 'MEMO') || readOfxTag(block, 'NAME') || '',
+        amount,
+        type: parseType(readOfxTag(block, 'TRNTYPE')),
+      };
+
+      start = buffer.search(/<STMTTRN>/i);
+    }
+
+    if (start === -1 && buffer.length > 16) {
+      // Sem bloco aberto: descartar o texto lido, mantendo só uma possível tag parcial
+      buffer = buffer.slice(-16);
+    } else if (buffer.length > MAX_OFX_BLOCK_SIZE) {
+      throw new Error('Arquivo OFX inválido: bloco <STMTTRN> sem fechamento');
+    }
+  }
+}
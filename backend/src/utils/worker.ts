@@ -0,0 +1,14 @@
+import path from 'path';
+import { Worker } from 'worker_threads';
+
+/**
+ * Criar uma worker thread a partir de src/workers/<name>.worker.
+ * Em desenvolvimento (tsx) o worker é carregado a partir do .ts
+ */
+export const createWorker = (name: string): Worker => {
+  const extension = path.extname(__filename);
+
+  return new Worker(path.join(__dirname, '..', 'workers', `${name}.worker${extension}`), {
+    execArgv: extension === '.ts' ? ['--require', 'tsx/cjs'] : [],
+  });
+};
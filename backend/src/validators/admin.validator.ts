@@ -0,0 +1,16 @@
+import Joi from 'joi';
+
+export const broadcastNotificationSchema = Joi.object({
+  title: Joi.string().trim().max(255).required().messages({
+    'string.empty': 'Título e mensagem são obrigatórios',
+    'string.max': 'Título deve ter no máximo 255 caracteres',
+    'any.required': 'Título e mensagem são obrigatórios',
+  }),
+  message: Joi.string().trim().required().messages({
+    'string.empty': 'Título e mensagem são obrigatórios',
+    'any.required': 'Título e mensagem são obrigatórios',
+  }),
+  type: Joi.string().valid('info', 'warning', 'success', 'error').default('info'),
+  category: Joi.string().valid('transaction', 'goal', 'budget', 'premium', 'system').default('system'),
+  onlyPremium: Joi.boolean().default(false),
+});
@@ -0,0 +1,32 @@
+import Joi from 'joi';
+
+const isoDate = /^\d{4}-\d{2}-\d{2}$/;
+
+// YYYY-MM-DD que existe no calendário (2026-02-30 falharia só no cast do PostgreSQL)
+const calendarDate = Joi.string()
+  .pattern(isoDate)
+  .custom((value, helpers) => {
+    const date = new Date(`${value}T00:00:00Z`);
+    if (Number.isNaN(date.getTime()) || date.toISOString().slice(0, 10) !== value) {
+      return helpers.error('string.pattern.base');
+    }
+    return value;
+  });
+
+export const exportTransactionsSchema = Joi.object({
+  format: Joi.string().valid('csv', 'xlsx', 'pdf').default('csv').messages({
+    'any.only': 'Formato deve ser "csv", "xlsx" ou "pdf"',
+  }),
+  startDate: calendarDate.optional().messages({
+    'string.pattern.base': 'Data inicial deve estar no formato YYYY-MM-DD',
+  }),
+  endDate: calendarDate.optional().messages({
+    'string.pattern.base': 'Data final deve estar no formato YYYY-MM-DD',
+  }),
+  type: Joi.string().valid('income', 'expense').optional().messages({
+    'any.only': 'Tipo deve ser "income" ou "expense"',
+  }),
+  categoryId: Joi.string().uuid().optional().messages({
+    'string.guid': 'ID da categoria inválido',
+  }),
+});
@@ -0,0 +1,29 @@
+import Joi from 'joi';
+
+export const importStatementSchema = Joi.object({
+  format: Joi.string().valid('csv', 'ofx').optional().messages({
+    'any.only': 'Formato deve ser "csv" ou "ofx"',
+  }),
+  defaultIncomeCategoryId: Joi.string().uuid().optional().messages({
+    'string.guid': 'ID da categoria de receitas inválido',
+  }),
+  defaultExpenseCategoryId: Joi.string().uuid().optional().messages({
+    'string.guid': 'ID da categoria de despesas inválido',
+  }),
+});
+
+export const createImportRuleSchema = Joi.object({
+  pattern: Joi.string().trim().min(2).max(255).required().messages({
+    'string.empty': 'Padrão é obrigatório',
+    'string.min': 'Padrão deve ter no mínimo 2 caracteres',
+    'string.max': 'Padrão deve ter no máximo 255 caracteres',
+  }),
+  categoryId: Joi.string().uuid().required().messages({
+    'string.empty': 'Categoria é obrigatória',
+    'string.guid': 'ID da categoria inválido',
+  }),
+  type: Joi.string().valid('income', 'expense').optional().messages({
+    'any.only': 'Tipo deve ser "income" ou "expense"',
+  }),
+  priority: Joi.number().integer().min(0).max(1000).default(0),
+});
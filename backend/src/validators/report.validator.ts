@@ -0,0 +1,21 @@
+import Joi from 'joi';
+
+export const chartReportSchema = Joi.object({
+  period: Joi.number().integer().min(1).max(24).default(6).messages({
+    'number.base': 'Período deve ser um número de meses',
+    'number.min': 'Período deve ser de no mínimo 1 mês',
+    'number.max': 'Período deve ser de no máximo 24 meses',
+  }),
+  granularity: Joi.string().valid('day', 'week', 'month').default('month').messages({
+    'any.only': 'Granularidade deve ser "day", "week" ou "month"',
+  }),
+  breakdown: Joi.string().valid('period', 'current_month').default('period').messages({
+    'any.only': 'Breakdown deve ser "period" ou "current_month"',
+  }),
+}).custom((value, helpers) => {
+  // Mantém a série diária em poucas centenas de pontos
+  if (value.granularity === 'day' && value.period > 3) {
+    return helpers.message({ custom: 'Granularidade diária permite no máximo 3 meses' });
+  }
+  return value;
+});
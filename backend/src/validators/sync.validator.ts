@@ -0,0 +1,7 @@
+import Joi from 'joi';
+
+export const syncChangesSchema = Joi.object({
+  since: Joi.string().max(200).optional().messages({
+    'string.max': 'Cursor de sincronização inválido',
+  }),
+});
@@ -37,6 +37,19 @@ export const createTransactionSchema = Joi.object({
   }),
 });
 
+// Limite de linhas por requisição de criação em lote
+export const BULK_TRANSACTIONS_MAX = 10000;
+
+// Cada item é validado individualmente com createTransactionSchema no service
+export const bulkCreateTransactionSchema = Joi.object({
+  transactions: Joi.array().items(Joi.object().unknown(true)).min(1).max(BULK_TRANSACTIONS_MAX).required().messages({
+    'array.base': 'transactions deve ser uma lista',
+    'array.min': 'Envie ao menos uma transação',
+    'array.max': `Envie no máximo ${BULK_TRANSACTIONS_MAX} transações por requisição`,
+    'any.required': 'transactions é obrigatório',
+  }),
+});
+
 export const updateTransactionSchema = Joi.object({
   type: Joi.string().valid('income', 'expense').optional().messages({
     'any.only': 'Tipo deve ser "income" ou "expense"',
@@ -66,4 +79,7 @@ export const filterTransactionsSchema = Joi.object({
   limit: Joi.number().integer().min(1).max(100).default(10),
   sortBy: Joi.string().valid('date', 'amount', 'createdAt').default('date'),
   sortOrder: Joi.string().valid('asc', 'desc').default('desc'),
+  // Paginação por cursor: envie cursor vazio na primeira página e depois o nextCursor recebido
+  cursor: Joi.string().allow('').max(512).optional(),
+  includeTotal: Joi.boolean().default(false),
 });
@@ -0,0 +1,43 @@
+import 'reflect-metadata';
+import fs from 'fs';
+import { finished } from 'stream/promises';
+import { parentPort } from 'worker_threads';
+import { AppDataSource } from '@/config/database';
+import exportService, { ExportFilters } from '@/services/export.service';
+
+/**
+ * Worker de exportação: roda em uma worker thread com seu próprio pool de
+ * conexões, para que a montagem de XLSX/PDF não bloqueie o event loop da API.
+ */
+export interface ExportTask {
+  jobId: string;
+  userId: string;
+  filters: ExportFilters;
+  filePath: string;
+}
+
+export type ExportTaskResult =
+  | { jobId: string; status: 'completed'; size: number }
+  | { jobId: string; status: 'failed'; error: string };
+
+const ready = AppDataSource.initialize();
+
+parentPort!.on('message', async (task: ExportTask) => {
+  try {
+    await ready;
+
+    const output = fs.createWriteStream(task.filePath);
+    await exportService.export(task.userId, task.filters, output);
+    await finished(output);
+
+    const { size } = await fs.promises.stat(task.filePath);
+    parentPort!.postMessage({ jobId: task.jobId, status: 'completed', size } as ExportTaskResult);
+  } catch (error) {
+    await fs.promises.unlink(task.filePath).catch(() => undefined);
+    parentPort!.postMessage({
+      jobId: task.jobId,
+      status: 'failed',
+      error: (error as Error).message,
+    } as ExportTaskResult);
+  }
+});
@@ -0,0 +1,26 @@
+import bcrypt from 'bcryptjs';
+import { parentPort } from 'worker_threads';
+
+/**
+ * Worker de senhas: bcrypt é CPU-bound (~dezenas de ms por operação), então
+ * hash e comparação rodam fora do event loop da API.
+ */
+export type PasswordTask =
+  | { id: number; op: 'hash'; password: string; rounds: number }
+  | { id: number; op: 'compare'; password: string; hash: string };
+
+export type PasswordTaskResult =
+  | { id: number; value: string | boolean }
+  | { id: number; error: string };
+
+parentPort!.on('message', async (task: PasswordTask) => {
+  try {
+    const value = task.op === 'hash'
+      ? await bcrypt.hash(task.password, task.rounds)
+      : await bcrypt.compare(task.password, task.hash);
+
+    parentPort!.postMessage({ id: task.id, value } as PasswordTaskResult);
+  } catch (error) {
+    parentPort!.postMessage({ id: task.id, error: (error as Error).message } as PasswordTaskResult);
+  }
+});
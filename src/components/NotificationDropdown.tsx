@@ -31,12 +31,40 @@ const NotificationDropdown = () => {
     }
   }, [isOpen])
 
-  // Carregar contador ao montar
+  // Contador e novas notificações em tempo real (substitui o polling)
   useEffect(() => {
-    loadUnreadCount()
-    // Atualizar contador a cada 30 segundos
-    const interval = setInterval(loadUnreadCount, 30000)
-    return () => clearInterval(interval)
+    return notificationService.subscribe((event) => {
+      if (event.type === 'unread') {
+        setUnreadCount(event.count)
+        return
+      }
+
+      const { action, id, notification, unreadDelta } = event
+      setUnreadCount(prev => Math.max(0, prev + unreadDelta))
+
+      // Mantém a lista em dia também com ações feitas em outras abas
+      switch (action) {
+        case 'created':
+          if (notification) {
+            setNotifications(prev =>
+              prev.some(n => n.id === notification.id) ? prev : [notification, ...prev].slice(0, 20)
+            )
+          }
+          break
+        case 'read':
+          setNotifications(prev => prev.map(n => (n.id === id ? { ...n, isRead: true } : n)))
+          break
+        case 'read-all':
+          setNotifications(prev => prev.map(n => ({ ...n, isRead: true })))
+          break
+        case 'deleted':
+          setNotifications(prev => prev.filter(n => n.id !== id))
+          break
+        case 'deleted-read':
+          setNotifications(prev => prev.filter(n => !n.isRead))
+          break
+      }
+    })
   }, [])
 
   const loadNotifications = async () => {
@@ -52,22 +80,12 @@ const NotificationDropdown = () => {
     }
   }
 
-  const loadUnreadCount = async () => {
-    try {
-      const count = await notificationService.getUnreadCount()
-      setUnreadCount(count)
-    } catch (error) {
-      console.error('Erro ao carregar contador:', error)
-    }
-  }
-
   const handleMarkAsRead = async (id: string) => {
     try {
       await notificationService.markAsRead(id)
       setNotifications(prev =>
         prev.map(n => (n.id === id ? { ...n, isRead: true } : n))
       )
-      setUnreadCount(prev => Math.max(0, prev - 1))
     } catch (error) {
       toast.error('Erro ao marcar como lida')
     }
@@ -77,7 +95,6 @@ const NotificationDropdown = () => {
     try {
       await notificationService.markAllAsRead()
       setNotifications(prev => prev.map(n => ({ ...n, isRead: true })))
-      setUnreadCount(0)
       toast.success('Todas marcadas como lidas')
     } catch (error) {
       toast.error('Erro ao marcar todas como lidas')
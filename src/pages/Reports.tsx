@@ -1,4 +1,4 @@
-import { useMemo, useState } from 'react'
+import { useEffect, useMemo, useState } from 'react'
 import { useFinancialStore } from '@/store/financialStore'
 import { useAuthStore } from '@/store/authStore'
 import {
@@ -16,11 +16,12 @@ import {
   ResponsiveContainer,
   ComposedChart,
 } from 'recharts'
-import { format, startOfMonth, endOfMonth, subMonths, eachMonthOfInterval } from 'date-fns'
+import { format, parseISO, subMonths } from 'date-fns'
 import { ptBR } from 'date-fns/locale'
 import { TrendingUp, TrendingDown, DollarSign, FileText, FileSpreadsheet, FileDown } from 'lucide-react'
 import PageTransition from '@/components/common/PageTransition'
 import { exportService } from '@/services/exportService'
+import reportService, { ChartReport } from '@/services/report.service'
 import { toast } from 'react-hot-toast'
 
 const Reports = () => {
@@ -29,167 +30,107 @@ const Reports = () => {
   const [period, setPeriod] = useState<'3' | '6' | '12'>('6')
   const [isExporting, setIsExporting] = useState(false)
 
+  const [chartReport, setChartReport] = useState<ChartReport | null>(null)
+
+  // Séries agregadas no backend: o front recebe apenas os pontos que plota
+  useEffect(() => {
+    let cancelled = false
+
+    reportService
+      .getChart({ period: parseInt(period), granularity: 'month', breakdown: 'current_month' })
+      .then((report) => {
+        if (!cancelled) setChartReport(report)
+      })
+      .catch((error) => console.error('Erro ao carregar relatório:', error))
+
+    return () => {
+      cancelled = true
+    }
+  }, [period, transactions])
+
   // Dados para gráfico de evolução mensal
   const monthlyEvolution = useMemo(() => {
-    const months = parseInt(period)
-    const startDate = subMonths(new Date(), months - 1)
-    const endDate = new Date()
-    
-    const monthsArray = eachMonthOfInterval({ start: startDate, end: endDate })
-    
-    return monthsArray.map((month) => {
-      const monthStart = startOfMonth(month)
-      const monthEnd = endOfMonth(month)
-      
-      const monthTransactions = transactions.filter((t) => {
-        const tDate = new Date(t.date)
-        return tDate >= monthStart && tDate <= monthEnd
-      })
-      
-      const income = monthTransactions
-        .filter((t) => t.type === 'income')
-        .reduce((sum, t) => sum + t.amount, 0)
-      
-      const expense = monthTransactions
-        .filter((t) => t.type === 'expense')
-        .reduce((sum, t) => sum + t.amount, 0)
-      
+    if (!chartReport) return []
+
+    return chartReport.income_trends.map((point, index) => {
+      const expense = chartReport.expense_trends[index]?.total ?? 0
+
       return {
-        month: format(month, 'MMM/yy', { locale: ptBR }),
-        receitas: income,
+        month: format(parseISO(point.period), 'MMM/yy', { locale: ptBR }),
+        receitas: point.total,
         despesas: expense,
-        saldo: income - expense,
+        saldo: point.total - expense,
       }
     })
-  }, [transactions, period])
+  }, [chartReport])
 
-  // Atualizar dados de categorias para incluir receitas e despesas DO MES ATUAL
+  // Receitas e despesas por categoria DO MES ATUAL
   const categoryData = useMemo(() => {
-    const now = new Date()
-    const monthStart = startOfMonth(now)
-    const monthEnd = endOfMonth(now)
+    const breakdown = chartReport?.category_breakdown ?? []
 
-    // Filtrar apenas transações do mês atual
-    const monthTransactions = transactions.filter((t) => {
-      const tDate = new Date(t.date)
-      return tDate >= monthStart && tDate <= monthEnd
-    })
+    const expensesByCategory = breakdown
+      .filter((item) => item.type === 'expense' && item.total > 0)
+      .map((item) => ({
+        name: item.name,
+        despesas: item.total,
+        receitas: 0,
+        color: item.color,
+        type: 'expense' as const,
+      }))
+
+    const incomeByCategory = breakdown
+      .filter((item) => item.type === 'income' && item.total > 0)
+      .map((item) => ({
+        name: item.name,
+        receitas: item.total,
+        despesas: 0,
+        color: item.color,
+        type: 'income' as const,
+      }))
 
-    // Despesas por categoria (apenas do mês atual)
-    const expensesByCategory = categories
-      .filter((cat) => cat.type === 'expense')
-      .map((cat) => {
-        const total = monthTransactions
-          .filter((t) => t.categoryId === cat.id && t.type === 'expense')
-          .reduce((sum, t) => sum + t.amount, 0)
-        
-        return {
-          name: cat.name,
-          despesas: total,
-          receitas: 0,
-          color: cat.color,
-          type: 'expense' as const,
-        }
-      })
-      .filter((item) => item.despesas > 0)
-    
-    // Receitas por categoria (apenas do mês atual)
-    const incomeByCategory = categories
-      .filter((cat) => cat.type === 'income')
-      .map((cat) => {
-        const total = monthTransactions
-          .filter((t) => t.categoryId === cat.id && t.type === 'income')
-          .reduce((sum, t) => sum + t.amount, 0)
-        
-        return {
-          name: cat.name,
-          receitas: total,
-          despesas: 0,
-          color: cat.color,
-          type: 'income' as const,
-        }
-      })
-      .filter((item) => item.receitas > 0)
-    
     return {
-      expenses: expensesByCategory.sort((a, b) => b.despesas - a.despesas),
-      income: incomeByCategory.sort((a, b) => b.receitas - a.receitas),
+      expenses: expensesByCategory,
+      income: incomeByCategory,
       combined: [...expensesByCategory, ...incomeByCategory].sort((a, b) => 
         (b.receitas + b.despesas) - (a.receitas + a.despesas)
       ),
     }
-  }, [transactions, categories])
+  }, [chartReport])
 
   // Dados para comparação lado a lado de receitas e despesas por categoria (MES ATUAL)
   const categoryComparison = useMemo(() => {
-    const now = new Date()
-    const monthStart = startOfMonth(now)
-    const monthEnd = endOfMonth(now)
-
-    // Filtrar apenas transações do mês atual
-    const monthTransactions = transactions.filter((t) => {
-      const tDate = new Date(t.date)
-      return tDate >= monthStart && tDate <= monthEnd
-    })
+    const byName = new Map<string, { category: string; receitas: number; despesas: number; total: number }>()
 
-    const allCategories = new Set([
-      ...categories.filter(c => c.type === 'expense').map(c => c.name),
-      ...categories.filter(c => c.type === 'income').map(c => c.name),
-    ])
-    
-    return Array.from(allCategories).map(catName => {
-      const expenseCat = categories.find(c => c.name === catName && c.type === 'expense')
-      const incomeCat = categories.find(c => c.name === catName && c.type === 'income')
-      
-      const expenses = expenseCat 
-        ? monthTransactions
-            .filter(t => t.categoryId === expenseCat.id && t.type === 'expense')
-            .reduce((sum, t) => sum + t.amount, 0)
-        : 0
-      
-      const income = incomeCat
-        ? monthTransactions
-            .filter(t => t.categoryId === incomeCat.id && t.type === 'income')
-            .reduce((sum, t) => sum + t.amount, 0)
-        : 0
-      
-      return {
-        category: catName,
-        receitas: income,
-        despesas: expenses,
-        total: income + expenses,
+    for (const item of chartReport?.category_breakdown ?? []) {
+      const entry = byName.get(item.name) || { category: item.name, receitas: 0, despesas: 0, total: 0 }
+      if (item.type === 'income') {
+        entry.receitas += item.total
+      } else {
+        entry.despesas += item.total
       }
-    }).filter(item => item.total > 0)
+      entry.total += item.total
+      byName.set(item.name, entry)
+    }
+
+    return Array.from(byName.values())
+      .filter(item => item.total > 0)
       .sort((a, b) => b.total - a.total)
       .slice(0, 10) // Top 10 categorias
-  }, [transactions, categories])
+  }, [chartReport])
 
-  // Dados para comparação mensal
+  // Dados para comparação mensal (dois últimos pontos da série mensal)
   const monthlyComparison = useMemo(() => {
-    const currentMonth = new Date()
-    const lastMonth = subMonths(currentMonth, 1)
-    
-    const getCurrentMonthData = (date: Date) => {
-      const monthStart = startOfMonth(date)
-      const monthEnd = endOfMonth(date)
-      
-      const monthTransactions = transactions.filter((t) => {
-        const tDate = new Date(t.date)
-        return tDate >= monthStart && tDate <= monthEnd
-      })
-      
-      return {
-        income: monthTransactions
-          .filter((t) => t.type === 'income')
-          .reduce((sum, t) => sum + t.amount, 0),
-        expense: monthTransactions
-          .filter((t) => t.type === 'expense')
-          .reduce((sum, t) => sum + t.amount, 0),
-      }
+    const incomeTrends = chartReport?.income_trends ?? []
+    const expenseTrends = chartReport?.expense_trends ?? []
+
+    const current = {
+      income: incomeTrends[incomeTrends.length - 1]?.total ?? 0,
+      expense: expenseTrends[expenseTrends.length - 1]?.total ?? 0,
+    }
+    const last = {
+      income: incomeTrends[incomeTrends.length - 2]?.total ?? 0,
+      expense: expenseTrends[expenseTrends.length - 2]?.total ?? 0,
     }
-    
-    const current = getCurrentMonthData(currentMonth)
-    const last = getCurrentMonthData(lastMonth)
     
     return {
       income: {
@@ -210,7 +151,7 @@ const Reports = () => {
           : 0,
       },
     }
-  }, [transactions])
+  }, [chartReport])
 
   const formatCurrency = (value: number) => {
     return new Intl.NumberFormat('pt-BR', {
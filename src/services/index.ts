@@ -4,6 +4,7 @@ export { default as userService } from './user.service';
 export { default as categoryService } from './category.service';
 export { default as transactionService } from './transaction.service';
 export { default as dashboardService } from './dashboard.service';
+export { default as reportService } from './report.service';
 
 // Exportar tipos
 export type { LoginCredentials, RegisterData, AuthResponse } from './auth.service';
@@ -11,3 +12,4 @@ export type { User, UpdateProfileData, ChangePasswordData } from './user.service
 export type { Category, CreateCategoryData } from './category.service';
 export type { Transaction, CreateTransactionData, TransactionFilters } from './transaction.service';
 export type { DashboardData, DashboardSummary, CategorySummary } from './dashboard.service';
+export type { ChartReport, TrendPoint, BalancePoint, CategoryBreakdownItem } from './report.service';
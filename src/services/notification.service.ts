@@ -1,4 +1,4 @@
-import api from '@/config/api';
+import api, { API_URL } from '@/config/api';
 
 export interface Notification {
   id: string;
@@ -19,6 +19,28 @@ export interface NotificationListResponse {
   unreadCount: number;
 }
 
+export type NotificationStreamEvent =
+  | { type: 'unread'; count: number }
+  | {
+      type: 'notification';
+      action: 'created' | 'read' | 'read-all' | 'deleted' | 'deleted-read';
+      // Somado ao contador de não lidas
+      unreadDelta: number;
+      id?: string;
+      notification?: Notification;
+    };
+
+const STREAM_MAX_RETRY_MS = 30000;
+
+const getAccessToken = (): string | null => {
+  try {
+    const authStorage = localStorage.getItem('auth-storage');
+    return authStorage ? JSON.parse(authStorage).state?.accessToken ?? null : null;
+  } catch {
+    return null;
+  }
+};
+
 class NotificationService {
   /**
    * Buscar todas as notificações
@@ -38,6 +60,67 @@ class NotificationService {
     return response.data.data.count;
   }
 
+  /**
+   * Receber o contador e as novas notificações em tempo real (SSE).
+   * Usa fetch porque o EventSource não envia o header Authorization;
+   * reconecta sozinho e recebe o contador completo a cada conexão.
+   * Retorna a função que encerra o stream.
+   */
+  subscribe(onEvent: (event: NotificationStreamEvent) => void): () => void {
+    const controller = new AbortController();
+
+    const connect = async () => {
+      let retryMs = 1000;
+
+      while (!controller.signal.aborted) {
+        try {
+          const response = await fetch(`${API_URL}/notifications/stream`, {
+            headers: { Accept: 'text/event-stream', Authorization: `Bearer ${getAccessToken()}` },
+            signal: controller.signal,
+          });
+          if (!response.ok || !response.body) {
+            throw new Error(`HTTP ${response.status}`);
+          }
+
+          retryMs = 1000;
+          const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+          let buffer = '';
+
+          for (;;) {
+            const { value, done } = await reader.read();
+            if (done) {
+              break;
+            }
+
+            buffer += value;
+            let boundary = buffer.indexOf('\n\n');
+            while (boundary !== -1) {
+              const lines = buffer.slice(0, boundary).split('\n');
+              buffer = buffer.slice(boundary + 2);
+              boundary = buffer.indexOf('\n\n');
+
+              const type = lines.find((line) => line.startsWith('event: '))?.slice(7);
+              const data = lines.find((line) => line.startsWith('data: '))?.slice(6);
+              if (type && data) {
+                onEvent({ type, ...JSON.parse(data) } as NotificationStreamEvent);
+              }
+            }
+          }
+        } catch (error) {
+          if (controller.signal.aborted) {
+            return;
+          }
+        }
+
+        await new Promise((resolve) => setTimeout(resolve, retryMs));
+        retryMs = Math.min(retryMs * 2, STREAM_MAX_RETRY_MS);
+      }
+    };
+
+    connect();
+    return () => controller.abort();
+  }
+
   /**
    * Marcar notificação como lida
    */
@@ -0,0 +1,50 @@
+import api from '@/config/api';
+
+export type ReportGranularity = 'day' | 'week' | 'month';
+
+export interface TrendPoint {
+  period: string;
+  total: number;
+  cumulative: number;
+}
+
+export interface BalancePoint {
+  period: string;
+  balance: number;
+  cumulative: number;
+}
+
+export interface CategoryBreakdownItem {
+  categoryId: string;
+  name: string;
+  type: 'income' | 'expense';
+  color: string;
+  icon: string;
+  total: number;
+  percentage: number;
+}
+
+export interface ChartReport {
+  startDate: string;
+  endDate: string;
+  granularity: ReportGranularity;
+  income_trends: TrendPoint[];
+  expense_trends: TrendPoint[];
+  balance_trends: BalancePoint[];
+  category_breakdown: CategoryBreakdownItem[];
+}
+
+export interface ChartReportParams {
+  period?: number;
+  granularity?: ReportGranularity;
+  breakdown?: 'period' | 'current_month';
+}
+
+class ReportService {
+  async getChart(params: ChartReportParams = {}): Promise<ChartReport> {
+    const response = await api.get('/reports/chart', { params });
+    return response.data.data;
+  }
+}
+
+export default new ReportService();
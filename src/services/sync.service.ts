@@ -0,0 +1,25 @@
+import api from '@/config/api';
+import type { Transaction } from './transaction.service';
+import type { Category } from './category.service';
+
+export interface SyncChanges {
+  // true: lista completa; o estado local deve ser substituído
+  full: boolean;
+  cursor: string;
+  transactions: Transaction[];
+  categories: Category[];
+  deleted: {
+    transactions: string[];
+    categories: string[];
+  };
+}
+
+class SyncService {
+  async getChanges(since?: string | null): Promise<SyncChanges> {
+    const params = since ? { since } : {};
+    const response = await api.get('/sync/changes', { params });
+    return response.data.data;
+  }
+}
+
+export default new SyncService();
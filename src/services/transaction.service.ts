@@ -46,6 +46,19 @@ export interface TransactionFilters {
   sortOrder?: 'asc' | 'desc';
 }
 
+export interface BulkCreateResult {
+  created: number;
+  // Linhas ignoradas por já existirem (data, valor, descrição) ou repetidas no lote
+  duplicates: number;
+  failed: number;
+  results: {
+    index: number;
+    status: 'created' | 'invalid' | 'duplicate';
+    id?: string;
+    errors?: { field: string; message: string }[];
+  }[];
+}
+
 export interface TransactionListResponse {
   transactions: Transaction[];
   total: number;
@@ -108,6 +121,11 @@ class TransactionService {
     return result.data;
   }
 
+  async createBulk(transactions: CreateTransactionData[]): Promise<BulkCreateResult> {
+    const response = await api.post('/transactions/bulk', { transactions });
+    return response.data.data;
+  }
+
   async update(id: string, data: Partial<CreateTransactionData>): Promise<Transaction> {
     const response = await api.put(`/transactions/${id}`, data);
     return response.data.data;
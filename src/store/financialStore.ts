@@ -4,11 +4,14 @@ import { Transaction, Category, FilterOptions } from '@/types'
 import toast from 'react-hot-toast'
 import transactionService from '@/services/transaction.service'
 import categoryService from '@/services/category.service'
+import syncService from '@/services/sync.service'
 
 interface FinancialState {
   transactions: Transaction[]
   categories: Category[]
   currentUserId: string | null
+  // Cursor da última sincronização incremental (null = próxima sincronização é completa)
+  syncCursor: string | null
   isLoading: boolean
   addTransaction: (transaction: Omit<Transaction, 'id' | 'createdAt'>) => Promise<void>
   updateTransaction: (id: string, transaction: Partial<Transaction>) => Promise<void>
@@ -32,6 +35,7 @@ export const useFinancialStore = create<FinancialState>()(
       transactions: [],
       categories: [],
       currentUserId: null,
+      syncCursor: null,
       isLoading: false,
 
 
@@ -251,6 +255,7 @@ export const useFinancialStore = create<FinancialState>()(
             transactions: [],
             categories: [],
             currentUserId: userId,
+            syncCursor: null,
           })
         } else {
           set({ currentUserId: userId })
@@ -262,6 +267,7 @@ export const useFinancialStore = create<FinancialState>()(
           transactions: [],
           categories: [],
           currentUserId: null,
+          syncCursor: null,
         })
       },
 
@@ -301,11 +307,65 @@ export const useFinancialStore = create<FinancialState>()(
       },
 
       syncWithBackend: async () => {
-        const { fetchTransactions, fetchCategories } = get()
-        await Promise.all([
-          fetchTransactions(),
-          fetchCategories(),
-        ])
+        try {
+          const changes = await syncService.getChanges(get().syncCursor)
+
+          set((state) => {
+            // Converter transações do backend para o formato do store
+            const toStoreTransaction = (t: any) => ({
+              ...t,
+              amount: Number(t.amount),
+              category: t.category?.name || '',
+            })
+
+            if (changes.full) {
+              return {
+                transactions: changes.transactions.map(toStoreTransaction) as any,
+                categories: changes.categories,
+                syncCursor: changes.cursor,
+              }
+            }
+
+            // Aplicar apenas os deltas: exclusões, depois inclusões/alterações por id
+            const categoriesById = new Map(state.categories.map((c) => [c.id, c]))
+            changes.deleted.categories.forEach((id) => categoriesById.delete(id))
+            changes.categories.forEach((c) => categoriesById.set(c.id, c))
+
+            const transactionsById = new Map(state.transactions.map((t) => [t.id, t]))
+            changes.deleted.transactions.forEach((id) => transactionsById.delete(id))
+            changes.transactions.forEach((t) => transactionsById.set(t.id, toStoreTransaction(t)))
+
+            // Categorias renomeadas: atualizar o nome guardado nas transações
+            if (changes.categories.length > 0) {
+              const renamed = new Map(changes.categories.map((c) => [c.id, c.name]))
+              transactionsById.forEach((t, id) => {
+                const name = renamed.get(t.categoryId)
+                if (name !== undefined && name !== t.category) {
+                  transactionsById.set(id, { ...t, category: name })
+                }
+              })
+            }
+
+            return {
+              transactions: [...transactionsById.values()].sort((a, b) =>
+                a.date === b.date
+                  ? String(b.createdAt).localeCompare(String(a.createdAt))
+                  : String(b.date).localeCompare(String(a.date))
+              ),
+              categories: [...categoriesById.values()].sort((a, b) => a.name.localeCompare(b.name)),
+              syncCursor: changes.cursor,
+            }
+          })
+        } catch (error) {
+          console.error('❌ Erro na sincronização incremental:', error)
+          // Cursor inválido ou erro de rede: voltar à busca completa
+          set({ syncCursor: null })
+          const { fetchTransactions, fetchCategories } = get()
+          await Promise.all([
+            fetchTransactions(),
+            fetchCategories(),
+          ])
+        }
       },
     }),
     {
@@ -327,6 +387,7 @@ export const useFinancialStore = create<FinancialState>()(
                   transactions: [],
                   categories: [],
                   currentUserId: null,
+                  syncCursor: null,
                 },
               }
             }
@@ -345,6 +406,7 @@ export const useFinancialStore = create<FinancialState>()(
                 transactions: [],
                 categories: [],
                 currentUserId: userId,
+                syncCursor: null,
               },
             }
           } catch (error) {